@@ -1,13 +1,11 @@
 import streamlit as st
 
-from ui.coupang_bulk import render_coupang_bulk
-from ui.coupang_cj import render_coupang_cj
-from ui.naver_cj import render_naver_cj
-from ui.naver_bulk import render_naver_bulk
-from ui.settings import render_settings
 from ui.login import render_login
 from utils.auth import is_authenticated, logout
 
+# 작업 페이지(ui.coupang_*, ui.naver_*, ui.settings)는 pandas/pyarrow/openai 등을 불러오므로
+# 실제로 화면에 표시할 때 import (로그인/첫 화면을 먼저 띄우기 위함)
+
 
 st.set_page_config(page_title="송장 자동화", page_icon="📦", layout="wide")
 
@@ -247,18 +245,12 @@ def init_session_state():
         "step": "landing",
         "job": None,
         "channel": None,
-        "coupang_cj_result": None,
-        "coupang_bulk_result": None,
-        "naver_bulk_result": None,
-        "last_uploaded_name": None,
-        "last_bulk_names": (None, None),
-        "last_naver_bulk_names": (None, None),
+        "last_uploaded_name": (),
+        "last_bulk_names": ((), ()),
+        "last_naver_bulk_names": ((), ()),
         "show_settings": False,
         "chat_history": [],
-        "naver_cj_result": None,
         "last_naver_uploaded_name": None,
-        "naver_intermediate_table": None,
-        "naver_raw_data": None,
         "naver_workflow_step": "upload",
         "authenticated": False,
     }
@@ -356,12 +348,20 @@ def render_main():
         )
 
         if st.session_state.job == "cj" and st.session_state.channel == "coupang":
+            from ui.coupang_cj import render_coupang_cj
+
             render_coupang_cj()
         elif st.session_state.job == "cj" and st.session_state.channel == "naver":
+            from ui.naver_cj import render_naver_cj
+
             render_naver_cj()
         elif st.session_state.job == "bulk" and st.session_state.channel == "coupang":
+            from ui.coupang_bulk import render_coupang_bulk
+
             render_coupang_bulk()
         elif st.session_state.job == "bulk" and st.session_state.channel == "naver":
+            from ui.naver_bulk import render_naver_bulk
+
             render_naver_bulk()
         else:
             st.info("이 채널/작업 조합에 대한 폼이 아직 준비되지 않았습니다.")
@@ -380,6 +380,8 @@ def main():
     render_header()
 
     if st.session_state.show_settings:
+        from ui.settings import render_settings
+
         render_settings()
     else:
         render_main()
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+대량등록 주문번호 매칭 벤치마크 (DataFrame.merge + drop_duplicates vs 해시 인덱스 매칭) 및 결과 일치 검사
+최대 메모리는 입력 DataFrame을 제외하고 빌더 안에서 새로 할당한 양 (tracemalloc)
+커밋 간 비교용 최대 메모리(peak_mb)는 bench_pipeline.py 결과 JSON의 build_coupang_bulk/build_naver_bulk 단계에 저장됩니다.
+사용법:
+  python benchmarks/bench_bulk_join.py            # 기본 300,000행 (성수기 시즌 export 기준)
+  python benchmarks/bench_bulk_join.py 50000      # 행 수 지정
+"""
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.coupang_processor import (  # noqa: E402
+    COUPANG_BULK_RAW_COLUMNS,
+    build_coupang_bulk,
+    clean_columns,
+    get_coupang_bulk_columns,
+)
+from utils.naver_processor import build_naver_bulk, get_naver_bulk_columns  # noqa: E402
+from utils.naver_processor import clean_columns as naver_clean_columns  # noqa: E402
+from utils.order_utils import normalize_order_numbers  # noqa: E402
+
+
+def _build_coupang_bulk_reference(raw_df: pd.DataFrame, cj_df: pd.DataFrame) -> pd.DataFrame:
+    """기존 merge 기반 구현 (결과 비교 기준)"""
+    raw_df = clean_columns(raw_df)
+    cj_df = clean_columns(cj_df)
+
+    raw_df = raw_df.copy()
+    cj_df = cj_df.copy()
+
+    raw_df["__key"] = normalize_order_numbers(raw_df["주문번호"], remove_whitespace=False)
+    key_col = "고객주문번호" if "고객주문번호" in cj_df.columns else "주문번호"
+    cj_df["__key"] = normalize_order_numbers(cj_df[key_col], remove_whitespace=False)
+
+    merged = raw_df.merge(
+        cj_df[["__key", "운송장번호", "집화예정일자"]],
+        on="__key",
+        how="left",
+        suffixes=("", "_cj"),
+    )
+
+    if "운송장번호_cj" in merged:
+        merged["__운송장번호"] = merged["운송장번호_cj"].fillna(merged.get("운송장번호"))
+    else:
+        merged["__운송장번호"] = merged.get("운송장번호")
+    merged["__운송장번호"] = normalize_order_numbers(merged["__운송장번호"], remove_whitespace=False)
+
+    def pick(col, default=""):
+        return merged[col] if col in merged.columns else default
+
+    output_cols = get_coupang_bulk_columns()
+
+    data = {
+        "번호": pick("번호"),
+        "묶음배송번호": pick("묶음배송번호"),
+        "주문번호": normalize_order_numbers(pick("주문번호"), remove_whitespace=False),
+        "택배사": "CJ 대한통운",
+        "운송장번호": merged["__운송장번호"],
+        "분리배송 Y/N": pick("분리배송 Y/N"),
+        "분리배송 출고예정일": pick("분리배송 출고예정일"),
+        "주문시 출고예정일": pick("주문시 출고예정일"),
+        "출고일(발송일)": pick("집화예정일자"),
+        "주문일": pick("주문일"),
+        "등록상품명": pick("등록상품명"),
+        "등록옵션명": pick("등록옵션명"),
+        "노출상품명(옵션명)": pick("노출상품명(옵션명)"),
+        "노출상품ID": pick("노출상품ID"),
+        "옵션ID": pick("옵션ID"),
+        "최초등록옵션명": pick("최초등록옵션명") if "최초등록옵션명" in merged else pick("최초등록등록상품명/옵션명"),
+        "업체상품코드": pick("업체상품코드"),
+        "바코드": pick("바코드"),
+        "결제액": pick("결제액"),
+        "배송비구분": pick("배송비구분"),
+        "배송비": pick("배송비"),
+        "도서산간 추가배송비": pick("도서산간 추가배송비"),
+        "구매수(수량)": pick("구매수(수량)"),
+        "옵션판매가(판매단가)": pick("옵션판매가(판매단가)"),
+        "구매자": pick("구매자"),
+        "구매자전화번호": pick("구매자전화번호"),
+        "수취인이름": pick("수취인이름"),
+        "수취인전화번호": pick("수취인전화번호"),
+        "우편번호": pick("우편번호"),
+        "수취인 주소": pick("수취인 주소"),
+        "배송메세지": pick("배송메세지"),
+        "상품별 추가메시지": pick("상품별 추가메시지"),
+        "주문자 추가메시지": pick("주문자 추가메시지"),
+        "배송완료일": pick("배송완료일"),
+        "구매확정일자": pick("구매확정일자"),
+        "개인통관번호(PCCC)": pick("개인통관번호(PCCC)"),
+        "통관용구매자전화번호": pick("통관용수취인전화번호") if "통관용수취인전화번호" in merged else pick("통관용구매자전화번호"),
+        "기타": pick("기타"),
+        "결제위치": pick("결제위치"),
+    }
+
+    output = pd.DataFrame(data)
+    output = output[output_cols]
+
+    # 주문번호 중복 제거 (첫 번째 행만 유지)
+    output = output.drop_duplicates(subset=['주문번호'], keep='first')
+
+    return output
+
+
+def _build_naver_bulk_reference(raw_df: pd.DataFrame, cj_df: pd.DataFrame) -> pd.DataFrame:
+    """기존 merge 기반 구현 (결과 비교 기준, 디버그 정보 제외)"""
+    raw_df = naver_clean_columns(raw_df).copy()
+    cj_df = naver_clean_columns(cj_df).copy()
+
+    raw_df["__key"] = normalize_order_numbers(raw_df["상품주문번호"])
+    key_col = "고객주문번호" if "고객주문번호" in cj_df.columns else "주문번호"
+    cj_df["__key"] = normalize_order_numbers(cj_df[key_col])
+
+    merge_cols = ["__key"]
+    if "운송장번호" in cj_df.columns:
+        merge_cols.append("운송장번호")
+
+    merged = raw_df.merge(
+        cj_df[merge_cols],
+        on="__key",
+        how="left",
+        suffixes=("", "_cj"),
+    )
+
+    if "운송장번호_cj" in merged:
+        merged["__송장"] = merged["운송장번호_cj"]
+    elif "운송장번호" in merged:
+        merged["__송장"] = merged["운송장번호"]
+    elif "송장번호" in merged:
+        merged["__송장"] = merged["송장번호"]
+    else:
+        merged["__송장"] = ""
+    merged["__송장"] = normalize_order_numbers(merged["__송장"])
+
+    def pick(col, default=""):
+        if col not in merged.columns:
+            return default
+        col_data = merged[col].fillna("")
+        if col_data.astype(str).str.strip().eq("").all():
+            return default
+        return merged[col]
+
+    data = {
+        "상품주문번호": merged["__key"],
+        "배송방법": pick("배송방법", "택배"),
+        "택배사": "CJ 대한통운",
+        "송장번호": merged["__송장"],
+    }
+    output = pd.DataFrame(data)[get_naver_bulk_columns()]
+    return output.drop_duplicates(subset=["상품주문번호"], keep="first")
+
+
+def make_coupang_files(rows: int, seed: int = 42) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    쿠팡 로우데이터(약 40컬럼)와 파일접수 상세내역을 만듭니다.
+    주문 하나에 상품이 여러 개인 경우(주문번호 중복), 접수 누락, 접수 중복을 포함합니다.
+    """
+    rng = np.random.default_rng(seed)
+    orders = rng.integers(10**11, 9 * 10**11, rows // 2 + 1)
+    order_numbers = orders[rng.integers(0, len(orders), rows)]
+    raw = {col: [f"{col}{i % 50}" for i in range(rows)] for col in COUPANG_BULK_RAW_COLUMNS}
+    raw["번호"] = np.arange(1, rows + 1)
+    raw["주문번호"] = order_numbers
+    raw["운송장번호"] = np.where(rng.random(rows) < 0.05, rng.integers(10**11, 9 * 10**11, rows), np.nan)
+    raw_df = pd.DataFrame(raw).drop(columns=["최초등록등록상품명/옵션명", "통관용구매자전화번호"])
+
+    received = pd.unique(order_numbers)
+    received = received[rng.random(len(received)) < 0.9]
+    received = np.concatenate([received, received[: len(received) // 50]])
+    cj_df = pd.DataFrame(
+        {
+            "고객주문번호": [f"{n}.0" if i % 7 == 0 else str(n) for i, n in enumerate(received)],
+            "운송장번호": rng.integers(10**11, 9 * 10**11, len(received)).astype("float64"),
+            "집화예정일자": "2025-10-01",
+        }
+    )
+    cj_df.loc[cj_df.index[::31], "운송장번호"] = np.nan
+    return raw_df, cj_df
+
+
+def make_naver_files(rows: int, seed: int = 42) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """네이버 로우데이터와 파일접수 상세내역을 만듭니다. (상품주문번호 중복, 접수 누락/중복 포함)"""
+    rng = np.random.default_rng(seed)
+    keys = rng.integers(10**15, 9 * 10**15, rows)
+    keys[1::25] = keys[::25][: len(keys[1::25])]
+    raw_df = pd.DataFrame(
+        {
+            "상품주문번호": keys,
+            "배송방법": np.where(rng.random(rows) < 0.5, "택배,등기,소포", ""),
+            "송장번호": np.nan,
+        }
+    )
+    received = pd.unique(keys)
+    received = received[rng.random(len(received)) < 0.9]
+    received = np.concatenate([received, received[: len(received) // 50]])
+    cj_df = pd.DataFrame(
+        {
+            "고객주문번호": received.astype(str),
+            "운송장번호": rng.integers(10**11, 9 * 10**11, len(received)),
+        }
+    )
+    return raw_df, cj_df
+
+
+def peak_memory(func, *args) -> float:
+    """func 실행 중 최대 메모리 사용량 (MB). tracemalloc은 느리므로 시간 측정과 따로 실행"""
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024 / 1024
+
+
+def compare(name: str, reference, current, raw_df, cj_df):
+    start = time.perf_counter()
+    expected = reference(raw_df, cj_df)
+    merge_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = current(raw_df, cj_df)
+    if isinstance(actual, tuple):
+        actual = actual[0]
+    match_time = time.perf_counter() - start
+
+    pd.testing.assert_frame_equal(
+        actual.reset_index(drop=True).astype(object),
+        expected.reset_index(drop=True).astype(object),
+        check_dtype=False,
+    )
+    merge_peak = peak_memory(reference, raw_df, cj_df)
+    match_peak = peak_memory(current, raw_df, cj_df)
+    print(f"- {name:6s} merge {merge_time:.3f}s → 해시 매칭 {match_time:.3f}s ({merge_time / match_time:.1f}배), 결과 {len(actual):,}행 일치 ✓")
+    print(f"  {'':6s} 최대 메모리 {merge_peak:,.1f}MB → {match_peak:,.1f}MB")
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    print(f"{rows:,}행 기준")
+    compare("쿠팡", _build_coupang_bulk_reference, build_coupang_bulk, *make_coupang_files(rows))
+    compare("네이버", _build_naver_bulk_reference, build_naver_bulk, *make_naver_files(rows))
+
+
+if __name__ == "__main__":
+    main()
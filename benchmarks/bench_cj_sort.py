@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+네이버 CJ 발주서 정렬 벤치마크 (행 단위 튜플 정렬 키 vs 컬럼 정렬)
+정렬 키 일치 검사는 tests/test_cj_sort.py (pytest)
+사용법:
+  python benchmarks/bench_cj_sort.py            # 기본 30,000행
+  python benchmarks/bench_cj_sort.py 100000     # 행 수 지정
+"""
+import re
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.naver_processor import _cj_sort_order  # noqa: E402
+
+
+def _create_sort_key_reference(row):
+    """기존 행 단위 정렬 키 (속도 비교 기준)"""
+    date_str = str(row["도착희망날짜_정규화"]).strip()
+    option_code = str(row["옵션관리코드"]).strip()
+    if not re.match(r"^\d{1,2}/\d{1,2}$", date_str):
+        return (0, date_str, option_code)
+    month, day = date_str.split("/")
+    return (1, int(month), int(day), option_code)
+
+
+DATES = ["10/02", "9/30", "10/8", "12/24", "01/05", "최대한 빨리", "9월 30일 또는 10월 1일", "", " 10/1 ", "13/45"]
+CODES = ["A01", "A02", "B10", "B2", "C03", " D04", None, np.nan]
+
+
+def make_table(rows: int, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "도착희망날짜_정규화": rng.choice(np.array(DATES, dtype=object), rows),
+            "옵션관리코드": rng.choice(np.array(CODES, dtype=object), rows),
+        }
+    )
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 30_000
+    df = make_table(rows)
+
+    start = time.perf_counter()
+    keys = df.apply(_create_sort_key_reference, axis=1)
+    keys.sort_values()
+    row_wise = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _cj_sort_order(df["도착희망날짜_정규화"], df["옵션관리코드"])
+    vectorized = time.perf_counter() - start
+
+    print(f"{rows:,}행 기준")
+    print(f"- apply(_create_sort_key) + 튜플 정렬: {row_wise:.3f}s")
+    print(f"- 정규식 추출 + sort_values:          {vectorized:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
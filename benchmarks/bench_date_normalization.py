@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+AI 날짜 정규화 벤치마크 (로컬 Responses API 스텁 또는 녹화 응답 재생, 네트워크 불필요)
+배치 크기 × 동시 요청 수 조합별로 실행 시간, 요청 수, 오류 응답, 실패한 날짜 수를 비교합니다.
+사용법:
+  python benchmarks/bench_date_normalization.py                           # 500개 날짜, 기본 조합
+  python benchmarks/bench_date_normalization.py --dates 2000 --error-rate 0.1 --malformed-rate 0.05
+  python benchmarks/bench_date_normalization.py --batch-sizes 20 50 100 --workers 1 4 8
+  python benchmarks/bench_date_normalization.py --record replay.jsonl     # 스텁 응답을 녹화
+  python benchmarks/bench_date_normalization.py --replay replay.jsonl     # 녹화 응답만 사용
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from mock_openai_server import MockOpenAIServer, MockSettings  # noqa: E402
+from utils import naver_processor  # noqa: E402
+from utils.ai_replay import RecordingClient, ReplayClient  # noqa: E402
+from utils.date_cache import DateNormalizationCache  # noqa: E402
+
+# 로컬 규칙으로 바꿀 수 없어 AI로 보내지는 자유 입력 문구
+PHRASES = [
+    "{m}월 {d}일 오전 도착 부탁드려요",
+    "{m}/{d} 이전에만 오면 됩니다",
+    "{m}월 {d}일까지 꼭 받아야 해요 (제사용)",
+    "추석 전 {m}월 {d}일쯤",
+    "{m}.{d} 오후 배송 희망",
+]
+
+
+def free_text_dates(count: int) -> list[str]:
+    """count개의 서로 다른 날짜 문구"""
+    values = []
+    for i in range(count):
+        m, d = i % 12 + 1, i // 12 % 28 + 1
+        values.append(PHRASES[i % len(PHRASES)].format(m=m, d=d) + ("" if i < 12 * 28 else f" #{i}"))
+    return values
+
+
+def run(dates: list[str], client, batch_size: int, workers: int) -> tuple[float, int]:
+    df = pd.DataFrame({"도착희망날짜_원본": dates})
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = DateNormalizationCache(naver_processor.DATE_NORMALIZATION_VERSION, path=Path(tmp) / "cache.sqlite3")
+        start = time.perf_counter()
+        result = naver_processor.normalize_dates_batch(
+            df, "mock", cache=cache, max_workers=workers, client=client, batch_size=batch_size
+        )
+        seconds = time.perf_counter() - start
+    failed = int(result["도착희망날짜_정규화"].astype(str).str.startswith("오류").sum())
+    return seconds, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AI 날짜 정규화 벤치마크")
+    parser.add_argument("--dates", type=int, default=500, help="AI로 보낼 서로 다른 날짜 문구 수")
+    parser.add_argument("--batch-sizes", nargs="+", type=int, default=[50, 100, 200], help="배치 최대 날짜 수 (토큰 한도로 더 작아질 수 있음)")
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 4, 8])
+    parser.add_argument("--latency", type=float, default=0.2, help="스텁 요청당 기본 지연 (초)")
+    parser.add_argument("--latency-per-item", type=float, default=0.005, help="스텁 날짜 하나당 추가 지연 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="스텁 429/500/503 응답 비율")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="스텁 깨진 JSON 응답 비율")
+    parser.add_argument("--backoff-base", type=float, default=0.05, help="재시도 대기 기준 (초, 실제 기본값은 1.0)")
+    parser.add_argument("--seed", type=int, default=42)
+    replay = parser.add_mutually_exclusive_group()
+    replay.add_argument("--record", type=Path, help="스텁 응답을 JSONL로 녹화")
+    replay.add_argument("--replay", type=Path, help="녹화한 응답을 스텁 대신 재생")
+    args = parser.parse_args()
+
+    naver_processor.DATE_NORMALIZATION_BACKOFF_BASE = args.backoff_base
+    dates = free_text_dates(args.dates)
+
+    if args.replay:
+        client = ReplayClient(args.replay)
+        print(f"{len(dates):,}개 날짜, 녹화 응답 {len(client.recorded):,}개 재생")
+        for batch_size in args.batch_sizes:
+            for workers in args.workers:
+                seconds, failed = run(dates, client, batch_size, workers)
+                print(f"  배치 {batch_size:4d} × 동시 {workers:2d}  {seconds:8.3f}s  실패 {failed:,}개")
+        return
+
+    from openai import OpenAI
+
+    settings = MockSettings(
+        args.latency, args.latency_per_item, args.error_rate, malformed_rate=args.malformed_rate, seed=args.seed
+    )
+    with MockOpenAIServer(settings) as server:
+        client = OpenAI(api_key="mock", base_url=server.base_url, max_retries=0)
+        if args.record:
+            client = RecordingClient(client, args.record)
+        print(f"{len(dates):,}개 날짜, 스텁 {server.base_url} (지연 {args.latency}s + {args.latency_per_item}s/개, 오류 {args.error_rate:.0%}, 깨진 JSON {args.malformed_rate:.0%})")
+        for batch_size in args.batch_sizes:
+            for workers in args.workers:
+                server.stats.clear()
+                seconds, failed = run(dates, client, batch_size, workers)
+                stats = server.stats
+                errors = sum(v for k, v in stats.items() if k.startswith("error_"))
+                print(
+                    f"  배치 {batch_size:4d} × 동시 {workers:2d}  {seconds:8.3f}s  요청 {stats['requests']:4d}  "
+                    f"오류 응답 {errors:3d}  잘림 {stats['truncated']:3d}  깨짐 {stats['malformed']:3d}  실패 {failed:,}개"
+                )
+    if args.record:
+        print(f"\n녹화 저장: {args.record}")
+
+
+if __name__ == "__main__":
+    main()
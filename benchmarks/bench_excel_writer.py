@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+결과 엑셀 쓰기 벤치마크 (DataFrame.to_excel vs 행 단위 스트리밍 쓰기) 및 결과 일치 검사
+사용법:
+  python benchmarks/bench_excel_writer.py            # 기본 10,000행
+  python benchmarks/bench_excel_writer.py 30000      # 행 수 지정 (메모리 측정 때문에 오래 걸림)
+"""
+import io
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.excel_utils import get_excel_writer_engine, write_excel  # noqa: E402
+
+
+def make_cj_orders(rows: int, seed: int = 42) -> pd.DataFrame:
+    """CJ 발주서와 같은 모양의 결과 테이블을 만듭니다."""
+    rng = np.random.default_rng(seed)
+    qty = rng.integers(1, 5, rows)
+    return pd.DataFrame(
+        {
+            "보내는분성명": "과일가게",
+            "보내는분전화번호": "010-1234-5678",
+            "보내는분주소(전체,분할)": "서울특별시 중구 세종대로 110",
+            "운임구분": "신용",
+            "박스타입": "극소",
+            "기본운임": qty * 2200,
+            "고객주문번호": rng.integers(10**15, 9 * 10**15, rows).astype(str),
+            "품목명": [f"보낸이{i % 997}드림 A{i % 13:02d} {i % 12 + 1}/{i % 28 + 1}" for i in range(rows)],
+            "수량": qty,
+            "수취인이름": [f"수취인{i}" for i in range(rows)],
+            "수취인전화번호": [f"010-{i % 10000:04d}-{(i * 7) % 10000:04d}" for i in range(rows)],
+            "수취인 주소": [f"경기도 성남시 분당구 판교로 {i % 500} {i % 30}층" for i in range(rows)],
+            "배송메세지": np.where(rng.random(rows) < 0.3, None, "문 앞에 놓아주세요"),
+        }
+    )
+
+
+def measure(label: str, func):
+    start = time.perf_counter()
+    data = func()
+    elapsed = time.perf_counter() - start
+
+    # tracemalloc은 실행 속도를 크게 늦추므로 메모리는 따로 한 번 더 실행해 측정
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"- {label:32s} {elapsed:6.3f}s  최대 메모리 {peak / 1024 / 1024:7.1f}MB  파일 {len(data) / 1024:,.0f}KB")
+    return data
+
+
+def to_excel_reference(df: pd.DataFrame) -> bytes:
+    """기존 방식: DataFrame.to_excel(openpyxl) → BytesIO.getvalue()"""
+    buf = io.BytesIO()
+    df.to_excel(buf, index=False, engine="openpyxl")
+    buf.seek(0)
+    return buf.getvalue()
+
+
+def write_with(df: pd.DataFrame, engine: str) -> bytes:
+    buf = io.BytesIO()
+    write_excel(df, buf, engine=engine)
+    return buf.getvalue()
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    df = make_cj_orders(rows)
+    print(f"{rows:,}행 기준 (기본 쓰기 엔진: {get_excel_writer_engine()})")
+
+    expected = pd.read_excel(io.BytesIO(measure("to_excel (openpyxl)", lambda: to_excel_reference(df))))
+    engines = ["openpyxl"]
+    if get_excel_writer_engine() == "xlsxwriter":
+        engines.insert(0, "xlsxwriter")
+    for engine in engines:
+        data = measure(f"write_excel ({engine})", lambda: write_with(df, engine))
+        pd.testing.assert_frame_equal(pd.read_excel(io.BytesIO(data)), expected)
+    print("결과 일치 검사 통과 ✓")
+
+
+if __name__ == "__main__":
+    main()
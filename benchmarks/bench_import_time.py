@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+모듈 import 시간 측정 (python -X importtime) 및 무거운 라이브러리 지연 로딩 검사
+첫 화면(app.py, 로그인)에서 pandas/pyarrow/openai/msoffcrypto/bcrypt가 로드되지 않는지 확인합니다.
+사용법:
+  python benchmarks/bench_import_time.py            # 기본 모듈 목록, 각 3회 실행 중 최솟값
+  python benchmarks/bench_import_time.py ui.naver_cj main  # 모듈 지정
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# (모듈, 첫 화면 경로인지 여부)
+DEFAULT_MODULES = [
+    ("app", True),
+    ("ui.login", True),
+    ("ui.coupang_cj", False),
+    ("ui.naver_cj", False),
+    ("main", False),
+]
+
+# 첫 화면 경로에서 로드되면 안 되는 라이브러리
+LAZY_MODULES = ("pandas", "pyarrow", "openai", "msoffcrypto", "bcrypt")
+
+RUNS = 3
+TOP_N = 8
+
+
+def import_profile(module: str) -> dict[str, tuple[int, int]]:
+    """새 인터프리터에서 module을 import하고 {모듈: (자체 μs, 누적 μs)}를 반환합니다."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{module} import 실패:\n{proc.stderr[-2000:]}")
+
+    profile = {}
+    for line in proc.stderr.splitlines():
+        # 형식: "import time:   self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        profile[name.strip()] = (int(self_us), int(cumulative_us))
+    return profile
+
+
+def report(module: str, first_screen: bool) -> None:
+    profiles = [import_profile(module) for _ in range(RUNS)]
+    best = min(profiles, key=lambda p: p[module][1])
+    total_ms = best[module][1] / 1000
+    print(f"- {module:16s} {total_ms:8.1f}ms")
+
+    top_level = {name: cumulative for name, (_, cumulative) in best.items() if "." not in name and name != module}
+    for name, cumulative in sorted(top_level.items(), key=lambda item: -item[1])[:TOP_N]:
+        print(f"    {name:28s} {cumulative / 1000:8.1f}ms")
+
+    if first_screen:
+        loaded = [name for name in LAZY_MODULES if name in best]
+        status = f"⚠️ 첫 화면에서 로드됨: {', '.join(loaded)}" if loaded else "✓ 무거운 라이브러리 지연 로딩"
+        print(f"    {status}")
+
+
+def main():
+    if len(sys.argv) > 1:
+        modules = [(name, False) for name in sys.argv[1:]]
+    else:
+        modules = DEFAULT_MODULES
+    print(f"python -X importtime 기준 (각 {RUNS}회 중 최소)")
+    for module, first_screen in modules:
+        report(module, first_screen)
+
+
+if __name__ == "__main__":
+    main()
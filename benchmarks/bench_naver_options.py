@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+네이버 옵션정보 파싱 벤치마크 (행 단위 apply vs 고유 문자열만 파싱)
+결과 일치 검사는 tests/test_naver_options.py (pytest)
+사용법:
+  python benchmarks/bench_naver_options.py            # 기본 30,000행 (성수기 기준)
+  python benchmarks/bench_naver_options.py 100000     # 행 수 지정
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.naver_processor import parse_naver_options  # noqa: E402
+
+
+def _parse_naver_option_reference(option_str) -> dict:
+    """기존 split 기반 구현 (속도 비교 기준)"""
+    result = {"보내시는분": "", "도착희망날짜_원본": "", "과일선물옵션": "", "크리스탈보자기": ""}
+    if pd.isna(option_str):
+        return result
+    for part in str(option_str).split(" / "):
+        if ":" in part:
+            key, value = part.split(":", 1)
+            key = key.strip()
+            value = value.strip()
+            if "보내시는 분" in key:
+                result["보내시는분"] = value
+            elif "도착 희망 날짜" in key or "도착희망날짜" in key:
+                result["도착희망날짜_원본"] = value
+            elif "과일 선물 옵션" in key or "과일선물옵션" in key:
+                result["과일선물옵션"] = value
+            elif "크리스탈 보자기" in key:
+                result["크리스탈보자기"] = value
+    return result
+
+
+DATES = ["10월 2일", "2025-09-30", "9/30", "최대한 빨리", "10월 8일 수요일", "9월 30일 또는 10월 1일", "추석 전까지: 꼭"]
+FRUITS = ["샤인머스캣 2kg", "사과 5kg (특대)", "배 7.5kg / 선물용", "혼합 세트"]
+WRAPS = ["추가안함", "추가 (+3,000원)"]
+
+
+def make_options(rows: int, seed: int = 42, senders: int = 2000) -> pd.Series:
+    """실제 네이버 옵션정보와 비슷한 문자열을 만듭니다. (항목 순서는 상품별로 고정)"""
+    rng = np.random.default_rng(seed)
+    sender_pool = [f"보낸이{i} (주식회사 {i % 37})" if i % 5 == 0 else f"보낸이{i}" for i in range(senders)] + [""]
+    values = []
+    for _ in range(rows):
+        parts = [
+            f"보내시는 분: {sender_pool[rng.integers(len(sender_pool))]}",
+            f"도착 희망 날짜: {DATES[rng.integers(len(DATES))]}",
+            f"과일 선물 옵션: {FRUITS[rng.integers(len(FRUITS))]}",
+        ]
+        if rng.random() < 0.5:
+            parts.append(f"크리스탈 보자기: {WRAPS[rng.integers(len(WRAPS))]}")
+        if rng.random() < 0.2:
+            parts.insert(0, "선택: 기본")
+        if rng.random() < 0.1:
+            parts = [p.replace("도착 희망 날짜", "도착희망날짜(필수)") for p in parts]
+        if rng.random() < 0.05:
+            # 엑셀에서 복사해 붙인 값처럼 값 앞뒤에 탭/줄바꿈이 섞인 경우
+            parts = [p + rng.choice(["\n", "\t", " \n", "\r\n"]) for p in parts]
+            parts[0] = "\t" + parts[0]
+        values.append(" / ".join(parts))
+    values[::97] = [None] * len(values[::97])
+    return pd.Series(values, dtype=object)
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 30_000
+    options = make_options(rows)
+
+    start = time.perf_counter()
+    pd.DataFrame(options.apply(_parse_naver_option_reference).tolist())
+    row_wise = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parse_naver_options(options)
+    vectorized = time.perf_counter() - start
+
+    print(f"{rows:,}행 기준 (고유 옵션 문자열 {options.nunique():,}개)")
+    print(f"- apply(parse_naver_option): {row_wise:.3f}s")
+    print(f"- parse_naver_options:        {vectorized:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+주문번호 정규화 벤치마크 (행 단위 apply vs 벡터 연산)
+경계값 결과 일치 검사는 tests/test_order_utils.py (pytest)
+사용법:
+  python benchmarks/bench_normalize_order.py            # 기본 100,000행
+  python benchmarks/bench_normalize_order.py 10000      # 행 수 지정
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.order_utils import normalize_order_numbers  # noqa: E402
+
+
+def _normalize_order_reference(value, remove_whitespace=True):
+    """기존 행 단위 구현 (속도 비교 기준)"""
+    if pd.isna(value):
+        return ""
+    if isinstance(value, float):
+        return str(int(value))
+    if isinstance(value, int):
+        return str(value)
+    s = str(value).strip()
+    if remove_whitespace:
+        s = "".join(s.split())
+    if s.endswith(".0") and s.replace(".", "", 1).isdigit():
+        try:
+            return str(int(float(s)))
+        except Exception:
+            return s
+    return s
+
+
+def make_keys(rows: int, seed: int = 42) -> dict[str, pd.Series]:
+    rng = np.random.default_rng(seed)
+    numbers = rng.integers(10**15, 9 * 10**15, rows)
+    mixed = pd.Series(numbers, dtype=object)
+    mixed[::3] = [f" {n}.0" for n in numbers[::3]]
+    mixed[1::7] = np.nan
+    return {
+        "int64": pd.Series(numbers),
+        "float64 (빈칸 포함)": pd.Series(numbers, dtype="float64").where(rng.random(rows) > 0.05),
+        "object (숫자/문자 혼합)": mixed,
+    }
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"{rows:,}행 기준")
+    for name, series in make_keys(rows).items():
+        start = time.perf_counter()
+        expected = series.apply(_normalize_order_reference)
+        row_wise = time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = normalize_order_numbers(series)
+        vectorized = time.perf_counter() - start
+
+        assert actual.tolist() == expected.tolist(), name
+        print(f"- {name:22s} apply {row_wise:.3f}s → 벡터 {vectorized:.3f}s ({row_wise / vectorized:.1f}배)")
+
+
+if __name__ == "__main__":
+    main()
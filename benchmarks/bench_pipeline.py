@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+파이프라인 단계별 벤치마크 (합성 쿠팡/네이버/CJ 파일, 암호화 포함) 및 결과 JSON 저장/비교
+처리 단계(빌더, 발주서 생성)는 실행 시간과 함께 최대 메모리(peak_mb, tracemalloc)도 기록합니다.
+사용법:
+  python benchmarks/bench_pipeline.py                          # 1,000 / 10,000 / 100,000행
+  python benchmarks/bench_pipeline.py 1000 10000               # 행 수 지정
+  python benchmarks/bench_pipeline.py --compare benchmarks/results/abc1234.json
+결과는 기본으로 benchmarks/results/<커밋>.json에 저장됩니다.
+"""
+import argparse
+import datetime as dt
+import io
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from generators import (  # noqa: E402
+    NAVER_GUIDE_ROW,
+    cj_receipts,
+    coupang_export,
+    encrypt_xlsx,
+    naver_export,
+    to_xlsx,
+)
+from utils.coupang_processor import (  # noqa: E402
+    COUPANG_BULK_CJ_COLUMNS,
+    COUPANG_BULK_RAW_COLUMNS,
+    COUPANG_CJ_COLUMNS,
+    build_coupang_bulk,
+    build_coupang_cj,
+)
+from utils.excel_utils import get_excel_engine, get_excel_writer_engine, read_excel_with_password  # noqa: E402
+from utils.naver_processor import (  # noqa: E402
+    NAVER_BULK_CJ_COLUMNS,
+    NAVER_BULK_RAW_COLUMNS,
+    NAVER_INTERMEDIATE_COLUMNS,
+    build_naver_bulk,
+    create_naver_intermediate_table,
+    generate_cj_orders_by_date,
+    normalize_date_locally,
+)
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+SENDER_DEFAULTS = {"name": "보내는분", "phone": "010-0000-0000", "address": "경기도 남양주시"}
+# 기준 결과보다 이 비율 이상 느려지거나 메모리를 더 쓰면 표시
+REGRESSION_RATIO = 1.2
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def measure(func, repeat: int):
+    """func를 repeat번 실행해 가장 빠른 시간(초)과 마지막 결과를 반환합니다."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def peak_memory_mb(func) -> float:
+    """func 실행 중 새로 할당한 최대 메모리 (MB). tracemalloc은 느리므로 시간 측정과 따로 한 번 실행"""
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024 / 1024
+
+
+def make_files(rows: int) -> dict[str, bytes]:
+    coupang = coupang_export(rows)
+    naver = naver_export(rows)
+    files = {
+        "coupang_raw": to_xlsx(coupang),
+        "naver_raw": to_xlsx(naver, guide=NAVER_GUIDE_ROW),
+        "coupang_cj": to_xlsx(cj_receipts(coupang["주문번호"])),
+        "naver_cj": to_xlsx(cj_receipts(naver["상품주문번호"]).drop(columns=["집화예정일자"])),
+    }
+    files["coupang_raw_encrypted"] = encrypt_xlsx(files["coupang_raw"])
+    files["naver_raw_encrypted"] = encrypt_xlsx(files["naver_raw"])
+    return files
+
+
+def run_size(rows: int, repeat: int) -> dict[str, dict]:
+    files = make_files(rows)
+    stages = {}
+
+    def record(name, func, count=None, memory=True):
+        seconds, result = measure(func, repeat)
+        frame = result[0] if isinstance(result, tuple) else result
+        if isinstance(frame, dict):
+            frame = frame["single"]["df"]
+        stage = {"seconds": round(seconds, 4), "rows": count if count is not None else len(frame)}
+        line = f"  {name:50s} {seconds:8.3f}s  {stage['rows']:>9,}행"
+        if memory:
+            stage["peak_mb"] = round(peak_memory_mb(func), 2)
+            line += f"  {stage['peak_mb']:>9,.1f}MB"
+        stages[name] = stage
+        print(line)
+        return result
+
+    def read(name, columns, label=None, **kwargs):
+        # 같은 파일을 다른 컬럼으로 여러 번 읽으므로 label로 단계 이름을 구분
+        data = files[name]
+        return record(
+            f"read_excel_with_password[{label or name}]",
+            lambda: read_excel_with_password(io.BytesIO(data), use_cache=False, columns=columns, **kwargs),
+            # 파싱은 tracemalloc으로 몇 배 느려지므로 읽기 단계는 시간만 기록
+            memory=False,
+        )
+
+    coupang_cj_raw = read("coupang_raw", COUPANG_CJ_COLUMNS, label="coupang_raw:cj")
+    read("coupang_raw_encrypted", COUPANG_CJ_COLUMNS)
+    coupang_bulk_raw = read("coupang_raw", COUPANG_BULK_RAW_COLUMNS, label="coupang_raw:bulk")
+    coupang_cj = read("coupang_cj", COUPANG_BULK_CJ_COLUMNS)
+    naver_raw = read("naver_raw", NAVER_INTERMEDIATE_COLUMNS, label="naver_raw:intermediate", header=1)
+    read("naver_raw_encrypted", NAVER_INTERMEDIATE_COLUMNS, header=1)
+    naver_bulk_raw = read("naver_raw", NAVER_BULK_RAW_COLUMNS, label="naver_raw:bulk", header=1)
+    naver_cj = read("naver_cj", NAVER_BULK_CJ_COLUMNS)
+
+    sorted_df = coupang_cj_raw.sort_values("업체상품코드").reset_index(drop=True)
+    record("build_coupang_cj", lambda: build_coupang_cj(sorted_df, SENDER_DEFAULTS))
+    record("build_coupang_bulk", lambda: build_coupang_bulk(coupang_bulk_raw, coupang_cj))
+    record("build_naver_bulk", lambda: build_naver_bulk(naver_bulk_raw, naver_cj))
+    intermediate = record("create_naver_intermediate_table", lambda: create_naver_intermediate_table(naver_raw))
+
+    # AI 대신 로컬 규칙으로 날짜를 채운 뒤 발주서 생성 (로컬로 못 바꾸는 값은 원문 유지)
+    originals = intermediate["도착희망날짜_원본"].fillna("")
+    intermediate["도착희망날짜_정규화"] = [normalize_date_locally(v) or v for v in originals]
+    record("generate_cj_orders_by_date", lambda: generate_cj_orders_by_date(intermediate, SENDER_DEFAULTS))
+    return stages
+
+
+def compare(current: dict, base_path: Path) -> None:
+    base = json.loads(base_path.read_text(encoding="utf-8"))
+    print(f"\n기준 {base_path.name} ({base['commit']}) 대비")
+    for size, stages in current["results"].items():
+        base_stages = base["results"].get(size, {})
+        for name, stage in stages.items():
+            if name not in base_stages or not base_stages[name]["seconds"]:
+                continue
+            ratio = stage["seconds"] / base_stages[name]["seconds"]
+            mark = "⚠️ " if ratio >= REGRESSION_RATIO else "   "
+            line = f"{int(size):>9,}행 {name:50s} {base_stages[name]['seconds']:8.3f}s → {stage['seconds']:8.3f}s ({ratio:.2f}배)"
+            base_peak, peak = base_stages[name].get("peak_mb"), stage.get("peak_mb")
+            if base_peak and peak is not None:
+                memory_ratio = peak / base_peak
+                if memory_ratio >= REGRESSION_RATIO:
+                    mark = "⚠️ "
+                line += f"  메모리 {base_peak:,.1f}MB → {peak:,.1f}MB ({memory_ratio:.2f}배)"
+            print(mark + line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="파이프라인 단계별 벤치마크")
+    parser.add_argument("sizes", nargs="*", type=int, default=list(DEFAULT_SIZES), help="행 수 목록")
+    parser.add_argument("--repeat", type=int, default=3, help="단계별 반복 횟수 (가장 빠른 값 기록)")
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로 (기본값: benchmarks/results/<커밋>.json)")
+    parser.add_argument("--compare", type=Path, help="비교할 기준 결과 JSON")
+    args = parser.parse_args()
+
+    commit = git_commit()
+    report = {
+        "commit": commit,
+        "created_at": dt.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "excel_engine": get_excel_engine(),
+        "excel_writer_engine": get_excel_writer_engine(),
+        "repeat": args.repeat,
+        "results": {},
+    }
+    for rows in args.sizes:
+        print(f"{rows:,}행 (파일 생성 후 측정, {args.repeat}회 중 최소)")
+        report["results"][str(rows)] = run_size(rows, args.repeat)
+
+    output = args.output or RESULTS_DIR / f"{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"\n결과 저장: {output}")
+
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == "__main__":
+    main()
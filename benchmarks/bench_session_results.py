@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+세션 결과 보관 크기 비교 (DataFrame + xlsx 바이트 vs CompactFrame) 및 복원 결과 일치 검사
+사용법:
+  python benchmarks/bench_session_results.py            # 기본 30,000행
+  python benchmarks/bench_session_results.py 100000     # 행 수 지정
+"""
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_excel_writer import make_cj_orders  # noqa: E402
+from utils.excel_utils import to_excel_bytes  # noqa: E402
+from utils.result_store import CompactFrame  # noqa: E402
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 30_000
+    df = make_cj_orders(rows)
+
+    frame_bytes = int(df.memory_usage(deep=True).sum())
+    xlsx_bytes = len(to_excel_bytes(df))
+
+    start = time.perf_counter()
+    frame = CompactFrame(df)
+    pack = time.perf_counter() - start
+
+    start = time.perf_counter()
+    restored = frame.to_pandas()
+    unpack = time.perf_counter() - start
+
+    pd.testing.assert_frame_equal(restored, df, check_dtype=False)
+    print(f"복원 결과 일치 검사 통과 ✓ ({rows:,}행)")
+    print(f"- 기존 DataFrame + xlsx: {(frame_bytes + xlsx_bytes) / 1e6:.1f}MB (DataFrame {frame_bytes / 1e6:.1f}MB, xlsx {xlsx_bytes / 1e6:.1f}MB)")
+    print(f"- CompactFrame:          {frame.nbytes / 1e6:.1f}MB (미리보기 포함)")
+    print(f"- 보관 {pack:.3f}s / 복원 {unpack:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+벤치마크용 합성 입력 파일 생성기 (seed가 같으면 항상 같은 데이터)
+- 쿠팡 로우데이터: 약 40컬럼, 한 주문에 상품 여러 개(주문번호 중복) 포함
+- 네이버 로우데이터: 첫 행 안내문(header=1로 읽음), 한국어 옵션정보 문자열 포함
+- CJ 파일접수 상세내역: 접수 누락/중복, 일부 고객주문번호는 "123.0" 형태
+- encrypt_xlsx(): 비밀번호(기본 1111)로 암호화된 버전
+"""
+import io
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.coupang_processor import COUPANG_BULK_RAW_COLUMNS  # noqa: E402
+from utils.excel_utils import get_excel_writer_engine  # noqa: E402
+
+NAVER_GUIDE_ROW = "※ 발주발송관리 엑셀 다운로드 파일입니다. 2행의 컬럼명을 수정하지 마세요."
+
+NAMES = ["김철수", "이영희", "박민수", "최지우", "정우성", "한가인", "윤서준", "강하늘"]
+ADDRESSES = [
+    "서울특별시 강남구 테헤란로 123 4층",
+    "경기도 성남시 분당구 판교역로 235",
+    "부산광역시 해운대구 센텀중앙로 97 1203호",
+    "대전광역시 유성구 대학로 99",
+]
+MESSAGES = ["문 앞에 놓아주세요", "", "경비실에 맡겨주세요", "부재 시 연락 바랍니다"]
+PRODUCTS = ["샤인머스캣 2kg", "사과 5kg (특대)", "배 7.5kg / 선물용", "혼합 과일 세트"]
+OPTION_CODES = ["A01", "A02", "B10", "B2", "C03", "D04"]
+ARRIVAL_DATES = ["10월 2일", "2025-09-30", "9/30", "최대한 빨리", "10월 8일 수요일", "9월 30일 또는 10월 1일", "10.3"]
+WRAPS = ["추가안함", "추가 (+3,000원)"]
+
+
+def _choice(rng: np.random.Generator, values: list, rows: int) -> np.ndarray:
+    return rng.choice(np.array(values, dtype=object), rows)
+
+
+def _phones(rng: np.random.Generator, rows: int) -> list[str]:
+    numbers = rng.integers(10_000_000, 100_000_000, rows)
+    return [f"010-{n // 10_000:04d}-{n % 10_000:04d}" for n in numbers]
+
+
+def coupang_export(rows: int, seed: int = 42) -> pd.DataFrame:
+    """쿠팡 로우데이터 (COUPANG_BULK_RAW_COLUMNS 전체 + CJ 발주서에 쓰는 컬럼)"""
+    rng = np.random.default_rng(seed)
+    orders = rng.integers(10**12, 10**13, rows // 2 + 1)
+    df = pd.DataFrame({col: "" for col in COUPANG_BULK_RAW_COLUMNS}, index=pd.RangeIndex(rows))
+    df["번호"] = np.arange(1, rows + 1)
+    df["묶음배송번호"] = rng.integers(10**11, 10**12, rows)
+    df["주문번호"] = orders[rng.integers(0, len(orders), rows)]
+    df["운송장번호"] = np.where(rng.random(rows) < 0.05, rng.integers(10**11, 10**12, rows), np.nan)
+    df["분리배송 Y/N"] = "분리배송 불가"
+    df["주문시 출고예정일"] = "2025-10-01"
+    df["주문일"] = "2025-09-28 13:24:11"
+    df["등록상품명"] = _choice(rng, PRODUCTS, rows)
+    df["등록옵션명"] = _choice(rng, ["1박스", "2박스", "선물포장"], rows)
+    df["노출상품명(옵션명)"] = df["등록상품명"] + ", " + df["등록옵션명"]
+    df["노출상품ID"] = rng.integers(10**9, 10**10, rows)
+    df["옵션ID"] = rng.integers(10**10, 10**11, rows)
+    df["최초등록등록상품명/옵션명"] = df["노출상품명(옵션명)"]
+    df["업체상품코드"] = _choice(rng, OPTION_CODES, rows)
+    df["결제액"] = rng.integers(10, 100, rows) * 1000
+    df["배송비구분"] = "무료"
+    df["배송비"] = 0
+    df["구매수(수량)"] = rng.integers(1, 4, rows)
+    df["옵션판매가(판매단가)"] = df["결제액"]
+    df["구매자"] = _choice(rng, NAMES, rows)
+    df["구매자전화번호"] = _phones(rng, rows)
+    df["수취인이름"] = _choice(rng, NAMES, rows)
+    df["수취인전화번호"] = _phones(rng, rows)
+    df["우편번호"] = rng.integers(10_000, 64_000, rows)
+    df["수취인 주소"] = _choice(rng, ADDRESSES, rows)
+    df["배송메세지"] = _choice(rng, MESSAGES, rows)
+    df["결제위치"] = _choice(rng, ["APP", "PC", "MOBILE_WEB"], rows)
+    # 실제 파일처럼 둘 중 하나의 이름만 있음
+    return df.drop(columns=["최초등록옵션명", "통관용구매자전화번호"])
+
+
+def naver_options(rows: int, seed: int = 42) -> list:
+    """네이버 옵션정보 문자열 ("보내시는 분: ... / 도착 희망 날짜: ... / ...")"""
+    rng = np.random.default_rng(seed)
+    values = []
+    for _ in range(rows):
+        parts = [
+            f"보내시는 분: {NAMES[rng.integers(len(NAMES))]}",
+            f"도착 희망 날짜: {ARRIVAL_DATES[rng.integers(len(ARRIVAL_DATES))]}",
+            f"과일 선물 옵션: {PRODUCTS[rng.integers(len(PRODUCTS))]}",
+        ]
+        if rng.random() < 0.5:
+            parts.append(f"크리스탈 보자기: {WRAPS[rng.integers(len(WRAPS))]}")
+        values.append(" / ".join(parts))
+    values[::97] = [None] * len(values[::97])
+    return values
+
+
+def naver_export(rows: int, seed: int = 42) -> pd.DataFrame:
+    """네이버 로우데이터 (상품주문번호 일부 중복)"""
+    rng = np.random.default_rng(seed)
+    keys = rng.integers(10**15, 9 * 10**15, rows)
+    keys[1::25] = keys[::25][: len(keys[1::25])]
+    return pd.DataFrame(
+        {
+            "상품주문번호": keys,
+            "주문번호": keys // 10,
+            "배송방법": np.where(rng.random(rows) < 0.5, "택배,등기,소포", ""),
+            "택배사": "",
+            "송장번호": np.nan,
+            "수취인명": _choice(rng, NAMES, rows),
+            "수취인연락처1": _phones(rng, rows),
+            "통합배송지": _choice(rng, ADDRESSES, rows),
+            "배송메세지": _choice(rng, MESSAGES, rows),
+            "상품명": _choice(rng, PRODUCTS, rows),
+            "옵션정보": naver_options(rows, seed),
+            "옵션관리코드": _choice(rng, OPTION_CODES, rows),
+            "수량": rng.integers(1, 4, rows),
+        }
+    )
+
+
+def cj_receipts(order_numbers, seed: int = 42, miss_rate: float = 0.1, dup_rate: float = 0.02) -> pd.DataFrame:
+    """주문번호 목록에 대한 CJ 파일접수 상세내역 (일부 누락, 일부 중복 접수)"""
+    rng = np.random.default_rng(seed)
+    received = pd.unique(np.asarray(order_numbers))
+    received = received[rng.random(len(received)) >= miss_rate]
+    received = np.concatenate([received, received[: int(len(received) * dup_rate)]])
+    df = pd.DataFrame(
+        {
+            "고객주문번호": [f"{n}.0" if i % 7 == 0 else str(n) for i, n in enumerate(received)],
+            "운송장번호": rng.integers(10**11, 10**12, len(received)),
+            "집화예정일자": "2025-10-01",
+            "받는분": _choice(rng, NAMES, len(received)),
+        }
+    )
+    return df
+
+
+def to_xlsx(df: pd.DataFrame, guide: str | None = None) -> bytes:
+    """DataFrame을 xlsx 바이트로 만듭니다. guide가 있으면 첫 행에 안내문을 넣고 2행부터 표를 씁니다."""
+    engine = get_excel_writer_engine()
+    buf = io.BytesIO()
+    with pd.ExcelWriter(buf, engine=engine) as writer:
+        df.to_excel(writer, index=False, startrow=1 if guide else 0)
+        if guide:
+            sheet = writer.sheets["Sheet1"]
+            if engine == "xlsxwriter":
+                sheet.write(0, 0, guide)
+            else:
+                sheet.cell(row=1, column=1, value=guide)
+    return buf.getvalue()
+
+
+def encrypt_xlsx(data: bytes, password: str = "1111") -> bytes:
+    """xlsx 바이트를 비밀번호로 암호화합니다. (msoffcrypto-tool)"""
+    from msoffcrypto.format.ooxml import OOXMLFile
+
+    encrypted = io.BytesIO()
+    OOXMLFile(io.BytesIO(data)).encrypt(password, encrypted)
+    return encrypted.getvalue()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+날짜 정규화용 로컬 OpenAI Responses API 스텁 (네트워크 없이 배치 크기/동시 요청 수/재시도 정책 측정용)
+- POST /v1/responses 에 Responses API 형태의 JSON으로 응답 (openai SDK의 base_url로 연결)
+- 지연 시간, 오류 응답(429/500/503), 잘린/깨진 JSON 비율을 설정 가능
+- 같은 seed와 같은 요청이면 스레드 실행 순서와 관계없이 같은 결과
+사용법:
+  python benchmarks/mock_openai_server.py --port 8765 --latency 0.3 --error-rate 0.1
+  OPENAI_BASE_URL=http://127.0.0.1:8765/v1 python main.py naver-cj 로우데이터.xlsx --api-key mock
+"""
+import argparse
+import hashlib
+import json
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.naver_processor import normalize_date_locally  # noqa: E402
+
+# 프롬프트의 "입력: [...]" 줄에서 요청한 날짜 목록({"index", "text"})을 꺼냄
+INPUT_PATTERN = re.compile(r"입력: (\[.*\])")
+# 출력 토큰 수 추정 (한글이 섞인 짧은 JSON 기준 대략값)
+CHARS_PER_TOKEN = 2.0
+
+
+class MockSettings:
+    def __init__(
+        self,
+        latency: float = 0.2,
+        latency_per_item: float = 0.005,
+        error_rate: float = 0.0,
+        error_statuses: tuple[int, ...] = (429, 500, 503),
+        malformed_rate: float = 0.0,
+        seed: int = 42,
+    ):
+        self.latency = latency
+        self.latency_per_item = latency_per_item
+        self.error_rate = error_rate
+        self.error_statuses = error_statuses
+        self.malformed_rate = malformed_rate
+        self.seed = seed
+
+
+def normalize_like_model(items: list[dict]) -> dict:
+    """모델 대신 로컬 규칙으로 변환해 DATE_NORMALIZATION_SCHEMA 형태로 반환 (규칙으로 못 바꾸는 값은 원문 그대로)"""
+    return {
+        "results": [
+            {"index": item["index"], "normalized": normalize_date_locally(item["text"]) or item["text"]}
+            for item in items
+        ]
+    }
+
+
+def response_body(text: str, model: str, max_output_tokens: int | None, input_chars: int) -> dict:
+    """Responses API 응답 JSON (max_output_tokens를 넘으면 잘라서 incomplete로 반환)"""
+    status, incomplete = "completed", None
+    if max_output_tokens and len(text) / CHARS_PER_TOKEN > max_output_tokens:
+        text = text[: int(max_output_tokens * CHARS_PER_TOKEN)]
+        status, incomplete = "incomplete", {"reason": "max_output_tokens"}
+    return {
+        "id": f"resp_mock_{hashlib.sha1(text.encode('utf-8')).hexdigest()[:12]}",
+        "object": "response",
+        "created_at": int(time.time()),
+        "status": status,
+        "incomplete_details": incomplete,
+        "model": model,
+        "output": [
+            {
+                "type": "message",
+                "id": "msg_mock",
+                "status": status,
+                "role": "assistant",
+                "content": [{"type": "output_text", "text": text, "annotations": []}],
+            }
+        ],
+        "usage": {
+            "input_tokens": int(input_chars / CHARS_PER_TOKEN),
+            "output_tokens": int(len(text) / CHARS_PER_TOKEN),
+            "total_tokens": int((input_chars + len(text)) / CHARS_PER_TOKEN),
+        },
+    }
+
+
+class MockOpenAIServer:
+    """
+    백그라운드 스레드에서 실행되는 Responses API 스텁.
+
+    with MockOpenAIServer(MockSettings(error_rate=0.1)) as server:
+        client = OpenAI(api_key="mock", base_url=server.base_url, max_retries=0)
+    """
+
+    def __init__(self, settings: MockSettings | None = None, host: str = "127.0.0.1", port: int = 0):
+        self.settings = settings or MockSettings()
+        self.stats: Counter = Counter()
+        self._seen: Counter = Counter()
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler())
+        self.httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def _rng(self, body: bytes) -> random.Random:
+        # 같은 요청을 몇 번째 받았는지까지 seed에 넣어 재시도마다 다른 결과가 나오게 함
+        digest = hashlib.sha256(body).hexdigest()
+        with self._lock:
+            self._seen[digest] += 1
+            nth = self._seen[digest]
+        return random.Random(f"{self.settings.seed}:{digest}:{nth}")
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status: int, payload: dict, headers: dict | None = None) -> None:
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                if self.path.rstrip("/") != "/v1/responses":
+                    self._send(404, {"error": {"message": f"unknown path {self.path}", "type": "not_found"}})
+                    return
+                server.handle_responses(self, body)
+
+        return Handler
+
+    def handle_responses(self, handler, body: bytes) -> None:
+        settings = self.settings
+        rng = self._rng(body)
+        self._count("requests")
+        request = json.loads(body)
+        prompt = request.get("input") if isinstance(request.get("input"), str) else json.dumps(request.get("input"))
+        match = INPUT_PATTERN.search(prompt)
+        items = json.loads(match.group(1)) if match else []
+
+        time.sleep(settings.latency + settings.latency_per_item * len(items))
+
+        if rng.random() < settings.error_rate:
+            status = rng.choice(settings.error_statuses)
+            self._count(f"error_{status}")
+            headers = {"retry-after": "0"} if status == 429 else None
+            handler._send(status, {"error": {"message": "mock error", "type": "server_error"}}, headers)
+            return
+
+        text = json.dumps(normalize_like_model(items), ensure_ascii=False)
+        if rng.random() < settings.malformed_rate:
+            # 중간에 끊긴 JSON
+            self._count("malformed")
+            text = text[: max(1, len(text) // 2)]
+
+        payload = response_body(text, request.get("model", ""), request.get("max_output_tokens"), len(prompt))
+        if payload["status"] == "incomplete":
+            self._count("truncated")
+        handler._send(200, payload)
+
+    def start(self) -> "MockOpenAIServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="날짜 정규화용 OpenAI Responses API 스텁")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.2, help="요청당 기본 지연 (초)")
+    parser.add_argument("--latency-per-item", type=float, default=0.005, help="날짜 하나당 추가 지연 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="429/500/503 오류 응답 비율")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="깨진 JSON 응답 비율")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    settings = MockSettings(args.latency, args.latency_per_item, args.error_rate, malformed_rate=args.malformed_rate, seed=args.seed)
+    server = MockOpenAIServer(settings, args.host, args.port)
+    print(f"OPENAI_BASE_URL={server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(dict(server.stats))
+
+
+if __name__ == "__main__":
+    main()
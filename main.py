@@ -1,6 +1,212 @@
-def main():
-    print("Hello from automation-v1!")
+#!/usr/bin/env python3
+"""
+송장 자동화 명령줄 실행 (Streamlit 없이 utils/의 처리 함수를 바로 호출, cron 등에서 사용)
+사용법:
+  python main.py coupang-cj 쿠팡.xlsx [쿠팡2.xlsx ...] [-o 결과.xlsx] [-p 비밀번호]
+  python main.py coupang-bulk --raw 쿠팡.xlsx [...] --cj 파일접수.xlsx [...]
+  python main.py naver-cj 네이버.xlsx [...] [--api-key KEY]
+  python main.py naver-bulk --raw 네이버.xlsx [...] --cj 파일접수.xlsx [...]
+여러 파일을 넘기면 하나로 합쳐서 처리합니다. (-o를 생략하면 화면과 같은 이름으로 현재 폴더에 저장)
+"""
+import argparse
+import datetime as dt
+import os
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+from utils.ai_replay import RecordingClient, ReplayClient
+from utils.batch_processor import bulk_file_stats, file_row_counts, read_excel_batch
+from utils.config import get_date_normalization_concurrency, get_openai_api_key
+from utils.coupang_processor import (
+    COUPANG_BULK_CJ_COLUMNS,
+    COUPANG_BULK_RAW_COLUMNS,
+    COUPANG_CJ_COLUMNS,
+    build_coupang_bulk,
+    build_coupang_cj,
+    get_sender_defaults,
+)
+from utils.excel_utils import write_excel
+from utils.naver_processor import (
+    NAVER_BULK_CJ_COLUMNS,
+    NAVER_BULK_RAW_COLUMNS,
+    NAVER_INTERMEDIATE_COLUMNS,
+    build_naver_bulk,
+    create_naver_intermediate_table,
+    create_openai_client,
+    generate_cj_orders_by_date,
+    normalize_dates_batch,
+)
+from utils.perf_trace import collect_trace, write_trace_log
+
+
+def _save(df: pd.DataFrame, output: Path | None, default_name: str, sheet_name: str = "Sheet1") -> Path:
+    path = output or Path(default_name)
+    write_excel(df, path, sheet_name=sheet_name)
+    return path
+
+
+def _print_stats(stats: pd.DataFrame) -> None:
+    """파일이 여러 개일 때 파일별 결과를 출력합니다."""
+    if len(stats) > 1:
+        print(stats.to_string(index=False))
+
+
+def _log(message: str) -> None:
+    print(message, file=sys.stderr)
+
+
+def run_coupang_cj(args) -> int:
+    df = read_excel_batch(args.raw, args.password, columns=COUPANG_CJ_COLUMNS)
+    sorted_df = df.sort_values("업체상품코드").reset_index(drop=True)
+    result_df = build_coupang_cj(sorted_df, get_sender_defaults())
+    path = _save(result_df, args.output, f"쿠팡_CJ발주서_{dt.datetime.now():%y%m%d}.xlsx")
+    print(f"작업 완료: {path} ({len(result_df)}건)")
+    _print_stats(file_row_counts(df))
+    return 0
+
+
+def run_coupang_bulk(args) -> int:
+    df_raw = read_excel_batch(args.raw, args.password, columns=COUPANG_BULK_RAW_COLUMNS)
+    df_cj = read_excel_batch(args.cj, args.cj_password, columns=COUPANG_BULK_CJ_COLUMNS)
+    result_df = build_coupang_bulk(df_raw, df_cj)
+    match_count = result_df["운송장번호"].fillna("").astype(str).str.strip().ne("").sum()
+    if match_count == 0:
+        _log("주문번호 매칭 결과가 0건입니다. 두 파일의 주문번호/고객주문번호를 확인하세요.")
+        return 1
+
+    path = _save(result_df, args.output, f"쿠팡_대량등록_{dt.datetime.now():%y%m%d}.xlsx")
+    print(f"작업 완료: {path} (운송장 매칭 {match_count}/{len(result_df)})")
+    _print_stats(bulk_file_stats(df_raw, result_df, "주문번호", "주문번호", "운송장번호", remove_whitespace=False))
+    return 0
+
+
+def run_naver_cj(args) -> int:
+    api_key = args.api_key or os.environ.get("OPENAI_API_KEY") or get_openai_api_key()
+    if not api_key and not args.replay:
+        _log("OpenAI API 키가 필요합니다. --api-key, OPENAI_API_KEY 환경 변수 또는 config.json에 설정하세요.")
+        return 1
+
+    # 녹화 파일을 재생하면 API 키와 네트워크 없이 같은 응답으로 다시 실행할 수 있음
+    client = None
+    if args.replay:
+        client = ReplayClient(args.replay)
+    elif args.record:
+        client = RecordingClient(create_openai_client(api_key), args.record)
+
+    df = read_excel_batch(args.raw, args.password, header=1, columns=NAVER_INTERMEDIATE_COLUMNS)
+    intermediate = create_naver_intermediate_table(df, api_key)
+
+    def update_progress(current, total):
+        _log(f"날짜 변환 중... (배치 {current}/{total})")
+
+    max_workers = args.max_workers or get_date_normalization_concurrency()
+    intermediate = normalize_dates_batch(intermediate, api_key, update_progress, max_workers=max_workers, client=client)
+    failed = intermediate["도착희망날짜_정규화"].astype(str).str.startswith("오류")
+
+    result = generate_cj_orders_by_date(intermediate, get_sender_defaults())["single"]
+    path = _save(result["df"], args.output, result["filename"])
+    print(f"작업 완료: {path} ({result['count']}건)")
+    _print_stats(file_row_counts(df))
+
+    # 파일은 확인용으로 남기되, 날짜 변환이 실패한 건이 있으면 cron 등에서 알 수 있도록 실패로 종료
+    if failed.any():
+        _log(f"⚠️ 날짜 변환 실패 {int(failed.sum())}건 (발주서 품목명을 확인하세요)")
+        return 1
+    return 0
+
+
+def run_naver_bulk(args) -> int:
+    df_raw = read_excel_batch(args.raw, args.password, header=1, columns=NAVER_BULK_RAW_COLUMNS)
+    df_cj = read_excel_batch(args.cj, args.cj_password, columns=NAVER_BULK_CJ_COLUMNS)
+    result_df, debug_info = build_naver_bulk(df_raw, df_cj)
+    match_count = debug_info["matched_count"]
+    total = debug_info["total_count"]
+    if match_count == 0:
+        _log("주문번호 매칭 결과가 0건입니다. 두 파일의 상품주문번호/고객주문번호를 확인하세요.")
+        if "unmatched" in debug_info:
+            _log(f"매칭 안 된 주문번호 예: {', '.join(map(str, debug_info['unmatched']))}")
+        return 1
+
+    invoice_filled_count = result_df["송장번호"].fillna("").astype(str).str.strip().ne("").sum()
+    if invoice_filled_count == 0:
+        _log(f"⚠️ 주문번호는 {match_count}건 매칭되었으나, CJ 파일에 운송장번호 데이터가 없습니다.")
+
+    path = _save(result_df, args.output, f"네이버_대량등록_{dt.datetime.now():%y%m%d}.xlsx", sheet_name="발송처리")
+    print(f"작업 완료: {path} (주문번호 매칭 {match_count}/{total}, 송장번호 {invoice_filled_count}건)")
+    _print_stats(bulk_file_stats(df_raw, result_df, "상품주문번호", "상품주문번호", "송장번호"))
+    return 0
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("1 이상이어야 합니다")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="main.py", description="송장 자동화 명령줄 실행")
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="단계별 메모리 최대 증가량도 logs/perf.jsonl에 기록 (tracemalloc 사용으로 처리가 느려짐)",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add_common(sub):
+        sub.add_argument("-o", "--output", type=Path, help="결과 파일 경로 (기본값: 현재 폴더에 화면과 같은 파일명)")
+        sub.add_argument("-p", "--password", help="로우데이터 파일 비밀번호 (기본값: 1111 시도)")
+
+    def add_bulk(sub):
+        sub.add_argument("--raw", nargs="+", required=True, type=Path, help="로우데이터 파일 (여러 개 가능)")
+        sub.add_argument("--cj", nargs="+", required=True, type=Path, help="파일접수 상세내역 파일 (여러 개 가능)")
+        sub.add_argument("--cj-password", help="파일접수 상세내역 파일 비밀번호 (기본값: 1111 시도)")
+        add_common(sub)
+
+    sub = subparsers.add_parser("coupang-cj", help="쿠팡 로우데이터 → CJ 발주서")
+    sub.add_argument("raw", nargs="+", type=Path, help="쿠팡 로우데이터 파일 (여러 개 가능)")
+    add_common(sub)
+    sub.set_defaults(func=run_coupang_cj)
+
+    sub = subparsers.add_parser("coupang-bulk", help="쿠팡 로우데이터 + 파일접수 상세내역 → 대량등록")
+    add_bulk(sub)
+    sub.set_defaults(func=run_coupang_bulk)
+
+    sub = subparsers.add_parser("naver-cj", help="네이버 로우데이터 → CJ 발주서 (AI 날짜 정규화)")
+    sub.add_argument("raw", nargs="+", type=Path, help="네이버 로우데이터 파일 (여러 개 가능)")
+    sub.add_argument("--api-key", help="OpenAI API 키 (기본값: OPENAI_API_KEY 환경 변수 또는 config.json)")
+    sub.add_argument(
+        "--max-workers",
+        type=_positive_int,
+        help="동시에 보낼 AI 날짜 변환 요청 수 (기본값: config.json의 date_normalization_concurrency 또는 4, 속도 제한에 걸리면 낮추세요)",
+    )
+    replay = sub.add_mutually_exclusive_group()
+    replay.add_argument("--record", type=Path, help="AI 응답을 기록할 JSONL 파일")
+    replay.add_argument("--replay", type=Path, help="--record로 기록한 응답을 API 대신 재생")
+    add_common(sub)
+    sub.set_defaults(func=run_naver_cj)
+
+    sub = subparsers.add_parser("naver-bulk", help="네이버 로우데이터 + 파일접수 상세내역 → 대량등록")
+    add_bulk(sub)
+    sub.set_defaults(func=run_naver_bulk)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        # 단계별 실행 시간/메모리는 logs/perf.jsonl에 기록
+        with collect_trace(f"cli:{args.command}", memory=args.trace_memory) as trace:
+            code = args.func(args)
+        write_trace_log(trace)
+        return code
+    except Exception as e:
+        _log(f"처리 중 오류가 발생했습니다: {e}")
+        return 1
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
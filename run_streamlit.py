@@ -5,14 +5,20 @@
 """
 import sys
 import os
+import multiprocessing
 import webbrowser
 import time
 import subprocess
-import threading
 import tkinter as tk
 from tkinter import ttk
 from pathlib import Path
 
+from utils.launcher import is_server_ready, next_poll_interval
+
+# PyInstaller로 빌드된 실행 파일에서 엑셀 병렬 읽기(ProcessPoolExecutor) 작업 프로세스가
+# 런처를 다시 실행하지 않도록 가장 먼저 호출
+multiprocessing.freeze_support()
+
 # PyInstaller로 패키징된 경우 리소스 경로 설정
 if getattr(sys, 'frozen', False):
     # PyInstaller로 실행되는 경우
@@ -44,11 +50,16 @@ if os.environ.get("RUN_AS_STREAMLIT") == "1":
 
 # 전역 변수로 스트림릿 프로세스 관리
 streamlit_process = None
+server_started_at = None
 APP_URL = "http://localhost:8501"
+# 이 시간 안에 헬스 체크에 응답하지 않으면 시작 실패로 표시
+SERVER_START_TIMEOUT = 60
 
 def start_streamlit():
     """Streamlit 서버를 백그라운드로 시작"""
-    global streamlit_process
+    global streamlit_process, server_started_at
+
+    server_started_at = time.monotonic()
 
     # PyInstaller 빌드 시에는 자기 자신을 다시 실행하면 무한 생성되므로
     # 자식 프로세스에 플래그를 전달해 Streamlit만 실행하도록 함.
@@ -177,12 +188,13 @@ def create_gui():
     button_frame = ttk.Frame(main_frame)
     button_frame.pack(pady=10)
 
-    # 브라우저 열기 버튼
+    # 브라우저 열기 버튼 (서버가 준비되면 활성화)
     open_button = ttk.Button(
         button_frame,
         text="🌐 브라우저에서 열기",
         command=open_browser,
-        width=25
+        width=25,
+        state=tk.DISABLED
     )
     open_button.pack(pady=5)
 
@@ -204,22 +216,31 @@ def create_gui():
     )
     status_label.pack(pady=(20, 0))
 
-    # 서버 시작 확인 후 상태 업데이트
-    def check_server():
-        time.sleep(2)
-        status_label.config(text="✓ 서버 실행 중", foreground="green")
-
-    threading.Thread(target=check_server, daemon=True).start()
+    # 헬스 체크 주소를 짧은 간격부터 점점 늘려가며 확인하고, 준비되는 즉시 상태 업데이트
+    # (tkinter 위젯은 메인 스레드에서만 변경하도록 root.after로 예약)
+    def check_server(interval=None):
+        elapsed = time.monotonic() - server_started_at
+        if is_server_ready(APP_URL, timeout=0.2):
+            status_label.config(text=f"✓ 서버 실행 중 (시작 {elapsed:.1f}초)", foreground="green")
+            open_button.config(state=tk.NORMAL)
+            return
+        if streamlit_process.poll() is not None:
+            status_label.config(text="❌ 서버가 시작되지 못했습니다. 프로그램을 다시 실행해 주세요.", foreground="red")
+            return
+        if elapsed > SERVER_START_TIMEOUT:
+            status_label.config(text=f"⚠️ {SERVER_START_TIMEOUT}초 동안 서버 응답이 없습니다.", foreground="orange")
+            return
+        interval = next_poll_interval(interval)
+        root.after(int(interval * 1000), check_server, interval)
+
+    check_server()
 
     return root
 
 if __name__ == '__main__':
-    # Streamlit 서버 시작
+    # Streamlit 서버 시작 (준비 여부는 GUI에서 헬스 체크로 확인)
     start_streamlit()
 
-    # 잠시 대기 (서버 시작)
-    time.sleep(1)
-
     # GUI 생성 및 실행
     root = create_gui()
     root.mainloop()
@@ -5,8 +5,10 @@ ngrok을 사용해서 인터넷 어디서나 접속 가능하게 만들기
 """
 import subprocess
 import threading
-import time
-import webbrowser
+
+from utils.launcher import wait_for_server
+
+APP_URL = "http://localhost:8501"
 
 def start_streamlit():
     """Streamlit 서버 시작"""
@@ -21,7 +23,12 @@ def start_streamlit():
 
 def start_ngrok():
     """ngrok 터널 시작"""
-    time.sleep(3)  # Streamlit 서버가 시작될 때까지 대기
+    # Streamlit 서버가 헬스 체크에 응답할 때까지 대기
+    elapsed = wait_for_server(APP_URL)
+    if elapsed is None:
+        print("\n❌ Streamlit 서버가 시작되지 않았습니다. 위의 오류 메시지를 확인하세요.")
+        return
+    print(f"\n✓ Streamlit 서버 준비 완료 ({elapsed:.1f}초)")
 
     print("\n" + "=" * 60)
     print("🌍 ngrok 터널 생성 중...")
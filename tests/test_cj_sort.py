@@ -0,0 +1,67 @@
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.naver_processor import _cj_sort_order
+
+
+def _create_sort_key_reference(row):
+    """벡터화 이전의 행 단위 정렬 키 (결과 비교 기준)"""
+    date_str = str(row["도착희망날짜_정규화"]).strip()
+    option_code = str(row["옵션관리코드"]).strip()
+    if not re.match(r"^\d{1,2}/\d{1,2}$", date_str):
+        return (0, date_str, option_code)
+    month, day = date_str.split("/")
+    return (1, int(month), int(day), option_code)
+
+
+DATES = [
+    "10/02", "9/30", "10/8", "12/24", "01/05", " 10/1 ", "1/1",
+    "１０/２", "13/45", "10/002", "10-02", "10/", "최대한 빨리", "9월 30일 또는 10월 1일", "", None, np.nan,
+]
+CODES = ["A01", "A02", "B10", "B2", "C03", " D04", "", None, np.nan]
+
+
+def make_table(rows: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "도착희망날짜_정규화": rng.choice(np.array(DATES, dtype=object), rows),
+            "옵션관리코드": rng.choice(np.array(CODES, dtype=object), rows),
+        },
+        # 행 위치를 돌려주는지 확인하기 위해 기본이 아닌 인덱스 사용
+        index=rng.permutation(rows) * 10,
+    )
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_matches_reference_sort_keys(seed):
+    df = make_table(500, seed)
+    keys = [_create_sort_key_reference(row) for _, row in df.iterrows()]
+
+    order = _cj_sort_order(df["도착희망날짜_정규화"], df["옵션관리코드"])
+
+    # 같은 정렬 키끼리의 순서는 기존 정렬(불안정)에 따라 달라질 수 있으므로 행 순서가 아닌 키 순서로 비교
+    assert sorted(order.tolist()) == list(range(len(df)))
+    assert [keys[i] for i in order] == sorted(keys)
+
+
+def test_invalid_dates_first_then_month_day():
+    df = pd.DataFrame(
+        {
+            "도착희망날짜_정규화": ["10/8", "9/30", "최대한 빨리", "10/02", "", "10/02"],
+            "옵션관리코드": ["A", "A", "A", "B", "A", "A"],
+        }
+    )
+
+    order = _cj_sort_order(df["도착희망날짜_정규화"], df["옵션관리코드"])
+
+    assert df.iloc[order]["도착희망날짜_정규화"].tolist() == ["", "최대한 빨리", "9/30", "10/02", "10/02", "10/8"]
+    assert df.iloc[order]["옵션관리코드"].tolist()[3:5] == ["A", "B"]
+
+
+def test_empty():
+    empty = pd.Series([], dtype=object)
+    assert _cj_sort_order(empty, empty).tolist() == []
@@ -0,0 +1,165 @@
+import json
+import re
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from utils import naver_processor
+from utils.ai_replay import RecordedResponse
+from utils.date_cache import DateNormalizationCache
+from utils.naver_processor import (
+    _BatchResponseError,
+    _request_date_batch,
+    normalize_dates_batch,
+    normalize_dates_batch_with_ai,
+)
+
+# 프롬프트의 "입력: [...]" 줄 (benchmarks/mock_openai_server.py와 같은 방식)
+INPUT_PATTERN = re.compile(r"입력: (\[.*\])")
+
+
+def convert(text: str) -> str:
+    return f"변환:{text}"
+
+
+def results_json(results: list[dict]) -> RecordedResponse:
+    return RecordedResponse(json.dumps({"results": results}, ensure_ascii=False))
+
+
+def correct(items: list[dict]) -> RecordedResponse:
+    return results_json([{"index": item["index"], "normalized": convert(item["text"])} for item in items])
+
+
+class StubClient:
+    """ReplayClient처럼 responses.create(**kwargs)만 가진 클라이언트. respond(items, call_number)로 응답을 만듦"""
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.batch_sizes: list[int] = []
+        self._lock = threading.Lock()
+
+    @property
+    def responses(self):
+        return self
+
+    def create(self, **kwargs):
+        items = json.loads(INPUT_PATTERN.search(kwargs["input"]).group(1))
+        with self._lock:
+            self.batch_sizes.append(len(items))
+            call_number = len(self.batch_sizes)
+        return self.respond(items, call_number)
+
+
+def fail_over(limit: int, failure: str):
+    """limit개보다 큰 배치는 잘린 응답 또는 깨진 JSON으로 실패"""
+
+    def respond(items, call_number):
+        if len(items) <= limit:
+            return correct(items)
+        if failure == "truncated":
+            return RecordedResponse('{"results": [{"index": 0', "incomplete", "max_output_tokens")
+        return RecordedResponse('{"results": [')
+
+    return respond
+
+
+DATES = [f"{i % 12 + 1}월 {i % 28 + 1}일 오전 도착 #{i}" for i in range(23)]
+
+
+@pytest.mark.parametrize("failure", ["truncated", "malformed"])
+@pytest.mark.parametrize("limit", [1, 3, 8])
+def test_split_retry_returns_every_date_in_order(limit, failure):
+    client = StubClient(fail_over(limit, failure))
+
+    mapping = normalize_dates_batch_with_ai("unused", DATES, client)
+
+    assert list(mapping) == DATES
+    assert list(mapping.values()) == [convert(d) for d in DATES]
+    # 첫 요청은 전체 배치, 성공한 요청들은 날짜를 한 번씩만 포함
+    assert client.batch_sizes[0] == len(DATES)
+    assert sum(size for size in client.batch_sizes if size <= limit) == len(DATES)
+
+
+def test_single_date_that_keeps_failing_becomes_error():
+    client = StubClient(fail_over(0, "truncated"))
+
+    mapping = normalize_dates_batch_with_ai("unused", DATES[:3], client)
+
+    assert list(mapping) == DATES[:3]
+    assert all(value.startswith("오류: 응답 잘림") for value in mapping.values())
+
+
+def test_split_results_land_on_their_rows(tmp_path):
+    df = pd.DataFrame({"도착희망날짜_원본": DATES[::-1] + DATES[:5] + [None]})
+    cache = DateNormalizationCache(naver_processor.DATE_NORMALIZATION_VERSION, path=tmp_path / "cache.sqlite3")
+
+    result = normalize_dates_batch(df, "unused", cache=cache, client=StubClient(fail_over(4, "truncated")))
+
+    expected = [convert(d) for d in df["도착희망날짜_원본"][:-1]] + [""]
+    assert result["도착희망날짜_정규화"].tolist() == expected
+
+
+def missing_index(items):
+    return correct(items[:-1])
+
+
+def duplicate_index(items):
+    # 항목 수는 맞지만 마지막 번호 대신 첫 번호가 두 번 옴
+    results = [{"index": item["index"], "normalized": convert(item["text"])} for item in items]
+    results[-1]["index"] = 0
+    return results_json(results)
+
+
+def out_of_range_index(items):
+    results = [{"index": item["index"] + 1, "normalized": convert(item["text"])} for item in items]
+    return results_json(results)
+
+
+BAD_INDEXES = [missing_index, duplicate_index, out_of_range_index]
+
+
+@pytest.mark.parametrize("bad_response", BAD_INDEXES)
+def test_rejects_mismatched_indexes(bad_response):
+    client = StubClient(lambda items, call_number: bad_response(items))
+
+    with pytest.raises(_BatchResponseError, match="결과 번호 불일치"):
+        _request_date_batch(client, DATES[:5])
+
+
+@pytest.mark.parametrize("bad_response", BAD_INDEXES)
+def test_mismatched_indexes_are_retried_not_misassigned(bad_response):
+    # 첫 요청만 번호가 어긋나고, 나눠서 다시 보낸 요청은 정상 응답
+    client = StubClient(lambda items, call_number: bad_response(items) if call_number == 1 else correct(items))
+
+    mapping = normalize_dates_batch_with_ai("unused", DATES[:5], client)
+
+    assert client.batch_sizes == [5, 2, 3]
+    assert mapping == {date: convert(date) for date in DATES[:5]}
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_max_workers_limits_concurrent_requests(tmp_path, max_workers):
+    active, peak = 0, 0
+    lock = threading.Lock()
+
+    def respond(items, call_number):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+        return correct(items)
+
+    df = pd.DataFrame({"도착희망날짜_원본": DATES})
+    cache = DateNormalizationCache(naver_processor.DATE_NORMALIZATION_VERSION, path=tmp_path / "cache.sqlite3")
+
+    result = normalize_dates_batch(
+        df, "unused", cache=cache, max_workers=max_workers, client=StubClient(respond), batch_size=2
+    )
+
+    assert peak == max_workers
+    assert result["도착희망날짜_정규화"].tolist() == [convert(d) for d in DATES]
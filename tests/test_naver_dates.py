@@ -0,0 +1,41 @@
+import pytest
+
+from utils.naver_processor import normalize_date_locally
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("10월 2일", "10/02"),
+        ("2025-09-30", "09/30"),
+        ("2025.9.30", "09/30"),
+        ("9/30", "09/30"),
+        ("10.3", "10/03"),
+        ("10월 8일 수요일", "10/08"),
+        ("10/8(수)", "10/08"),
+        ("  26년 2월 28일 ", "02/28"),
+        ("2월 29일", "02/29"),
+        ("  ", ""),
+    ],
+)
+def test_resolves_clear_dates(text, expected):
+    assert normalize_date_locally(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        # 달력에 없는 날짜
+        "26년 2월 30일",
+        "2025-02-29",
+        "13/1",
+        "4월 31일",
+        # 모호하거나 날짜가 아닌 문구 (AI가 원문 유지 여부를 판단)
+        "9월 30일 또는 10월 1일",
+        "최대한 빨리",
+        "10월 초",
+        "10.3 오후 배송 희망",
+    ],
+)
+def test_leaves_uncertain_values_to_ai(text):
+    assert normalize_date_locally(text) is None
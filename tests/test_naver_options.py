@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.naver_processor import parse_naver_option, parse_naver_options
+
+
+def _parse_naver_option_reference(option_str) -> dict:
+    """벡터화 이전의 행 단위 split 구현 (결과 비교 기준)"""
+    result = {"보내시는분": "", "도착희망날짜_원본": "", "과일선물옵션": "", "크리스탈보자기": ""}
+    if pd.isna(option_str):
+        return result
+    for part in str(option_str).split(" / "):
+        if ":" in part:
+            key, value = part.split(":", 1)
+            key = key.strip()
+            value = value.strip()
+            if "보내시는 분" in key:
+                result["보내시는분"] = value
+            elif "도착 희망 날짜" in key or "도착희망날짜" in key:
+                result["도착희망날짜_원본"] = value
+            elif "과일 선물 옵션" in key or "과일선물옵션" in key:
+                result["과일선물옵션"] = value
+            elif "크리스탈 보자기" in key:
+                result["크리스탈보자기"] = value
+    return result
+
+
+OPTIONS = [
+    "보내시는 분: 홍길동 / 도착 희망 날짜: 10월 2일 / 과일 선물 옵션: 사과 5kg (특대) / 크리스탈 보자기: 추가 (+3,000원)",
+    "보내시는 분: 홍길동 / 도착 희망 날짜: 10월 2일 / 과일 선물 옵션: 사과 5kg (특대) / 크리스탈 보자기: 추가안함",
+    "선택: 기본 / 보내시는 분: 보낸이5 (주식회사 5) / 도착희망날짜(필수): 2025-09-30 / 과일선물옵션: 샤인머스캣 2kg",
+    # 값 안의 " / ", ":" 와 빈 값
+    "보내시는 분:  / 도착 희망 날짜: 추석 전까지: 꼭 / 과일 선물 옵션: 배 7.5kg / 선물용",
+    # 엑셀에서 붙여 넣은 탭/줄바꿈
+    "\t보내시는 분: 김철수\r\n / 도착 희망 날짜: 9/30\t / 크리스탈 보자기:\n추가 (+3,000원) \n",
+    # 같은 항목이 두 번이면 마지막 값
+    "도착 희망 날짜: 10/1 / 도착희망날짜: 10/2",
+    "구분자 없는 값",
+    "",
+    None,
+    np.nan,
+    pd.NA,
+    12345,
+]
+
+
+def expected_frame(options: pd.Series) -> pd.DataFrame:
+    return pd.DataFrame([_parse_naver_option_reference(v) for v in options], index=options.index, dtype=object)
+
+
+def test_matches_reference_on_edge_cases():
+    options = pd.Series(OPTIONS, dtype=object)
+
+    actual = parse_naver_options(options)
+
+    pd.testing.assert_frame_equal(actual, expected_frame(options))
+
+
+def test_repeated_values_and_index():
+    # 반복되는 값(factorize)과 기본이 아닌 인덱스, 빈 값만 있는 컬럼
+    options = pd.Series(OPTIONS * 3, index=range(100, 100 + len(OPTIONS) * 3), dtype=object)
+
+    pd.testing.assert_frame_equal(parse_naver_options(options), expected_frame(options))
+    empty = pd.Series([None, np.nan], dtype=object)
+    pd.testing.assert_frame_equal(parse_naver_options(empty), expected_frame(empty))
+
+
+@pytest.mark.parametrize("option", OPTIONS)
+def test_single_option_matches_reference(option):
+    assert parse_naver_option(option) == _parse_naver_option_reference(option)
+
+
+def test_wrap_value_keeps_price():
+    row = parse_naver_options(pd.Series([OPTIONS[0]])).iloc[0]
+    assert row["크리스탈보자기"] == "추가 (+3,000원)"
+    assert row["과일선물옵션"] == "사과 5kg (특대)"
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.order_utils import normalize_order_numbers
+
+
+def _normalize_order_reference(value, remove_whitespace=True):
+    """벡터화 이전의 값 단위 구현 (결과 비교 기준)"""
+    if pd.isna(value):
+        return ""
+    if isinstance(value, float):
+        return str(int(value))
+    if isinstance(value, int):
+        return str(value)
+    s = str(value).strip()
+    if remove_whitespace:
+        s = "".join(s.split())
+    if s.endswith(".0") and s.replace(".", "", 1).isdigit():
+        try:
+            return str(int(float(s)))
+        except Exception:
+            return s
+    return s
+
+
+PARITY_CASES = {
+    "int": pd.Series([2025100112345678, 1, 0]),
+    "float": pd.Series([2025100112345678.0, 1.0, np.nan, 12.7]),
+    "float_exponent": pd.Series([1.0e12, 1.5e12, 9.99e15, 1e3]),
+    "nan_only_float": pd.Series([np.nan, np.nan]),
+    "object_mixed": pd.Series(
+        [2025100112345678, 1.0, 1.0e12, "123.0", " 456 ", "78 9", "12\t34\n", None, np.nan, ".0", "A-1.0", "1.00", "x"],
+        dtype=object,
+    ),
+    "strings": pd.Series(["  2025100112345678 ", "2025 1001 1234 5678", "0.0", "", "abc"]),
+    "whitespace": pd.Series(["\t123\n", " 1 2 3 ", "123 .0", "1　234", "  ", "12.0 "], dtype=object),
+    # str.split()이 공백으로 보는 유니코드 문자 (전각 공백, NBSP 등)
+    "unicode_whitespace": pd.Series(
+        [f"{c}12{c}3.0{c}" for c in "\x0b\x0c\x1c\x1f\x85\xa0\u1680\u2000\u200a\u2028\u202f\u205f\u3000"],
+        dtype=object,
+    ),
+    "empty": pd.Series([], dtype=object),
+    "all_na": pd.Series([None, np.nan], dtype=object),
+}
+
+
+@pytest.mark.parametrize("remove_whitespace", [True, False])
+@pytest.mark.parametrize("name", list(PARITY_CASES))
+def test_matches_reference(name, remove_whitespace):
+    series = PARITY_CASES[name]
+    expected = [_normalize_order_reference(v, remove_whitespace) for v in series]
+    actual = normalize_order_numbers(series, remove_whitespace=remove_whitespace).tolist()
+    assert actual == expected
+
+
+def test_keeps_index():
+    series = pd.Series([1.0, "2"], index=[10, 20], dtype=object)
+    assert normalize_order_numbers(series).index.tolist() == [10, 20]
@@ -1,38 +1,40 @@
 import datetime as dt
-import io
 
-import pandas as pd
 import streamlit as st
 
-from utils.coupang_processor import build_coupang_bulk
-from utils.excel_utils import read_excel_with_password, render_password_input
+from utils.coupang_processor import COUPANG_BULK_CJ_COLUMNS, COUPANG_BULK_RAW_COLUMNS, build_coupang_bulk
+from utils.batch_processor import bulk_file_stats, read_excel_batch
+from utils.excel_utils import XLSX_MIME, excel_download, render_password_input
+from utils.result_store import compact_result
+from utils.session_store import EVICTED_MESSAGE, get_session_object, session_object_evicted, set_session_object
 
 
 def render_coupang_bulk():
     st.markdown("**쿠팡 로우데이터 + 파일접수 상세내역 업로드**")
+    st.caption("여러 파일을 함께 올리면 하나의 대량등록 파일로 합쳐서 처리합니다.")
 
-    raw_file = st.file_uploader(
-        "쿠팡 로우데이터 (.xlsx)", type=["xlsx"], accept_multiple_files=False, key="raw_coupang_bulk"
+    raw_files = st.file_uploader(
+        "쿠팡 로우데이터 (.xlsx)", type=["xlsx"], accept_multiple_files=True, key="raw_coupang_bulk"
     )
     raw_password = None
-    if raw_file:
+    if raw_files:
         raw_password = render_password_input("raw_coupang", "로우데이터 파일 비밀번호")
 
-    cj_file = st.file_uploader(
-        "파일접수 상세내역 (.xlsx)", type=["xlsx"], accept_multiple_files=False, key="cj_bulk"
+    cj_files = st.file_uploader(
+        "파일접수 상세내역 (.xlsx)", type=["xlsx"], accept_multiple_files=True, key="cj_bulk"
     )
     cj_password = None
-    if cj_file:
+    if cj_files:
         cj_password = render_password_input("cj_coupang_bulk", "파일접수 상세내역 파일 비밀번호")
 
-    files_key = (raw_file.name if raw_file else None, cj_file.name if cj_file else None)
+    files_key = (tuple(f.name for f in raw_files), tuple(f.name for f in cj_files))
     if files_key != st.session_state.last_bulk_names:
-        st.session_state.coupang_bulk_result = None
+        set_session_object("coupang_bulk_result", None)
         st.session_state.last_bulk_names = files_key
 
-    if raw_file:
+    if raw_files:
         try:
-            df_raw = read_excel_with_password(raw_file, raw_password)
+            df_raw = read_excel_batch(raw_files, raw_password, columns=COUPANG_BULK_RAW_COLUMNS)
             st.caption("로우데이터 미리보기 (최대 5행)")
             st.dataframe(df_raw.head(5), width="stretch")
         except Exception as e:
@@ -41,9 +43,9 @@ def render_coupang_bulk():
     else:
         df_raw = None
 
-    if cj_file:
+    if cj_files:
         try:
-            df_cj = read_excel_with_password(cj_file, cj_password)
+            df_cj = read_excel_batch(cj_files, cj_password, columns=COUPANG_BULK_CJ_COLUMNS)
             st.caption("파일접수 상세내역 미리보기 (최대 5행)")
             st.dataframe(df_cj.head(5), width="stretch")
         except Exception as e:
@@ -60,37 +62,38 @@ def render_coupang_bulk():
                 total = len(result_df)
                 if match_count == 0:
                     st.warning("주문번호 매칭 결과가 0건입니다. 두 파일의 주문번호/고객주문번호를 확인하세요.")
-                    st.session_state.coupang_bulk_result = None
+                    set_session_object("coupang_bulk_result", None)
                     return
 
-                buf = io.BytesIO()
-                result_df.to_excel(buf, index=False)
-                buf.seek(0)
                 filename = f"쿠팡_대량등록_{dt.datetime.now():%y%m%d}.xlsx"
-                st.session_state.coupang_bulk_result = {
-                    "df": result_df,
-                    "data": buf.getvalue(),
-                    "name": filename,
-                    "match": match_count,
-                    "total": total,
-                }
+                file_stats = bulk_file_stats(df_raw, result_df, "주문번호", "주문번호", "운송장번호", remove_whitespace=False)
+                set_session_object(
+                    "coupang_bulk_result",
+                    compact_result(result_df, name=filename, match=match_count, total=total, file_stats=file_stats),
+                )
                 st.success(f"작업 완료: {filename} (운송장 매칭 {match_count}/{total})")
             except Exception as e:
                 st.error(f"처리 중 오류가 발생했습니다: {e}")
 
-    result = st.session_state.get("coupang_bulk_result")
+    result = get_session_object("coupang_bulk_result")
+    if result is None and session_object_evicted("coupang_bulk_result"):
+        st.info(EVICTED_MESSAGE)
     if result:
         st.markdown("---")
         st.markdown("**작업 결과 미리보기 (상위 10행)**")
-        st.dataframe(result["df"].head(10), width="stretch")
+        st.dataframe(result["frame"].preview.head(10), width="stretch")
         match = result.get("match")
         total = result.get("total")
         if match is not None and total is not None:
             st.caption(f"운송장번호 매칭 결과: {match}/{total}")
+        file_stats = result.get("file_stats")
+        if file_stats is not None and len(file_stats) > 1:
+            st.caption("파일별 매칭 결과")
+            st.dataframe(file_stats, width="stretch", hide_index=True)
         st.download_button(
             "다운로드: 쿠팡 대량등록",
-            data=result["data"],
+            data=excel_download(result["frame"]),
             file_name=result["name"],
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            mime=XLSX_MIME,
             type="primary",
         )
@@ -1,30 +1,33 @@
 import datetime as dt
-import io
 
-import pandas as pd
 import streamlit as st
 
-from utils.coupang_processor import build_coupang_cj, get_sender_defaults
-from utils.excel_utils import read_excel_with_password, render_password_input
+from utils.coupang_processor import COUPANG_CJ_COLUMNS, build_coupang_cj, get_sender_defaults
+from utils.batch_processor import file_row_counts, read_excel_batch
+from utils.excel_utils import XLSX_MIME, excel_download, render_password_input
+from utils.result_store import compact_result
+from utils.session_store import EVICTED_MESSAGE, get_session_object, session_object_evicted, set_session_object
 
 
 def render_coupang_cj():
     st.markdown("**쿠팡 로우데이터 업로드**")
+    st.caption("여러 파일을 함께 올리면 하나의 발주서로 합쳐서 처리합니다.")
     uploaded = st.file_uploader(
-        "쿠팡 로우데이터 엑셀 파일 (.xlsx)", type=["xlsx"], accept_multiple_files=False
+        "쿠팡 로우데이터 엑셀 파일 (.xlsx)", type=["xlsx"], accept_multiple_files=True
     )
 
     password = None
     if uploaded:
         password = render_password_input("coupang_cj", "파일 비밀번호")
 
-    if uploaded and uploaded.name != st.session_state.last_uploaded_name:
-        st.session_state.coupang_cj_result = None
-        st.session_state.last_uploaded_name = uploaded.name
+    uploaded_names = tuple(f.name for f in uploaded)
+    if uploaded and uploaded_names != st.session_state.last_uploaded_name:
+        set_session_object("coupang_cj_result", None)
+        st.session_state.last_uploaded_name = uploaded_names
 
     if uploaded:
         try:
-            df = read_excel_with_password(uploaded, password)
+            df = read_excel_batch(uploaded, password, columns=COUPANG_CJ_COLUMNS)
             st.caption("업로드 파일 미리보기 (최대 5행)")
             st.dataframe(df.head(5), width="stretch")
         except Exception as e:
@@ -40,28 +43,29 @@ def render_coupang_cj():
                 defaults = get_sender_defaults()
                 sorted_df = df.sort_values("업체상품코드").reset_index(drop=True)
                 result_df = build_coupang_cj(sorted_df, defaults)
-                buf = io.BytesIO()
-                result_df.to_excel(buf, index=False)
-                buf.seek(0)
                 filename = f"쿠팡_CJ발주서_{dt.datetime.now():%y%m%d}.xlsx"
-                st.session_state.coupang_cj_result = {
-                    "df": result_df,
-                    "data": buf.getvalue(),
-                    "name": filename,
-                }
+                set_session_object(
+                    "coupang_cj_result", compact_result(result_df, name=filename, file_stats=file_row_counts(df))
+                )
                 st.success(f"작업 완료: {filename}")
             except Exception as e:
                 st.error(f"처리 중 오류가 발생했습니다: {e}")
 
-    result = st.session_state.get("coupang_cj_result")
+    result = get_session_object("coupang_cj_result")
+    if result is None and session_object_evicted("coupang_cj_result"):
+        st.info(EVICTED_MESSAGE)
     if result:
         st.markdown("---")
         st.markdown("**작업 결과 미리보기 (상위 10행)**")
-        st.dataframe(result["df"].head(10), width="stretch")
+        st.dataframe(result["frame"].preview.head(10), width="stretch")
+        file_stats = result.get("file_stats")
+        if file_stats is not None and len(file_stats) > 1:
+            st.caption("파일별 처리 결과")
+            st.dataframe(file_stats, width="stretch", hide_index=True)
         st.download_button(
             "다운로드: 쿠팡 CJ 발주서",
-            data=result["data"],
+            data=excel_download(result["frame"]),
             file_name=result["name"],
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            mime=XLSX_MIME,
             type="primary",
         )
@@ -1,61 +1,76 @@
 import datetime as dt
-import io
 
-import pandas as pd
 import streamlit as st
 
-from utils.naver_processor import build_naver_bulk, clean_columns, _normalize_order
-from utils.excel_utils import read_excel_with_password, render_password_input
+from utils.naver_processor import (
+    NAVER_BULK_CJ_COLUMNS,
+    NAVER_BULK_RAW_COLUMNS,
+    build_naver_bulk,
+)
+from utils.batch_processor import bulk_file_stats, read_excel_batch
+from utils.config import get_trace_memory
+from utils.excel_utils import XLSX_MIME, excel_download, render_password_input
+from utils.perf_trace import collect_trace, write_trace_log
+from utils.result_store import compact_result
+from utils.session_store import EVICTED_MESSAGE, get_session_object, session_object_evicted, set_session_object
 
 
 def render_naver_bulk():
     st.markdown("**네이버 로우데이터 + 파일접수 상세내역 업로드**")
+    st.caption("여러 파일을 함께 올리면 하나의 대량등록 파일로 합쳐서 처리합니다.")
 
-    raw_file = st.file_uploader(
-        "네이버 로우데이터 (.xlsx)", type=["xlsx"], accept_multiple_files=False, key="raw_naver_bulk"
+    raw_files = st.file_uploader(
+        "네이버 로우데이터 (.xlsx)", type=["xlsx"], accept_multiple_files=True, key="raw_naver_bulk"
     )
     raw_password = None
-    if raw_file:
+    if raw_files:
         raw_password = render_password_input("raw_naver", "로우데이터 파일 비밀번호")
 
-    cj_file = st.file_uploader(
-        "파일접수 상세내역 (.xlsx)", type=["xlsx"], accept_multiple_files=False, key="cj_naver_bulk"
+    cj_files = st.file_uploader(
+        "파일접수 상세내역 (.xlsx)", type=["xlsx"], accept_multiple_files=True, key="cj_naver_bulk"
     )
     cj_password = None
-    if cj_file:
+    if cj_files:
         cj_password = render_password_input("cj_naver", "파일접수 상세내역 파일 비밀번호")
 
-    files_key = (raw_file.name if raw_file else None, cj_file.name if cj_file else None)
+    files_key = (tuple(f.name for f in raw_files), tuple(f.name for f in cj_files))
     if files_key != st.session_state.last_naver_bulk_names:
-        st.session_state.naver_bulk_result = None
+        set_session_object("naver_bulk_result", None)
         st.session_state.last_naver_bulk_names = files_key
 
-    if raw_file:
-        try:
-            df_raw = read_excel_with_password(raw_file, raw_password, header=1)
-            st.caption("로우데이터 미리보기 (최대 5행)")
-            st.dataframe(df_raw.head(5), width="stretch")
-        except Exception as e:
-            st.error(f"로우데이터 파일을 읽는 중 오류가 발생했습니다: {e}")
+    # 읽기 단계는 재실행마다 측정하고, 작업 실행 시 처리 단계와 합쳐서 보여줌
+    # 메모리 측정은 config.json의 trace_memory가 true일 때만 (tracemalloc은 모든 세션을 느리게 함)
+    trace_memory = get_trace_memory()
+    with collect_trace("naver_bulk_read", memory=trace_memory) as read_trace:
+        if raw_files:
+            try:
+                df_raw = read_excel_batch(raw_files, raw_password, header=1, columns=NAVER_BULK_RAW_COLUMNS)
+                st.caption("로우데이터 미리보기 (최대 5행)")
+                st.dataframe(df_raw.head(5), width="stretch")
+            except Exception as e:
+                st.error(f"로우데이터 파일을 읽는 중 오류가 발생했습니다: {e}")
+                df_raw = None
+        else:
             df_raw = None
-    else:
-        df_raw = None
-
-    if cj_file:
-        try:
-            df_cj = read_excel_with_password(cj_file, cj_password)
-            st.caption("파일접수 상세내역 미리보기 (최대 5행)")
-            st.dataframe(df_cj.head(5), width="stretch")
-        except Exception as e:
-            st.error(f"파일접수 상세내역 파일을 읽는 중 오류가 발생했습니다: {e}")
+
+        if cj_files:
+            try:
+                df_cj = read_excel_batch(cj_files, cj_password, columns=NAVER_BULK_CJ_COLUMNS)
+                st.caption("파일접수 상세내역 미리보기 (최대 5행)")
+                st.dataframe(df_cj.head(5), width="stretch")
+            except Exception as e:
+                st.error(f"파일접수 상세내역 파일을 읽는 중 오류가 발생했습니다: {e}")
+                df_cj = None
+        else:
             df_cj = None
-    else:
-        df_cj = None
 
     if df_raw is not None and df_cj is not None:
         if st.button("작업 실행", type="primary"):
             try:
-                result_df, debug_info = build_naver_bulk(df_raw, df_cj)
+                with collect_trace("naver_bulk", memory=trace_memory) as trace:
+                    result_df, debug_info = build_naver_bulk(df_raw, df_cj)
+                trace.stages[:0] = read_trace.stages
+                write_trace_log(trace)
                 # 주문번호 매칭 결과는 debug_info에서 가져옴
                 match_count = debug_info['matched_count']
                 total = debug_info['total_count']
@@ -97,42 +112,52 @@ def render_naver_bulk():
                         for i, key in enumerate(debug_info["cj_keys_sample"]):
                             st.code(f"{i+1}. '{key}'")
 
+                with st.expander("⏱ 성능"):
+                    st.caption(f"전체 {trace.total_seconds:.2f}초 (읽기 단계는 캐시된 파일이면 짧게 표시됩니다)")
+                    records = trace.to_records()
+                    if not trace.memory:
+                        st.caption("단계별 메모리는 config.json에 \"trace_memory\": true를 설정하면 표시됩니다.")
+                        for record in records:
+                            record.pop("peak_mb")
+                    st.dataframe(records, width="stretch", hide_index=True)
+
                 if match_count == 0:
                     st.warning("주문번호 매칭 결과가 0건입니다. 위의 디버그 정보를 확인하세요.")
-                    st.session_state.naver_bulk_result = None
+                    set_session_object("naver_bulk_result", None)
                     return
 
                 if invoice_filled_count == 0:
                     st.warning(f"⚠️ 주문번호는 {match_count}건 매칭되었으나, CJ 파일에 운송장번호 데이터가 없습니다. CJ 파일을 확인하세요.")
 
-                buf = io.BytesIO()
-                result_df.to_excel(buf, index=False, sheet_name="발송처리")
-                buf.seek(0)
                 filename = f"네이버_대량등록_{dt.datetime.now():%y%m%d}.xlsx"
-                st.session_state.naver_bulk_result = {
-                    "df": result_df,
-                    "data": buf.getvalue(),
-                    "name": filename,
-                    "match": match_count,
-                    "total": total,
-                }
+                file_stats = bulk_file_stats(df_raw, result_df, "상품주문번호", "상품주문번호", "송장번호")
+                set_session_object(
+                    "naver_bulk_result",
+                    compact_result(result_df, name=filename, match=match_count, total=total, file_stats=file_stats),
+                )
                 st.success(f"작업 완료: {filename} (주문번호 매칭 {match_count}/{total}, 송장번호 {invoice_filled_count}건)")
             except Exception as e:
                 st.error(f"처리 중 오류가 발생했습니다: {e}")
 
-    result = st.session_state.get("naver_bulk_result")
+    result = get_session_object("naver_bulk_result")
+    if result is None and session_object_evicted("naver_bulk_result"):
+        st.info(EVICTED_MESSAGE)
     if result:
         st.markdown("---")
         st.markdown("**작업 결과 미리보기 (상위 10행)**")
-        st.dataframe(result["df"].head(10), width="stretch")
+        st.dataframe(result["frame"].preview.head(10), width="stretch")
         match = result.get("match")
         total = result.get("total")
         if match is not None and total is not None:
             st.caption(f"운송장번호 매칭 결과: {match}/{total}")
+        file_stats = result.get("file_stats")
+        if file_stats is not None and len(file_stats) > 1:
+            st.caption("파일별 매칭 결과")
+            st.dataframe(file_stats, width="stretch", hide_index=True)
         st.download_button(
             "다운로드: 네이버 대량등록",
-            data=result["data"],
+            data=excel_download(result["frame"], sheet_name="발송처리"),
             file_name=result["name"],
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            mime=XLSX_MIME,
             type="primary",
         )
@@ -1,14 +1,27 @@
-import pandas as pd
 import streamlit as st
 
-from utils.config import get_openai_api_key
+from utils.config import get_date_normalization_concurrency, get_openai_api_key
 from utils.coupang_processor import get_sender_defaults
 from utils.naver_processor import (
+    NAVER_INTERMEDIATE_COLUMNS,
     create_naver_intermediate_table,
     generate_cj_orders_by_date,
     normalize_dates_batch,
 )
-from utils.excel_utils import read_excel_with_password, render_password_input
+from utils.batch_processor import read_excel_batch
+from utils.excel_utils import XLSX_MIME, excel_download, render_password_input
+from utils.result_store import compact_result
+from utils.session_store import EVICTED_MESSAGE, get_session_object, session_object_evicted, set_session_object
+
+
+def _reset_workflow():
+    """처음 단계로 돌아가고 이 워크플로우의 작업 데이터를 정리합니다."""
+    st.session_state.naver_workflow_step = "upload"
+    set_session_object("naver_intermediate_table", None)
+    set_session_object("naver_raw_data", None)
+    set_session_object("naver_cj_result", None)
+    if "naver_intermediate_editor" in st.session_state:
+        del st.session_state.naver_intermediate_editor
 
 
 def render_naver_cj():
@@ -21,6 +34,13 @@ def render_naver_cj():
     steps = ["1️⃣ 파일 업로드", "2️⃣ 데이터 검수", "3️⃣ CJ 발주서 생성"]
     current_step = st.session_state.naver_workflow_step
 
+    if current_step != "upload" and get_session_object("naver_intermediate_table") is None:
+        # 서버 메모리 정리로 중간 테이블이 삭제된 경우 처음 단계부터 다시 진행
+        if session_object_evicted("naver_intermediate_table"):
+            st.info(EVICTED_MESSAGE)
+        _reset_workflow()
+        current_step = "upload"
+
     if current_step == "upload":
         step_idx = 0
     elif current_step == "review":
@@ -34,11 +54,12 @@ def render_naver_cj():
     if current_step == "upload":
         st.markdown("### 1️⃣ 네이버 로우데이터 업로드")
         st.caption("네이버 엑셀 파일은 첫 행에 안내문이 있으므로 자동으로 처리됩니다.")
+        st.caption("여러 파일을 함께 올리면 하나의 발주서로 합쳐서 처리합니다.")
 
         uploaded = st.file_uploader(
             "네이버 로우데이터 엑셀 파일 (.xlsx)",
             type=["xlsx"],
-            accept_multiple_files=False,
+            accept_multiple_files=True,
             key="naver_cj_uploader",
         )
 
@@ -48,10 +69,10 @@ def render_naver_cj():
 
         if uploaded:
             try:
-                df = read_excel_with_password(uploaded, password, header=1)
-                st.session_state.naver_raw_data = df
+                df = read_excel_batch(uploaded, password, header=1, columns=NAVER_INTERMEDIATE_COLUMNS)
+                set_session_object("naver_raw_data", df)
 
-                st.caption(f"✅ 파일 로드 완료: {len(df)}개 주문")
+                st.caption(f"✅ 파일 로드 완료: {len(uploaded)}개 파일, {len(df)}개 주문")
                 st.dataframe(df.head(5), width="stretch")
             except Exception as e:
                 st.error(f"파일을 읽는 중 오류가 발생했습니다: {e}")
@@ -64,7 +85,7 @@ def render_naver_cj():
             if st.button("다음 단계: 데이터 파싱 및 검수", type="primary"):
                 with st.spinner("옵션정보 파싱 중..."):
                     intermediate = create_naver_intermediate_table(df, api_key)
-                    st.session_state.naver_intermediate_table = intermediate
+                    set_session_object("naver_intermediate_table", intermediate)
                     st.session_state.naver_workflow_step = "review"
                     st.rerun()
 
@@ -72,7 +93,7 @@ def render_naver_cj():
         st.markdown("### 2️⃣ 데이터 검수 및 수정")
         st.caption("AI가 날짜를 정규화합니다. 검수 후 필요 시 수정하세요.")
 
-        intermediate = st.session_state.naver_intermediate_table
+        intermediate = get_session_object("naver_intermediate_table")
 
         if intermediate["도착희망날짜_정규화"].iloc[0] == "":
             if st.button("🤖 AI로 날짜 자동 변환", type="primary"):
@@ -93,6 +114,12 @@ def render_naver_cj():
                         with debug_container:
                             st.write("**📋 유니크 날짜 샘플 (처음 10개):**")
                             st.write(data)
+                    elif log_type == "local_result":
+                        with debug_container:
+                            st.info(
+                                f"⚡ AI 없이 로컬 변환: {data['resolved']}/{data['total']}개 "
+                                f"({data['hit_rate']:.0%})"
+                            )
                     elif log_type == "batch_start":
                         with debug_container:
                             st.write(f"⏳ {data}")
@@ -102,8 +129,14 @@ def render_naver_cj():
                             st.json(data["mapping"])
 
                 with st.spinner("AI로 날짜 정규화 중..."):
-                    intermediate = normalize_dates_batch(intermediate, api_key, update_progress, debug_log)
-                    st.session_state.naver_intermediate_table = intermediate
+                    intermediate = normalize_dates_batch(
+                        intermediate,
+                        api_key,
+                        update_progress,
+                        debug_log,
+                        max_workers=get_date_normalization_concurrency(),
+                    )
+                    set_session_object("naver_intermediate_table", intermediate)
                     if "naver_intermediate_editor" in st.session_state:
                         del st.session_state.naver_intermediate_editor
 
@@ -138,7 +171,7 @@ def render_naver_cj():
 
         st.markdown("---")
         st.markdown("**📊 날짜별 주문 통계**")
-        date_counts = st.session_state.naver_intermediate_table["도착희망날짜_정규화"].value_counts().sort_index()
+        date_counts = intermediate["도착희망날짜_정규화"].value_counts().sort_index()
         date_counts_df = date_counts.reset_index()
         date_counts_df.columns = ["날짜", "주문 수"]
         st.dataframe(date_counts_df, width="stretch")
@@ -146,33 +179,34 @@ def render_naver_cj():
         col1, col2 = st.columns(2)
         with col1:
             if st.button("← 처음부터 다시"):
-                st.session_state.naver_workflow_step = "upload"
-                st.session_state.naver_intermediate_table = None
-                st.session_state.naver_raw_data = None
-                if "naver_intermediate_editor" in st.session_state:
-                    del st.session_state.naver_intermediate_editor
+                _reset_workflow()
                 st.rerun()
         with col2:
             if next_clicked:
-                st.session_state.naver_intermediate_table = edited_df
+                set_session_object("naver_intermediate_table", edited_df)
                 st.session_state.naver_workflow_step = "generate"
                 st.rerun()
 
     elif current_step == "generate":
         st.markdown("### 3️⃣ CJ 발주서 생성")
 
-        intermediate = st.session_state.naver_intermediate_table
+        intermediate = get_session_object("naver_intermediate_table")
 
         if st.button("📦 CJ 발주서 생성", type="primary"):
             with st.spinner("CJ 발주서 생성 중..."):
                 defaults = get_sender_defaults()
                 results = generate_cj_orders_by_date(intermediate, defaults)
-                st.session_state.naver_cj_result = results
                 result = results.get("single")
                 if result:
+                    results["single"] = compact_result(
+                        result["df"], count=result["count"], filename=result["filename"]
+                    )
                     st.success(f"✅ CJ 발주서 생성 완료! (총 {result['count']}건)")
+                set_session_object("naver_cj_result", results)
 
-        results = st.session_state.get("naver_cj_result")
+        results = get_session_object("naver_cj_result")
+        if results is None and session_object_evicted("naver_cj_result"):
+            st.info(EVICTED_MESSAGE)
         if results:
             st.markdown("---")
             st.markdown("**📥 다운로드**")
@@ -181,19 +215,16 @@ def render_naver_cj():
             result = results.get("single")
             if result:
                 st.caption(f"✅ 총 {result['count']}건의 발주서가 생성되었습니다.")
-                st.dataframe(result["df"].head(20), width="stretch")
+                st.dataframe(result["frame"].preview, width="stretch")
                 st.download_button(
                     "다운로드: 네이버 CJ 발주서",
-                    data=result["data"],
+                    data=excel_download(result["frame"]),
                     file_name=result["filename"],
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                    mime=XLSX_MIME,
                     type="primary",
                 )
 
         st.markdown("---")
         if st.button("← 처음부터 다시"):
-            st.session_state.naver_workflow_step = "upload"
-            st.session_state.naver_intermediate_table = None
-            st.session_state.naver_raw_data = None
-            st.session_state.naver_cj_result = None
+            _reset_workflow()
             st.rerun()
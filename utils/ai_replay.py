@@ -0,0 +1,95 @@
+import hashlib
+import json
+import threading
+from pathlib import Path
+
+
+def request_key(kwargs: dict) -> str:
+    """responses.create() 인자(model, input, max_output_tokens 등)로 만든 요청 식별 키"""
+    payload = json.dumps(kwargs, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class RecordedResponse:
+    """녹화 파일에서 읽은 응답 (Responses API 응답 중 날짜 정규화에 쓰는 속성만 가짐)"""
+
+    def __init__(self, output_text: str, status: str = "completed", incomplete_reason: str | None = None):
+        self.output_text = output_text
+        self.status = status
+        self.incomplete_details = {"reason": incomplete_reason} if incomplete_reason else None
+
+
+class ReplayMissError(LookupError):
+    """재생 모드에서 녹화되지 않은 요청을 받았을 때 발생"""
+
+
+def _incomplete_reason(response) -> str | None:
+    details = getattr(response, "incomplete_details", None)
+    if isinstance(details, dict):
+        return details.get("reason")
+    return getattr(details, "reason", None)
+
+
+class RecordingClient:
+    """
+    실제 클라이언트로 요청을 보내고 응답을 JSONL 파일에 한 줄씩 기록합니다.
+
+    normalize_dates_batch(client=...)에 넘길 수 있으며, 기록한 파일은 ReplayClient로
+    네트워크 없이 같은 응답을 다시 재생할 수 있습니다. (오류 응답은 기록하지 않음)
+    """
+
+    def __init__(self, inner, path: str | Path):
+        self.inner = inner
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    @property
+    def responses(self):
+        return self
+
+    def create(self, **kwargs):
+        response = self.inner.responses.create(**kwargs)
+        entry = {
+            "key": request_key(kwargs),
+            "request": kwargs,
+            "output_text": response.output_text or "",
+            "status": getattr(response, "status", None) or "completed",
+            "incomplete_reason": _incomplete_reason(response),
+        }
+        line = json.dumps(entry, ensure_ascii=False, default=str)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        return response
+
+
+class ReplayClient:
+    """
+    RecordingClient가 기록한 JSONL 파일의 응답을 요청 내용 기준으로 돌려주는 클라이언트.
+
+    요청 순서나 동시 실행 수와 관계없이 같은 요청에는 같은 응답을 돌려주므로,
+    배치 크기 외의 설정(동시 요청 수, 재시도 정책 등)을 오프라인에서 반복 측정할 수 있습니다.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.recorded: dict[str, RecordedResponse] = {}
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                self.recorded[entry["key"]] = RecordedResponse(
+                    entry["output_text"], entry.get("status") or "completed", entry.get("incomplete_reason")
+                )
+
+    @property
+    def responses(self):
+        return self
+
+    def create(self, **kwargs):
+        try:
+            return self.recorded[request_key(kwargs)]
+        except KeyError:
+            raise ReplayMissError(f"녹화되지 않은 요청입니다 ({self.path.name})") from None
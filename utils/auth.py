@@ -1,6 +1,3 @@
-import bcrypt
-
-
 # TODO: 아래 해시값을 실제 비밀번호 해시로 교체하세요
 # Python 코드로 생성한 bcrypt 해시값을 여기에 붙여넣으세요
 ADMIN_USERNAME = "admin"
@@ -21,6 +18,8 @@ def verify_password(username: str, password: str) -> bool:
     if username != ADMIN_USERNAME:
         return False
 
+    import bcrypt
+
     try:
         password_bytes = password.encode('utf-8')
         hash_bytes = ADMIN_PASSWORD_HASH.encode('utf-8')
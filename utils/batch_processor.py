@@ -0,0 +1,100 @@
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utils.excel_utils import read_excel_files
+from utils.order_utils import normalize_order_numbers
+
+
+# 여러 파일을 합칠 때 각 행이 어느 파일에서 왔는지 기록하는 컬럼 (처리 함수들은 사용하지 않는 컬럼)
+SOURCE_FILE_COLUMN = "원본파일"
+SOURCE_ROW_COLUMN = "원본행"
+
+
+def file_name(file) -> str:
+    """업로드된 파일 객체 또는 파일 경로의 이름을 반환합니다."""
+    name = getattr(file, "name", None)
+    return Path(name if name else str(file)).name
+
+
+def read_excel_batch(files: Sequence, password=None, columns=None, **kwargs) -> pd.DataFrame:
+    """
+    여러 엑셀 파일을 병렬로 읽어 하나의 DataFrame으로 합칩니다.
+    각 행에는 원본 파일 이름(원본파일)과 파일 안에서의 행 번호(원본행, 1부터)가 추가됩니다.
+
+    Args:
+        files: 업로드된 파일 객체 또는 파일 경로 목록
+        password: 엑셀 파일 비밀번호 (모든 파일에 같은 값 사용)
+        columns: 읽을 컬럼 이름 목록 (기본값: 전체)
+        **kwargs: read_excel_files에 전달할 추가 인자 (예: header=1)
+
+    Returns:
+        pandas.DataFrame: 합쳐진 데이터 (파일 순서대로, 0부터 시작하는 인덱스)
+    """
+    frames = read_excel_files(files, password, columns=columns, **kwargs)
+    parts = []
+    for file, df in zip(files, frames):
+        # 파일마다 컬럼 이름 공백이 달라도 같은 컬럼으로 합쳐지도록 먼저 정리
+        df.columns = [str(c).strip() for c in df.columns]
+        df[SOURCE_FILE_COLUMN] = file_name(file)
+        df[SOURCE_ROW_COLUMN] = np.arange(1, len(df) + 1)
+        parts.append(df)
+    if not parts:
+        return pd.DataFrame(columns=[SOURCE_FILE_COLUMN, SOURCE_ROW_COLUMN])
+    return pd.concat(parts, ignore_index=True)
+
+
+def file_row_counts(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    합쳐진 데이터의 파일별 행 수를 반환합니다.
+
+    Returns:
+        pandas.DataFrame: 파일, 행 수 컬럼 (파일 순서대로)
+    """
+    counts = df[SOURCE_FILE_COLUMN].value_counts(sort=False)
+    return pd.DataFrame({"파일": counts.index, "행 수": counts.to_numpy()})
+
+
+def bulk_file_stats(
+    raw_df: pd.DataFrame,
+    result_df: pd.DataFrame,
+    raw_key_col: str,
+    result_key_col: str,
+    invoice_col: str,
+    remove_whitespace: bool = True,
+) -> pd.DataFrame:
+    """
+    대량등록 결과의 파일별 송장 매칭 통계를 계산합니다.
+    결과 행은 주문번호가 처음 나온 로우데이터 파일에 집계됩니다. (여러 파일에 같은 주문이 있으면 앞 파일)
+
+    Args:
+        raw_df: read_excel_batch로 합친 로우데이터
+        result_df: build_coupang_bulk / build_naver_bulk 결과
+        raw_key_col: 로우데이터 주문번호 컬럼 (예: "주문번호", "상품주문번호")
+        result_key_col: 결과 주문번호 컬럼
+        invoice_col: 결과 송장번호 컬럼 (예: "운송장번호", "송장번호")
+        remove_whitespace: 주문번호 정규화 시 공백 제거 여부 (처리 함수와 같은 값)
+
+    Returns:
+        pandas.DataFrame: 파일, 행 수, 주문 수, 송장 매칭, 매칭률 컬럼
+    """
+    raw_keys = normalize_order_numbers(raw_df[raw_key_col], remove_whitespace=remove_whitespace)
+    first = ~raw_keys.duplicated(keep="first").to_numpy()
+    source_by_key = pd.Series(raw_df[SOURCE_FILE_COLUMN].to_numpy()[first], index=raw_keys.to_numpy()[first])
+
+    matched = result_df[invoice_col].fillna("").astype(str).str.strip().ne("")
+    per_file = (
+        pd.DataFrame({"파일": result_df[result_key_col].map(source_by_key).to_numpy(), "matched": matched.to_numpy()})
+        .groupby("파일", sort=False)["matched"]
+        .agg(["size", "sum"])
+    )
+
+    stats = file_row_counts(raw_df)
+    orders = per_file["size"].reindex(stats["파일"]).fillna(0).astype(int).to_numpy()
+    matches = per_file["sum"].reindex(stats["파일"]).fillna(0).astype(int).to_numpy()
+    stats["주문 수"] = orders
+    stats["송장 매칭"] = matches
+    stats["매칭률"] = np.divide(matches, orders, out=np.zeros(len(orders)), where=orders > 0).round(3)
+    return stats
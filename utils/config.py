@@ -1,12 +1,22 @@
 import json
+import sys
 from pathlib import Path
 
-import streamlit as st
-
 
 CONFIG_FILE = Path("config.json")
 
 
+def _streamlit_secret(name: str):
+    """Return a Streamlit secret, or None (also when streamlit is not loaded, e.g. main.py CLI)."""
+    st = sys.modules.get("streamlit")
+    try:
+        if st is not None and hasattr(st, "secrets") and name in st.secrets:
+            return st.secrets[name]
+    except Exception:
+        pass
+    return None
+
+
 def load_config() -> dict:
     """Load configuration from disk."""
     if CONFIG_FILE.exists():
@@ -25,6 +35,8 @@ def save_config(config: dict) -> bool:
             json.dump(config, f, ensure_ascii=False, indent=2)
         return True
     except Exception as e:
+        import streamlit as st
+
         st.error(f"설정 저장 중 오류가 발생했습니다: {e}")
         return False
 
@@ -32,11 +44,9 @@ def save_config(config: dict) -> bool:
 def get_openai_api_key() -> str:
     """Return stored OpenAI API key if available."""
     # 1순위: Streamlit secrets
-    try:
-        if hasattr(st, "secrets") and "openai_api_key" in st.secrets:
-            return st.secrets["openai_api_key"]
-    except Exception:
-        pass
+    secret = _streamlit_secret("openai_api_key")
+    if secret is not None:
+        return secret
 
     # 2순위: config.json
     config = load_config()
@@ -48,3 +58,47 @@ def save_openai_api_key(api_key: str) -> bool:
     config = load_config()
     config["openai_api_key"] = api_key
     return save_config(config)
+
+
+DEFAULT_SESSION_MEMORY_BUDGET_MB = 1024
+
+
+def get_session_memory_budget_mb() -> int:
+    """Return the server-wide memory budget (MB) for per-session workflow data."""
+    # 1순위: Streamlit secrets
+    secret = _streamlit_secret("session_memory_budget_mb")
+    if secret is not None:
+        try:
+            return int(secret)
+        except (TypeError, ValueError):
+            pass
+
+    # 2순위: config.json
+    try:
+        return int(load_config().get("session_memory_budget_mb", DEFAULT_SESSION_MEMORY_BUDGET_MB))
+    except (TypeError, ValueError):
+        return DEFAULT_SESSION_MEMORY_BUDGET_MB
+
+
+def get_trace_memory() -> bool:
+    """Return whether the UI performance panel measures per-stage memory (tracemalloc, slows every session)."""
+    # 1순위: Streamlit secrets
+    value = _streamlit_secret("trace_memory")
+    # 2순위: config.json
+    if value is None:
+        value = load_config().get("trace_memory", False)
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    return bool(value)
+
+
+def get_date_normalization_concurrency() -> int | None:
+    """Return the configured number of concurrent AI date batches, or None to use the built-in default."""
+    # 1순위: Streamlit secrets, 2순위: config.json
+    value = _streamlit_secret("date_normalization_concurrency")
+    if value is None:
+        value = load_config().get("date_normalization_concurrency")
+    try:
+        return max(1, int(value)) if value is not None else None
+    except (TypeError, ValueError):
+        return None
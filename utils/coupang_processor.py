@@ -2,6 +2,64 @@ from pathlib import Path
 
 import pandas as pd
 
+from utils.excel_utils import read_template
+from utils.order_utils import match_order_keys, normalize_order_numbers
+
+
+# 각 파이프라인이 입력 파일에서 사용하는 컬럼 (read_excel_with_password(columns=...)로 필요한 컬럼만 읽음)
+COUPANG_CJ_COLUMNS = [
+    "수취인이름",
+    "수취인전화번호",
+    "수취인 주소",
+    "배송메세지",
+    "구매수(수량)",
+    "구매자",
+    "업체상품코드",
+    "주문번호",
+]
+COUPANG_BULK_RAW_COLUMNS = [
+    "번호",
+    "묶음배송번호",
+    "주문번호",
+    "운송장번호",
+    "분리배송 Y/N",
+    "분리배송 출고예정일",
+    "주문시 출고예정일",
+    "주문일",
+    "등록상품명",
+    "등록옵션명",
+    "노출상품명(옵션명)",
+    "노출상품ID",
+    "옵션ID",
+    "최초등록옵션명",
+    "최초등록등록상품명/옵션명",
+    "업체상품코드",
+    "바코드",
+    "결제액",
+    "배송비구분",
+    "배송비",
+    "도서산간 추가배송비",
+    "구매수(수량)",
+    "옵션판매가(판매단가)",
+    "구매자",
+    "구매자전화번호",
+    "수취인이름",
+    "수취인전화번호",
+    "우편번호",
+    "수취인 주소",
+    "배송메세지",
+    "상품별 추가메시지",
+    "주문자 추가메시지",
+    "배송완료일",
+    "구매확정일자",
+    "개인통관번호(PCCC)",
+    "통관용수취인전화번호",
+    "통관용구매자전화번호",
+    "기타",
+    "결제위치",
+]
+COUPANG_BULK_CJ_COLUMNS = ["고객주문번호", "주문번호", "운송장번호", "집화예정일자"]
+
 
 def get_sender_defaults() -> dict[str, str]:
     """Sender defaults read from example CJ file if available."""
@@ -11,14 +69,14 @@ def get_sender_defaults() -> dict[str, str]:
         "phone": "010-8238-0368",
         "address": "경기도 남양주시 별내동 718-1 a동(oen 옆)",
     }
-    if example_path.exists():
-        try:
-            sample = pd.read_excel(example_path)
+    try:
+        sample = read_template(example_path, nrows=1)
+        if sample is not None:
             defaults["name"] = str(sample.loc[0, "보내는분성명"])
             defaults["phone"] = str(sample.loc[0, "보내는분전화번호"])
             defaults["address"] = str(sample.loc[0, "보내는분주소(전체,분할)"])
-        except Exception:
-            pass
+    except Exception:
+        pass
     return defaults
 
 
@@ -66,56 +124,32 @@ def get_coupang_bulk_columns() -> list[str]:
         "기타",
         "결제위치",
     ]
-    if example_path.exists():
-        try:
-            cols = list(pd.read_excel(example_path, nrows=0).columns)
-            if cols:
-                return cols
-        except Exception:
-            pass
+    try:
+        template = read_template(example_path, nrows=0)
+        if template is not None and len(template.columns):
+            return list(template.columns)
+    except Exception:
+        pass
     return fallback
 
 
 def clean_columns(df: pd.DataFrame) -> pd.DataFrame:
     """Trim whitespace in column names to avoid merge mismatches."""
-    return df.rename(columns=lambda c: str(c).strip())
-
-
-def _normalize_order(value):
-    if pd.isna(value):
-        return ""
-    if isinstance(value, float):
-        return str(int(value))
-    if isinstance(value, int):
-        return str(value)
-    s = str(value).strip()
-    if s.endswith(".0") and s.replace(".", "", 1).isdigit():
-        try:
-            return str(int(float(s)))
-        except Exception:
-            return s
-    return s
+    # rename()은 모든 컬럼 데이터를 복사하므로 얕은 복사본의 컬럼 이름만 바꿈
+    df = df.copy(deep=False)
+    df.columns = [str(c).strip() for c in df.columns]
+    return df
 
 
 def build_coupang_cj(df: pd.DataFrame, defaults: dict[str, str]) -> pd.DataFrame:
     """Transform Coupang raw data into CJ order format."""
-    required_cols = [
-        "수취인이름",
-        "수취인전화번호",
-        "수취인 주소",
-        "배송메세지",
-        "구매수(수량)",
-        "구매자",
-        "업체상품코드",
-        "주문번호",
-    ]
-    missing = [c for c in required_cols if c not in df.columns]
+    missing = [c for c in COUPANG_CJ_COLUMNS if c not in df.columns]
     if missing:
         raise ValueError(f"누락된 필수 컬럼: {', '.join(missing)}")
 
     qty = pd.to_numeric(df["구매수(수량)"], errors="coerce").fillna(0).astype(int)
     item_name = df["구매자"].fillna("").astype(str) + "드림 " + df["업체상품코드"].fillna("").astype(str)
-    order_no = df["주문번호"].apply(_normalize_order)
+    order_no = normalize_order_numbers(df["주문번호"], remove_whitespace=False)
 
     output = pd.DataFrame(
         {
@@ -142,48 +176,59 @@ def build_coupang_bulk(raw_df: pd.DataFrame, cj_df: pd.DataFrame) -> pd.DataFram
     raw_df = clean_columns(raw_df)
     cj_df = clean_columns(cj_df)
 
-    raw_df = raw_df.copy()
-    cj_df = cj_df.copy()
+    if "주문번호" not in raw_df.columns:
+        raise ValueError("로우데이터에 누락된 필수 컬럼: 주문번호")
+    missing = [c for c in ("운송장번호", "집화예정일자") if c not in cj_df.columns]
+    if not {"고객주문번호", "주문번호"} & set(cj_df.columns):
+        missing.insert(0, "고객주문번호")
+    if missing:
+        raise ValueError(f"파일접수 상세내역에 누락된 필수 컬럼: {', '.join(missing)}")
 
-    raw_df["__key"] = raw_df["주문번호"].apply(_normalize_order)
+    raw_keys = normalize_order_numbers(raw_df["주문번호"], remove_whitespace=False)
     key_col = "고객주문번호" if "고객주문번호" in cj_df.columns else "주문번호"
-    cj_df["__key"] = cj_df[key_col].apply(_normalize_order)
-
-    merged = raw_df.merge(
-        cj_df[["__key", "운송장번호", "집화예정일자"]],
-        on="__key",
-        how="left",
-        suffixes=("", "_cj"),
-    )
 
-    if "운송장번호_cj" in merged:
-        merged["__운송장번호"] = merged["운송장번호_cj"].fillna(merged.get("운송장번호"))
-    else:
-        merged["__운송장번호"] = merged.get("운송장번호")
-    merged["__운송장번호"] = merged["__운송장번호"].apply(_normalize_order)
+    # 주문번호 중복 제거 (첫 번째 행만 유지)
+    # 40여 개 컬럼 전체를 잘라내지 않고, 출력에 쓰는 컬럼만 남길 행을 골라 가져옴
+    first = ~raw_keys.duplicated(keep="first").to_numpy()
+    raw_keys = raw_keys[first].reset_index(drop=True)
 
     def pick(col, default=""):
-        return merged[col] if col in merged.columns else default
+        if col not in raw_df.columns:
+            return default
+        return raw_df[col][first].reset_index(drop=True)
+
+    match = match_order_keys(raw_keys, normalize_order_numbers(cj_df[key_col], remove_whitespace=False))
+
+    invoice = match.take(cj_df["운송장번호"])
+    if "운송장번호" in raw_df.columns:
+        invoice = invoice.fillna(pick("운송장번호"))
+    invoice = normalize_order_numbers(invoice, remove_whitespace=False)
+
+    # 로우데이터에 같은 이름의 컬럼이 있으면 로우데이터 값을 우선 사용
+    if "집화예정일자" in raw_df.columns:
+        pickup_date = pick("집화예정일자")
+    else:
+        pickup_date = match.take(cj_df["집화예정일자"])
 
     output_cols = get_coupang_bulk_columns()
 
     data = {
         "번호": pick("번호"),
         "묶음배송번호": pick("묶음배송번호"),
-        "주문번호": pick("주문번호").apply(_normalize_order),
+        "주문번호": raw_keys,
         "택배사": "CJ 대한통운",
-        "운송장번호": merged["__운송장번호"],
+        "운송장번호": invoice,
         "분리배송 Y/N": pick("분리배송 Y/N"),
         "분리배송 출고예정일": pick("분리배송 출고예정일"),
         "주문시 출고예정일": pick("주문시 출고예정일"),
-        "출고일(발송일)": pick("집화예정일자"),
+        "출고일(발송일)": pickup_date,
         "주문일": pick("주문일"),
         "등록상품명": pick("등록상품명"),
         "등록옵션명": pick("등록옵션명"),
         "노출상품명(옵션명)": pick("노출상품명(옵션명)"),
         "노출상품ID": pick("노출상품ID"),
         "옵션ID": pick("옵션ID"),
-        "최초등록옵션명": pick("최초등록옵션명") if "최초등록옵션명" in merged else pick("최초등록등록상품명/옵션명"),
+        "최초등록옵션명": pick("최초등록옵션명") if "최초등록옵션명" in raw_df else pick("최초등록등록상품명/옵션명"),
         "업체상품코드": pick("업체상품코드"),
         "바코드": pick("바코드"),
         "결제액": pick("결제액"),
@@ -204,15 +249,10 @@ def build_coupang_bulk(raw_df: pd.DataFrame, cj_df: pd.DataFrame) -> pd.DataFram
         "배송완료일": pick("배송완료일"),
         "구매확정일자": pick("구매확정일자"),
         "개인통관번호(PCCC)": pick("개인통관번호(PCCC)"),
-        "통관용구매자전화번호": pick("통관용수취인전화번호") if "통관용수취인전화번호" in merged else pick("통관용구매자전화번호"),
+        "통관용구매자전화번호": pick("통관용수취인전화번호") if "통관용수취인전화번호" in raw_df else pick("통관용구매자전화번호"),
         "기타": pick("기타"),
         "결제위치": pick("결제위치"),
     }
 
-    output = pd.DataFrame(data)
-    output = output[output_cols]
-
-    # 주문번호 중복 제거 (첫 번째 행만 유지)
-    output = output.drop_duplicates(subset=['주문번호'], keep='first')
-
-    return output
+    # get_coupang_bulk_columns()에 있는 컬럼만으로 출력 DataFrame 생성
+    return pd.DataFrame({col: data[col] for col in output_cols})
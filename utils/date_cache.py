@@ -0,0 +1,116 @@
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+
+from utils.config import CONFIG_FILE
+
+
+DATE_CACHE_FILE = CONFIG_FILE.with_name("date_cache.sqlite3")
+
+# 보관 한도: 항목 수를 넘거나 오래 쓰지 않은 항목은 정리
+DATE_CACHE_MAX_ENTRIES = 50_000
+DATE_CACHE_MAX_AGE_DAYS = 180
+
+# sqlite 바인딩 변수 개수 제한을 넘지 않도록 나눠서 조회
+_QUERY_CHUNK = 500
+
+
+class DateNormalizationCache:
+    """
+    AI 날짜 정규화 결과(원본 문자열 → MM/DD)를 디스크에 보관하는 캐시.
+
+    같은 날짜 문자열("최대한 빨리", "10월 2일" 등)은 매일 반복되므로, 이미 변환한 문자열은
+    API를 호출하지 않고 재사용합니다. 항목은 프롬프트 버전별로 저장되며,
+    프롬프트나 모델이 바뀌면 이전 버전의 항목은 정리됩니다.
+    sqlite 파일을 열 수 없는 환경에서는 캐시 없이 동작합니다.
+    """
+
+    def __init__(
+        self,
+        version: str,
+        path: Path = DATE_CACHE_FILE,
+        max_entries: int = DATE_CACHE_MAX_ENTRIES,
+        max_age_days: int = DATE_CACHE_MAX_AGE_DAYS,
+    ):
+        self.version = version
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        self._ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=5)
+        if not self._ready:
+            with conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS date_cache (
+                        version TEXT NOT NULL,
+                        original TEXT NOT NULL,
+                        normalized TEXT NOT NULL,
+                        created_at REAL NOT NULL,
+                        last_used REAL NOT NULL,
+                        PRIMARY KEY (version, original)
+                    )
+                    """
+                )
+                # 프롬프트가 바뀐 이전 버전 항목 정리
+                conn.execute("DELETE FROM date_cache WHERE version != ?", (self.version,))
+            self._ready = True
+        return conn
+
+    def get_many(self, originals: list[str]) -> dict[str, str]:
+        """캐시에 있는 항목만 {원본: 변환결과}로 반환합니다."""
+        found = {}
+        try:
+            with closing(self._connect()) as conn, conn:
+                now = time.time()
+                for i in range(0, len(originals), _QUERY_CHUNK):
+                    chunk = originals[i : i + _QUERY_CHUNK]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(
+                        f"SELECT original, normalized FROM date_cache WHERE version = ? AND original IN ({placeholders})",
+                        (self.version, *chunk),
+                    ).fetchall()
+                    found.update(rows)
+                    conn.execute(
+                        f"UPDATE date_cache SET last_used = ? WHERE version = ? AND original IN ({placeholders})",
+                        (now, self.version, *chunk),
+                    )
+        except sqlite3.Error:
+            return {}
+        return found
+
+    def put_many(self, mapping: dict[str, str]) -> None:
+        """변환 결과를 저장하고 한도를 넘는 항목을 정리합니다."""
+        if not mapping:
+            return
+        now = time.time()
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO date_cache VALUES (?, ?, ?, ?, ?)",
+                    [(self.version, original, normalized, now, now) for original, normalized in mapping.items()],
+                )
+                self._prune(conn, now)
+        except sqlite3.Error:
+            pass
+
+    def _prune(self, conn: sqlite3.Connection, now: float) -> None:
+        conn.execute("DELETE FROM date_cache WHERE last_used < ?", (now - self.max_age_days * 86400,))
+        conn.execute(
+            """
+            DELETE FROM date_cache WHERE rowid IN (
+                SELECT rowid FROM date_cache ORDER BY last_used DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.max_entries,),
+        )
+
+    def clear(self) -> None:
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute("DELETE FROM date_cache")
+        except sqlite3.Error:
+            pass
@@ -1,51 +1,540 @@
+import hashlib
+import importlib.util
 import io
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from pathlib import Path
+
 import pandas as pd
-import streamlit as st
 
+from utils.perf_trace import trace_stage
+
+
+# 엑셀 읽기 엔진 우선순위: Rust 기반 calamine이 설치되어 있으면 사용, 없으면 openpyxl
+EXCEL_ENGINE_PREFERENCE = ("calamine", "openpyxl")
+_ENGINE_MODULES = {"calamine": "python_calamine", "openpyxl": "openpyxl"}
+
+# 엑셀 쓰기 엔진 우선순위: 행 단위로 바로 기록하는 xlsxwriter, 없으면 openpyxl write-only 모드
+EXCEL_WRITER_PREFERENCE = ("xlsxwriter", "openpyxl")
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# 주문번호 계열 컬럼 (엔진과 관계없이 같은 dtype이어야 매칭이 안정적)
+ORDER_NUMBER_COLUMNS = ("주문번호", "상품주문번호", "고객주문번호", "운송장번호", "묶음배송번호")
+
+# 업로드 파싱 캐시 한도 (프로세스 전체, 모든 세션 공유)
+EXCEL_CACHE_MAX_ENTRIES = 16
+EXCEL_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# 여러 파일 병렬 파싱: 파싱할 파일 크기 합이 이 값 이상일 때만 공유 프로세스 풀 사용
+# (작은 파일은 프로세스 간 전달 비용이 더 커서 순서대로 읽는 편이 빠름)
+EXCEL_PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+EXCEL_PARSE_MAX_WORKERS = 4
+
+# 파일 시그니처: 일반 xlsx는 ZIP, 암호화된 xlsx는 OLE(Compound File) 컨테이너
+OLE_SIGNATURE = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+_OLE_ENCRYPTION_INFO_ENTRY = "EncryptionInfo".encode("utf-16-le")
+
+
+class ExcelParseCache:
+    """
+    파싱된 DataFrame을 (파일 내용 해시, 비밀번호, 읽기 인자) 키로 보관하는 LRU 캐시.
+
+    Streamlit은 위젯을 누를 때마다 스크립트를 다시 실행하므로, 같은 업로드 파일을
+    매번 다시 파싱(및 복호화)하지 않도록 결과를 재사용합니다.
+    항목 수와 메모리 사용량 중 하나라도 한도를 넘으면 가장 오래 쓰지 않은 항목부터 제거합니다.
+    """
+
+    def __init__(self, max_entries: int = EXCEL_CACHE_MAX_ENTRIES, max_bytes: int = EXCEL_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[tuple, tuple[pd.DataFrame, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> pd.DataFrame | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        # 호출 측에서 수정해도 캐시 원본이 바뀌지 않도록 복사본을 반환
+        return entry[0].copy()
+
+    def put(self, key: tuple, df: pd.DataFrame) -> None:
+        size = int(df.memory_usage(deep=True).sum())
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (df.copy(), size)
+            self._bytes += size
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+            }
+
+
+_parse_cache = ExcelParseCache()
+
+
+def get_excel_cache_stats() -> dict:
+    """업로드 파싱 캐시의 적중/실패 횟수와 사용량을 반환합니다."""
+    return _parse_cache.stats()
+
+
+def clear_excel_cache() -> None:
+    """업로드 파싱 캐시를 비웁니다."""
+    _parse_cache.clear()
+
+
+def get_excel_engine(preferred: str | None = None) -> str:
+    """
+    사용할 엑셀 읽기 엔진 이름을 반환합니다.
+
+    Args:
+        preferred: 우선 사용할 엔진 이름 (설치되어 있지 않으면 무시)
+
+    Returns:
+        str: pd.read_excel의 engine 인자로 사용할 엔진 이름
+    """
+    candidates = ((preferred,) if preferred else ()) + EXCEL_ENGINE_PREFERENCE
+    for engine in candidates:
+        module = _ENGINE_MODULES.get(engine)
+        if module and importlib.util.find_spec(module) is not None:
+            return engine
+    return "openpyxl"
+
+
+def read_excel(source, engine: str | None = None, **kwargs) -> pd.DataFrame:
+    """
+    설치된 가장 빠른 엔진으로 엑셀을 읽습니다.
+    calamine으로 읽지 못한 파일은 openpyxl로 다시 시도합니다.
+
+    Args:
+        source: 파일 경로 또는 파일 객체
+        engine: 사용할 엔진 (기본값: get_excel_engine() 결과)
+        **kwargs: pd.read_excel에 전달할 추가 인자
+
+    Returns:
+        pandas.DataFrame: 엑셀 데이터
+    """
+    engine = get_excel_engine(engine)
+    try:
+        df = pd.read_excel(source, engine=engine, **kwargs)
+    except Exception:
+        if engine == "openpyxl":
+            raise
+        if hasattr(source, "seek"):
+            source.seek(0)
+        df = pd.read_excel(source, engine="openpyxl", **kwargs)
+    return _harmonize_order_columns(df)
+
+
+def _harmonize_order_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """주문번호 계열 컬럼에서 정수로 표현 가능한 실수 컬럼을 정수형으로 맞춥니다."""
+    for col in ORDER_NUMBER_COLUMNS:
+        if col not in df.columns or df[col].dtype.kind != "f":
+            continue
+        values = df[col]
+        if values.notna().all() and (values % 1 == 0).all():
+            df[col] = values.astype("int64")
+    return df
+
+
+class TemplateRegistry:
+    """
+    예제 엑셀 템플릿(output/example/...)의 파싱 결과를 프로세스 전체에서 공유하는 저장소.
+
+    파일은 처음 요청될 때 한 번만 읽고, 이후에는 수정 시각(mtime)이나 크기가 바뀐 경우에만 다시 읽습니다.
+    모듈 전역 객체이므로 모든 Streamlit 세션이 같은 결과를 사용합니다.
+    """
+
+    def __init__(self):
+        self._entries: dict[tuple, tuple[tuple[int, int], pd.DataFrame]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path, **kwargs) -> pd.DataFrame | None:
+        """템플릿을 읽어 반환합니다. 파일이 없으면 None을 반환합니다."""
+        path = Path(path)
+        key = (str(path.resolve()), repr(sorted(kwargs.items())))
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            with self._lock:
+                self._entries.pop(key, None)
+            return None
+        stamp = (stat.st_mtime_ns, stat.st_size)
 
-def read_excel_with_password(file, password=None, **kwargs):
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry[0] != stamp:
+            entry = (stamp, read_excel(path, **kwargs))
+            with self._lock:
+                self._entries[key] = entry
+        return entry[1].copy()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_template_registry = TemplateRegistry()
+
+
+def read_template(path, **kwargs) -> pd.DataFrame | None:
+    """
+    예제 템플릿 엑셀을 읽습니다. (파일이 바뀌지 않았다면 프로세스 내 캐시 사용)
+
+    Args:
+        path: 템플릿 파일 경로
+        **kwargs: read_excel에 전달할 추가 인자 (예: nrows=0)
+
+    Returns:
+        pandas.DataFrame | None: 템플릿 데이터 (파일이 없으면 None)
+    """
+    return _template_registry.get(path, **kwargs)
+
+
+def _read_file_bytes(file) -> bytes:
+    """업로드된 파일 객체 또는 파일 경로에서 원본 바이트를 읽습니다."""
+    if isinstance(file, (str, Path)):
+        return Path(file).read_bytes()
+    if hasattr(file, "getvalue"):
+        return file.getvalue()
+    file.seek(0)
+    return file.read()
+
+
+def _cache_key(content: bytes, password, kwargs: dict) -> tuple:
+    return (hashlib.sha256(content).hexdigest(), password, repr(sorted(kwargs.items())))
+
+
+def read_excel_with_password(file, password=None, use_cache=True, columns=None, **kwargs):
     """
     비밀번호로 보호된 엑셀 파일을 읽습니다.
-    자동으로 비밀번호 없이 시도한 후, 실패하면 "1111"로 시도합니다.
+    파일 시그니처로 암호화 여부를 먼저 확인하고, 암호화된 파일은 바로 복호화합니다.
+    비밀번호를 입력하지 않으면 "1111"로 시도합니다.
+    같은 내용의 파일을 같은 인자로 다시 읽으면 캐시된 결과를 반환합니다.
 
     Args:
         file: 업로드된 파일 객체 또는 파일 경로
         password: 엑셀 파일 비밀번호 (선택사항, 기본값: 자동으로 "1111" 시도)
-        **kwargs: pd.read_excel에 전달할 추가 인자 (예: header=1)
+        use_cache: 파싱 결과 캐시 사용 여부 (기본값: True)
+        columns: 읽을 컬럼 이름 목록 (앞뒤 공백 무시, 파일에 없는 컬럼은 건너뜀, 기본값: 전체)
+        **kwargs: read_excel에 전달할 추가 인자 (예: header=1, engine="openpyxl")
 
     Returns:
         pandas.DataFrame: 엑셀 데이터
     """
-    # 먼저 비밀번호 없이 시도
+    content = _read_file_bytes(file)
+
+    wanted = frozenset(str(c).strip() for c in columns) if columns is not None else None
+
+    with trace_stage("read") as stage:
+        key = None
+        if use_cache:
+            key = _cache_key(content, password, {**kwargs, "columns": sorted(wanted) if wanted is not None else None})
+            cached = _parse_cache.get(key)
+            if cached is not None:
+                stage.rows, stage.detail = len(cached), "cache"
+                return cached
+
+        df = _read_excel_job(content, password, wanted, kwargs)
+        stage.rows = len(df)
+    if key is not None:
+        _parse_cache.put(key, df)
+    return df
+
+
+_parse_pool: ProcessPoolExecutor | None = None
+_parse_pool_lock = threading.Lock()
+
+
+def _parse_workers(max_workers: int | None) -> int:
+    if max_workers:
+        return max_workers
+    # 컨테이너 등에서 사용할 수 있는 CPU만 셈
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+    return min(cpus, EXCEL_PARSE_MAX_WORKERS)
+
+
+def _get_parse_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    여러 파일 파싱에 쓰는 프로세스 풀 (처음 필요할 때 한 번 만들고 프로세스가 끝날 때까지 재사용).
+    Streamlit 서버는 여러 스레드로 동작하므로 fork 대신 spawn으로 워커를 띄웁니다.
+    """
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        return _parse_pool
+
+
+def _discard_parse_pool(pool: ProcessPoolExecutor) -> None:
+    """깨진 풀을 버려서 다음 호출에서 새로 만들도록 합니다."""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is pool:
+            _parse_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def read_excel_files(
+    files: Sequence, password=None, use_cache=True, columns=None, max_workers: int | None = None, **kwargs
+) -> list[pd.DataFrame]:
+    """
+    여러 엑셀 파일을 읽습니다. (read_excel_with_password의 여러 파일 버전)
+    캐시에 있는 파일은 바로 반환하고, 나머지가 두 개 이상이고 크기 합이 EXCEL_PARALLEL_MIN_BYTES 이상이면
+    공유 프로세스 풀에서 병렬로, 그보다 작거나 CPU가 하나뿐이면 현재 프로세스에서 순서대로 파싱합니다.
+    모든 파일에 같은 비밀번호를 사용합니다.
+
+    Args:
+        files: 업로드된 파일 객체 또는 파일 경로 목록
+        password: 엑셀 파일 비밀번호 (선택사항, 기본값: 자동으로 "1111" 시도)
+        use_cache: 파싱 결과 캐시 사용 여부 (기본값: True)
+        columns: 읽을 컬럼 이름 목록 (앞뒤 공백 무시, 파일에 없는 컬럼은 건너뜀, 기본값: 전체)
+        max_workers: 공유 프로세스 풀을 처음 만들 때의 프로세스 수 (기본값: CPU 수, 최대 EXCEL_PARSE_MAX_WORKERS)
+        **kwargs: read_excel에 전달할 추가 인자 (예: header=1)
+
+    Returns:
+        list[pandas.DataFrame]: files와 같은 순서의 엑셀 데이터
+    """
+    contents = [_read_file_bytes(file) for file in files]
+    wanted = frozenset(str(c).strip() for c in columns) if columns is not None else None
+
+    results: list[pd.DataFrame | None] = [None] * len(contents)
+    keys = [None] * len(contents)
+    if use_cache:
+        for i, content in enumerate(contents):
+            keys[i] = _cache_key(content, password, {**kwargs, "columns": sorted(wanted) if wanted is not None else None})
+            results[i] = _parse_cache.get(keys[i])
+    pending = [i for i, df in enumerate(results) if df is None]
+
+    with trace_stage("read", detail=f"파일 {len(contents)}개 (캐시 {len(contents) - len(pending)}개)") as stage:
+        parsed = None
+        workers = _parse_workers(max_workers)
+        if len(pending) > 1 and workers > 1 and sum(len(contents[i]) for i in pending) >= EXCEL_PARALLEL_MIN_BYTES:
+            pool = None
+            try:
+                pool = _get_parse_pool(workers)
+                jobs = [pool.submit(_read_excel_job, contents[i], password, wanted, kwargs) for i in pending]
+                parsed = [job.result() for job in jobs]
+            except (BrokenProcessPool, OSError, RuntimeError):
+                # 프로세스를 띄울 수 없거나 풀이 종료된 경우 현재 프로세스에서 순서대로 파싱
+                if pool is not None:
+                    _discard_parse_pool(pool)
+                parsed = None
+        if parsed is None:
+            parsed = [_read_excel_job(contents[i], password, wanted, kwargs) for i in pending]
+
+        for i, df in zip(pending, parsed):
+            results[i] = df
+            if keys[i] is not None:
+                _parse_cache.put(keys[i], df)
+        stage.rows = sum(len(df) for df in results)
+    return results
+
+
+def _read_excel_job(content: bytes, password, wanted: frozenset | None, kwargs: dict) -> pd.DataFrame:
+    """파일 하나를 파싱합니다. (프로세스 풀에서 실행할 수 있도록 모듈 최상위 함수)"""
+    if wanted is not None:
+        # 필요한 컬럼만 DataFrame으로 변환 (없는 컬럼은 각 처리 함수의 필수 컬럼 검사에서 보고됨)
+        kwargs = {**kwargs, "usecols": lambda name: str(name).strip() in wanted}
+    return _parse_excel_bytes(content, password, **kwargs)
+
+
+def is_encrypted_excel(content: bytes) -> bool:
+    """
+    파일 시그니처로 암호화 여부를 판별합니다.
+    일반 xlsx는 ZIP 컨테이너이고, 암호화된 xlsx는 EncryptionInfo 스트림을 가진 OLE 컨테이너입니다.
+
+    Args:
+        content: 엑셀 파일 원본 바이트
+
+    Returns:
+        bool: 암호화된 파일이면 True
+    """
+    if not content.startswith(OLE_SIGNATURE):
+        return False
+    return _OLE_ENCRYPTION_INFO_ENTRY in content
+
+
+def _parse_excel_bytes(content: bytes, password=None, **kwargs):
+    """원본 바이트를 DataFrame으로 파싱합니다. 암호화된 파일이면 복호화 후 파싱합니다."""
+    # 암호화되지 않은 파일은 바로 파싱 (BytesIO(bytes)는 원본 버퍼를 복사하지 않음)
+    if not is_encrypted_excel(content):
+        with trace_stage("parse") as stage:
+            df = read_excel(io.BytesIO(content), **kwargs)
+            stage.rows = len(df)
+        return df
+
+    # 암호화된 파일은 비밀번호(기본값 "1111")로 복호화 후 한 번만 파싱
     try:
-        file.seek(0)
-        return pd.read_excel(file, **kwargs)
-    except Exception:
-        # 실패하면 기본 비밀번호 "1111"로 시도
-        try:
-            import msoffcrypto
+        import msoffcrypto
 
-            file.seek(0)
-            encrypted = io.BytesIO(file.read())
-            decrypted = io.BytesIO()
+        decrypted = io.BytesIO()
 
-            # 비밀번호로 파일 복호화
-            office_file = msoffcrypto.OfficeFile(encrypted)
+        # 비밀번호로 파일 복호화
+        with trace_stage("decrypt"):
+            office_file = msoffcrypto.OfficeFile(io.BytesIO(content))
             office_file.load_key(password=password if password else "1111")
             office_file.decrypt(decrypted)
 
-            # 복호화된 파일을 pandas로 읽기
-            decrypted.seek(0)
-            return pd.read_excel(decrypted, **kwargs)
+        # 복호화된 버퍼를 그대로 pandas로 읽기
+        decrypted.seek(0)
+        with trace_stage("parse") as stage:
+            df = read_excel(decrypted, **kwargs)
+            stage.rows = len(df)
+        return df
 
-        except ImportError:
-            st.error("비밀번호 보호된 파일을 읽으려면 msoffcrypto-tool 라이브러리가 필요합니다.")
-            st.code("pip install msoffcrypto-tool", language="bash")
-            raise
-        except Exception as e:
-            st.error(f"파일을 읽는 중 오류가 발생했습니다: {str(e)}")
-            st.info("파일이 비밀번호로 보호되어 있다면 비밀번호가 '1111'인지 확인해주세요.")
-            raise
+    # 화면 출력은 호출 측(ui/*, main.py)에서 예외 메시지로 처리
+    except ImportError as e:
+        raise ImportError(
+            "비밀번호 보호된 파일을 읽으려면 msoffcrypto-tool 라이브러리가 필요합니다. (pip install msoffcrypto-tool)"
+        ) from e
+    except Exception as e:
+        raise ValueError(f"{e} (파일이 비밀번호로 보호되어 있다면 비밀번호가 '1111'인지 확인해주세요.)") from e
+
+
+def get_excel_writer_engine() -> str:
+    """사용할 엑셀 쓰기 엔진 이름을 반환합니다. (xlsxwriter가 없으면 openpyxl)"""
+    for engine in EXCEL_WRITER_PREFERENCE:
+        if importlib.util.find_spec(engine) is not None:
+            return engine
+    return "openpyxl"
+
+
+def _iter_rows(df: pd.DataFrame):
+    """DataFrame을 행 단위 파이썬 값 리스트로 순회합니다. (빈 값은 None)"""
+    columns = []
+    for i in range(df.shape[1]):
+        values = df.iloc[:, i]
+        columns.append(values.astype(object).where(values.notna(), None).tolist())
+    return zip(*columns)
+
+
+def write_excel(df: pd.DataFrame, target, sheet_name: str = "Sheet1", engine: str | None = None) -> None:
+    """
+    DataFrame을 xlsx로 기록합니다. (index 없이, 첫 행은 굵은 헤더)
+    셀 객체를 시트 전체만큼 만들지 않고 행 단위로 바로 기록하므로 큰 결과도 메모리를 적게 사용합니다.
+
+    Args:
+        df: 기록할 데이터
+        target: 파일 경로 또는 바이너리 파일 객체
+        sheet_name: 시트 이름 (기본값: "Sheet1")
+        engine: "xlsxwriter" 또는 "openpyxl" (기본값: get_excel_writer_engine() 결과)
+    """
+    with trace_stage("write", rows=len(df)):
+        _write_excel(df, target, sheet_name, engine or get_excel_writer_engine())
+
+
+def _write_excel(df: pd.DataFrame, target, sheet_name: str, engine: str) -> None:
+    header = [str(col) for col in df.columns]
+
+    if engine == "xlsxwriter":
+        import xlsxwriter
+
+        workbook = xlsxwriter.Workbook(
+            target,
+            {
+                "constant_memory": True,
+                "strings_to_formulas": False,
+                "strings_to_urls": False,
+                "default_date_format": "yyyy-mm-dd hh:mm:ss",
+            },
+        )
+        worksheet = workbook.add_worksheet(sheet_name)
+        worksheet.write_row(0, 0, header, workbook.add_format({"bold": True, "border": 1, "align": "center"}))
+        for row_idx, row in enumerate(_iter_rows(df), start=1):
+            worksheet.write_row(row_idx, 0, row)
+        workbook.close()
+        return
+
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Border, Font, Side
+
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(sheet_name)
+    thin = Side(style="thin")
+    header_cells = []
+    for name in header:
+        cell = WriteOnlyCell(worksheet, value=name)
+        cell.font = Font(bold=True)
+        cell.border = Border(left=thin, right=thin, top=thin, bottom=thin)
+        cell.alignment = Alignment(horizontal="center")
+        header_cells.append(cell)
+    worksheet.append(header_cells)
+    for row in _iter_rows(df):
+        if any(isinstance(value, str) and value.startswith("=") for value in row):
+            # xlsxwriter와 같이 "="로 시작하는 문자열도 수식이 아닌 문자열로 기록
+            row = [_text_cell(worksheet, value) if isinstance(value, str) else value for value in row]
+        worksheet.append(row)
+    workbook.save(target)
+
+
+def _text_cell(worksheet, value: str):
+    from openpyxl.cell import WriteOnlyCell
+
+    cell = WriteOnlyCell(worksheet, value=value)
+    cell.data_type = "s"
+    return cell
+
+
+def to_excel_bytes(df, sheet_name: str = "Sheet1") -> bytes:
+    """DataFrame(또는 to_pandas()를 가진 보관 객체)을 xlsx 바이트로 만듭니다."""
+    if not isinstance(df, pd.DataFrame):
+        df = df.to_pandas()
+    buf = io.BytesIO()
+    write_excel(df, buf, sheet_name=sheet_name)
+    return buf.getvalue()
+
+
+def excel_download(df, sheet_name: str = "Sheet1") -> Callable[[], bytes]:
+    """
+    st.download_button의 data 인자로 넘길 지연 생성 함수를 반환합니다.
+    xlsx 파일은 다운로드 버튼을 눌렀을 때만 만들어지며, 세션에는 바이트를 보관하지 않습니다.
+
+    Args:
+        df: 다운로드할 데이터 (DataFrame 또는 CompactFrame처럼 to_pandas()를 가진 객체)
+        sheet_name: 시트 이름 (기본값: "Sheet1")
+
+    Returns:
+        Callable[[], bytes]: 호출하면 xlsx 바이트를 반환하는 함수
+    """
+    return partial(to_excel_bytes, df, sheet_name=sheet_name)
 
 
 def render_password_input(key_prefix, label="파일 비밀번호 (선택사항)"):
@@ -59,6 +548,8 @@ def render_password_input(key_prefix, label="파일 비밀번호 (선택사항)"
     Returns:
         str: 입력된 비밀번호 (없으면 None)
     """
+    import streamlit as st
+
     with st.expander("🔒 파일에 비밀번호가 걸려있나요?"):
         password = st.text_input(
             label,
@@ -0,0 +1,52 @@
+import time
+import urllib.error
+import urllib.request
+
+
+# Streamlit 서버 준비 상태 확인 주소 (서버가 요청을 받을 수 있으면 200 "ok")
+HEALTH_PATH = "/_stcore/health"
+
+# 확인 간격: 처음에는 짧게, 이후 조금씩 늘림
+POLL_INITIAL_INTERVAL = 0.05
+POLL_MAX_INTERVAL = 0.5
+POLL_BACKOFF = 1.5
+
+
+def is_server_ready(app_url: str, timeout: float = 0.5) -> bool:
+    """Streamlit 헬스 체크 주소에 한 번 요청해 서버가 준비되었는지 확인합니다."""
+    try:
+        with urllib.request.urlopen(app_url.rstrip("/") + HEALTH_PATH, timeout=timeout) as response:
+            return response.status == 200
+    except (urllib.error.URLError, OSError):
+        return False
+
+
+def next_poll_interval(interval: float | None) -> float:
+    """다음 확인까지 기다릴 시간(초)을 반환합니다. (첫 호출은 interval=None)"""
+    if interval is None:
+        return POLL_INITIAL_INTERVAL
+    return min(interval * POLL_BACKOFF, POLL_MAX_INTERVAL)
+
+
+def wait_for_server(app_url: str, timeout: float = 60.0, process=None) -> float | None:
+    """
+    Streamlit 서버가 준비될 때까지 헬스 체크 주소를 반복해서 확인합니다.
+
+    Args:
+        app_url: 앱 주소 (예: "http://localhost:8501")
+        timeout: 최대 대기 시간(초)
+        process: 서버 subprocess.Popen 객체 (먼저 종료되면 바로 실패 처리)
+
+    Returns:
+        float | None: 준비될 때까지 걸린 시간(초), 시간 초과나 서버 종료 시 None
+    """
+    start = time.monotonic()
+    interval = None
+    while time.monotonic() - start < timeout:
+        if is_server_ready(app_url):
+            return time.monotonic() - start
+        if process is not None and process.poll() is not None:
+            return None
+        interval = next_poll_interval(interval)
+        time.sleep(interval)
+    return None
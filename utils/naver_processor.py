@@ -1,78 +1,94 @@
-import io
+import datetime as dt
+import hashlib
 import json
+import random
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable
 
+import numpy as np
 import pandas as pd
 
+from utils.date_cache import DateNormalizationCache
+from utils.excel_utils import read_template
+from utils.order_utils import match_order_keys, normalize_order_numbers
+from utils.perf_trace import traced
 
-def clean_columns(df: pd.DataFrame) -> pd.DataFrame:
-    """Strip whitespace from column names."""
-    return df.rename(columns=lambda c: str(c).strip())
 
+# 각 파이프라인이 입력 파일에서 사용하는 컬럼 (read_excel_with_password(columns=...)로 필요한 컬럼만 읽음)
+NAVER_CJ_COLUMNS = [
+    "수취인명",
+    "수취인연락처1",
+    "통합배송지",
+    "배송메세지",
+    "수량",
+    "옵션관리코드",
+    "상품주문번호",
+]
+NAVER_INTERMEDIATE_COLUMNS = NAVER_CJ_COLUMNS + ["옵션정보"]
+NAVER_BULK_RAW_COLUMNS = ["상품주문번호", "배송방법", "운송장번호", "송장번호"]
+NAVER_BULK_CJ_COLUMNS = ["고객주문번호", "주문번호", "운송장번호"]
 
-def _normalize_order(value):
-    """Normalize order number for matching - remove all spaces and convert to string."""
-    if pd.isna(value):
-        return ""
-    if isinstance(value, float):
-        return str(int(value))
-    if isinstance(value, int):
-        return str(value)
-    s = str(value).strip()
-    # Remove all whitespace characters (spaces, tabs, newlines, etc.)
-    s = "".join(s.split())
-    if s.endswith(".0") and s.replace(".", "", 1).isdigit():
-        try:
-            return str(int(float(s)))
-        except Exception:
-            return s
-    return s
+
+def clean_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Strip whitespace from column names."""
+    # rename()은 모든 컬럼 데이터를 복사하므로 얕은 복사본의 컬럼 이름만 바꿈
+    df = df.copy(deep=False)
+    df.columns = [str(c).strip() for c in df.columns]
+    return df
+
+
+# 옵션정보 키 → 중간 테이블 컬럼 (키 이름에 아래 문구가 포함되면 해당 컬럼으로 분류)
+NAVER_OPTION_FIELDS = {
+    "보내시는분": ("보내시는 분",),
+    "도착희망날짜_원본": ("도착 희망 날짜", "도착희망날짜"),
+    "과일선물옵션": ("과일 선물 옵션", "과일선물옵션"),
+    "크리스탈보자기": ("크리스탈 보자기",),
+}
+
+
+# (키 문구, 컬럼) 목록 - NAVER_OPTION_FIELDS 순서대로 먼저 포함된 문구의 컬럼으로 분류
+_OPTION_KEY_PHRASES = [(phrase, name) for name, phrases in NAVER_OPTION_FIELDS.items() for phrase in phrases]
+
+
+def _parse_option_text(text: str) -> dict:
+    result = dict.fromkeys(NAVER_OPTION_FIELDS, "")
+    for part in text.split(" / "):
+        key, sep, value = part.partition(":")
+        if not sep:
+            continue
+        for phrase, name in _OPTION_KEY_PHRASES:
+            if phrase in key:
+                result[name] = value.strip()
+                break
+    return result
 
 
 def parse_naver_option(option_str: str) -> dict:
     """Parse 옵션정보 field into structured values."""
-    result = {
-        "보내시는분": "",
-        "도착희망날짜_원본": "",
-        "과일선물옵션": "",
-        "크리스탈보자기": "",
-    }
-
     if pd.isna(option_str):
-        return result
+        return dict.fromkeys(NAVER_OPTION_FIELDS, "")
+    return _parse_option_text(str(option_str))
 
-    parts = str(option_str).split(" / ")
 
-    for part in parts:
-        if ":" in part:
-            key, value = part.split(":", 1)
-            key = key.strip()
-            value = value.strip()
-
-            if "보내시는 분" in key:
-                result["보내시는분"] = value
-            elif "도착 희망 날짜" in key or "도착희망날짜" in key:
-                result["도착희망날짜_원본"] = value
-            elif "과일 선물 옵션" in key or "과일선물옵션" in key:
-                result["과일선물옵션"] = value
-            elif "크리스탈 보자기" in key:
-                result["크리스탈보자기"] = value
+def parse_naver_options(options: pd.Series) -> pd.DataFrame:
+    """Parse a whole 옵션정보 column at once into one column per option field."""
+    # 같은 옵션 문자열은 한 번만 파싱 (빈 값은 마지막에 붙인 빈 행을 가리키도록)
+    codes, uniques = pd.factorize(options.astype(object))
+    rows = [_parse_option_text(str(value)) for value in uniques]
+    rows.append(dict.fromkeys(NAVER_OPTION_FIELDS, ""))
+    codes[codes < 0] = len(uniques)
 
+    parsed = pd.DataFrame(rows, columns=list(NAVER_OPTION_FIELDS), dtype=object)
+    result = parsed.take(codes)
+    result.index = options.index
     return result
 
 
-def normalize_dates_batch_with_ai(api_key: str, date_list: list) -> dict:
-    """Use OpenAI Responses API to normalize a batch of date strings."""
-    try:
-        from openai import OpenAI
-
-        client = OpenAI(api_key=api_key)
-
-        dates_json = json.dumps(date_list, ensure_ascii=False)
-
-        prompt = f"""
-다음 JSON 배열의 각 날짜 텍스트를 MM/DD 형식으로 변환해주세요.
+DATE_NORMALIZATION_MODEL = "gpt-4.1-nano-2025-04-14"
+DATE_NORMALIZATION_PROMPT = """
+다음 JSON 배열의 각 날짜 텍스트(text)를 MM/DD 형식으로 변환해주세요.
 날짜 정보가 불확실하다고 판단될때는 문자열 그대로 반환해주세요.
 9월 30일 또는 10월 1일 이런 날짜는 문자열 그대로 반환하시오.
 10월 8일 수요일처럼 요일정보가 있는 경우 10/8처럼 요일 정보를 제거하고 날짜만 남기시오.
@@ -85,46 +101,266 @@ def normalize_dates_batch_with_ai(api_key: str, date_list: list) -> dict:
 
 입력: {dates_json}
 
-출력은 반드시 "원본": "변환결과" 형태의 JSON 객체로만 답변하세요. 설명은 하지 마세요.
-예시: {{"9월30일": "09/30", "10/1": "10/01", "최대한 빨리": "최대한 빨리", "10월 2일": "10/2", 10월 8일 수요일 : "10/8}}
+입력의 각 항목은 {{"index": 번호, "text": 날짜 텍스트}} 입니다.
+results 배열에 입력 항목마다 {{"index": 같은 번호, "normalized": 변환결과}}를 하나씩 넣어 답변하세요.
+예시: 입력 [{{"index": 0, "text": "10월 2일"}}, {{"index": 1, "text": "최대한 빨리"}}, {{"index": 2, "text": "10월 8일 수요일"}}]
+→ {{"results": [{{"index": 0, "normalized": "10/02"}}, {{"index": 1, "normalized": "최대한 빨리"}}, {{"index": 2, "normalized": "10/08"}}]}}
 """
 
-        response = client.responses.create(
-            model="gpt-4.1-nano-2025-04-14",
+# 응답 형식: 원본 문자열을 키로 쓰지 않고 입력 번호로 돌려받음 (한글/따옴표 키 충돌·이스케이프 문제 방지)
+DATE_NORMALIZATION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "results": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "index": {"type": "integer"},
+                    "normalized": {"type": "string"},
+                },
+                "required": ["index", "normalized"],
+                "additionalProperties": False,
+            },
+        }
+    },
+    "required": ["results"],
+    "additionalProperties": False,
+}
+DATE_NORMALIZATION_TEXT_FORMAT = {
+    "format": {
+        "type": "json_schema",
+        "name": "date_normalization",
+        "schema": DATE_NORMALIZATION_SCHEMA,
+        "strict": True,
+    }
+}
+
+# 프롬프트/모델이 바뀌면 저장된 날짜 변환 캐시를 무효화하기 위한 버전
+DATE_NORMALIZATION_VERSION = hashlib.sha256(
+    (DATE_NORMALIZATION_MODEL + DATE_NORMALIZATION_PROMPT + json.dumps(DATE_NORMALIZATION_SCHEMA)).encode("utf-8")
+).hexdigest()[:16]
+
+
+# AI 없이 바로 변환할 수 있는 날짜 형식 (선택적으로 요일이 붙을 수 있음: "10월 8일 수요일", "10/8(수)")
+_WEEKDAY = r"(?:\(?\s*[월화수목금토일](?:요일)?\s*\)?)?"
+LOCAL_DATE_PATTERNS = [
+    # 10월 2일 / 26년 2월 28일 / 2025년 10월 8일 수요일
+    re.compile(
+        rf"^(?:(?P<year>\d{{2}}(?:\d{{2}})?)\s*년\s*)?(?P<month>\d{{1,2}})\s*월\s*(?P<day>\d{{1,2}})\s*일\s*{_WEEKDAY}$"
+    ),
+    # 2025-09-30 / 2025.09.30 / 2025/9/30
+    re.compile(rf"^(?P<year>\d{{4}})\s*[-./]\s*(?P<month>\d{{1,2}})\s*[-./]\s*(?P<day>\d{{1,2}})\.?\s*{_WEEKDAY}$"),
+    # 10/8 / 09/30
+    re.compile(rf"^(?P<month>\d{{1,2}})\s*/\s*(?P<day>\d{{1,2}})\s*{_WEEKDAY}$"),
+    # 10.3 / 10.3.
+    re.compile(rf"^(?P<month>\d{{1,2}})\s*\.\s*(?P<day>\d{{1,2}})\.?\s*{_WEEKDAY}$"),
+]
+# 연도가 없는 날짜는 윤년 기준으로 확인 (2월 29일 허용)
+_LOCAL_DATE_DEFAULT_YEAR = 2000
+
+
+def normalize_date_locally(text: str) -> str | None:
+    """Resolve easy date strings to MM/DD without AI, following DATE_NORMALIZATION_PROMPT's rules.
+
+    Blank strings come back as "". Returns None when the string needs the model: free text
+    ("최대한 빨리"), "A 또는 B", and dates that do not exist on the calendar ("26년 2월 30일").
+    """
+    s = str(text).strip()
+    if not s:
+        return ""
+    if "또는" in s:
+        return None
+    for pattern in LOCAL_DATE_PATTERNS:
+        match = pattern.match(s)
+        if match:
+            year = match.groupdict().get("year")
+            year = int(year) if year else _LOCAL_DATE_DEFAULT_YEAR
+            if year < 100:
+                year += 2000
+            month, day = int(match.group("month")), int(match.group("day"))
+            try:
+                dt.date(year, month, day)
+            except ValueError:
+                return None
+            return f"{month:02d}/{day:02d}"
+    return None
+
+
+# 배치는 날짜 수가 아니라 추정 토큰 수로 채움 (응답이 max_output_tokens에서 잘리지 않도록 여유를 둠)
+DATE_NORMALIZATION_MAX_OUTPUT_TOKENS = 4000
+DATE_NORMALIZATION_OUTPUT_HEADROOM = 0.75
+DATE_NORMALIZATION_MAX_INPUT_TOKENS = 8000
+# 한 배치에 넣을 최대 날짜 수, 동시에 보낼 AI 배치 요청 수와 재시도 정책
+DATE_NORMALIZATION_BATCH_SIZE = 200
+DATE_NORMALIZATION_CONCURRENCY = 4
+DATE_NORMALIZATION_MAX_RETRIES = 4
+DATE_NORMALIZATION_BACKOFF_BASE = 1.0
+DATE_NORMALIZATION_BACKOFF_MAX = 30.0
+
+
+def create_openai_client(api_key: str):
+    """Shared OpenAI client for batch requests (retries are handled by _call_with_backoff)."""
+    from openai import OpenAI
+
+    return OpenAI(api_key=api_key, max_retries=0)
+
+
+def _retry_delay(error: Exception, attempt: int) -> float | None:
+    """Seconds to wait before retrying, or None if the error is not worth retrying."""
+    import openai
+
+    if isinstance(error, openai.APIStatusError):
+        if error.status_code != 429 and error.status_code < 500:
+            return None
+        retry_after = error.response.headers.get("retry-after")
+        if retry_after:
+            try:
+                return min(float(retry_after), DATE_NORMALIZATION_BACKOFF_MAX)
+            except ValueError:
+                pass
+    elif not isinstance(error, openai.APIConnectionError):
+        return None
+
+    delay = DATE_NORMALIZATION_BACKOFF_BASE * (2**attempt)
+    return min(delay, DATE_NORMALIZATION_BACKOFF_MAX) * random.uniform(0.5, 1.0)
+
+
+def _call_with_backoff(request: Callable[[], Any], max_retries: int = DATE_NORMALIZATION_MAX_RETRIES):
+    """Run request, retrying rate-limit/server/connection errors with exponential backoff."""
+    for attempt in range(max_retries + 1):
+        try:
+            return request()
+        except Exception as e:
+            delay = _retry_delay(e, attempt) if attempt < max_retries else None
+            if delay is None:
+                raise
+            time.sleep(delay)
+
+
+def estimate_tokens(text: str) -> int:
+    """토크나이저 없이 토큰 수를 넉넉하게 추정합니다. (ASCII 약 4자당 1토큰, 한글 등은 1자당 1토큰)"""
+    ascii_count = sum(ch.isascii() for ch in text)
+    return -(-ascii_count // 4) + (len(text) - ascii_count)
+
+
+def _date_tokens(date: str) -> tuple[int, int]:
+    """날짜 하나가 요청/응답에서 차지하는 추정 토큰 수 (입력, 출력)"""
+    quoted = estimate_tokens(json.dumps(date, ensure_ascii=False))
+    # 입력은 {"index": 0, "text": "원본"}, 응답은 {"index": 0, "normalized": "MM/DD"}
+    # (날짜가 아니면 원문을 그대로 돌려주므로 응답도 원본 길이만큼 잡음)
+    return quoted + 10, quoted + 12
+
+
+def pack_date_batches(
+    dates: list,
+    max_items: int = DATE_NORMALIZATION_BATCH_SIZE,
+    max_input_tokens: int = DATE_NORMALIZATION_MAX_INPUT_TOKENS,
+    max_output_tokens: int = int(DATE_NORMALIZATION_MAX_OUTPUT_TOKENS * DATE_NORMALIZATION_OUTPUT_HEADROOM),
+) -> list[list]:
+    """
+    날짜 목록을 순서대로 추정 입력/출력 토큰 한도 안에서 최대한 크게 배치로 묶습니다.
+    긴 자유 입력 문구가 많으면 배치가 작아지고, 짧은 날짜만 있으면 max_items까지 채웁니다.
+
+    Args:
+        dates: AI로 보낼 날짜 문자열 목록
+        max_items: 배치 하나의 최대 날짜 수
+        max_input_tokens: 배치 하나의 날짜 목록 추정 입력 토큰 한도 (프롬프트 본문 제외)
+        max_output_tokens: 배치 하나의 추정 응답 토큰 한도
+
+    Returns:
+        list[list]: 배치 목록 (한도를 넘는 날짜 하나는 단독 배치)
+    """
+    batches = []
+    batch, input_tokens, output_tokens = [], 0, 0
+    for date in dates:
+        date_input, date_output = _date_tokens(str(date))
+        if batch and (
+            len(batch) >= max_items
+            or input_tokens + date_input > max_input_tokens
+            or output_tokens + date_output > max_output_tokens
+        ):
+            batches.append(batch)
+            batch, input_tokens, output_tokens = [], 0, 0
+        batch.append(date)
+        input_tokens += date_input
+        output_tokens += date_output
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+class _BatchResponseError(Exception):
+    """응답이 잘렸거나 형식에 맞지 않음 (배치를 나눠서 다시 요청하면 해결될 수 있는 오류)"""
+
+
+def _request_date_batch(client, date_list: list) -> dict:
+    """배치 하나를 JSON 스키마 응답으로 요청해 {원본: 변환결과}를 반환합니다. 잘린/거절된 응답이면 _BatchResponseError."""
+    items = [{"index": i, "text": str(date)} for i, date in enumerate(date_list)]
+    prompt = DATE_NORMALIZATION_PROMPT.format(dates_json=json.dumps(items, ensure_ascii=False))
+
+    response = _call_with_backoff(
+        lambda: client.responses.create(
+            model=DATE_NORMALIZATION_MODEL,
             input=prompt,
-            max_output_tokens=1000,
+            text=DATE_NORMALIZATION_TEXT_FORMAT,
+            max_output_tokens=DATE_NORMALIZATION_MAX_OUTPUT_TOKENS,
         )
+    )
 
-        result_text = (response.output_text or "").strip()
+    if getattr(response, "status", None) == "incomplete":
+        raise _BatchResponseError("응답 잘림 (max_output_tokens)")
 
-        if not result_text:
-            return {date: "오류: 빈 응답" for date in date_list}
+    # 스키마가 강제된 응답이므로 그대로 파싱 (빈 응답은 모델이 거절한 경우)
+    try:
+        results = json.loads(response.output_text or "")["results"]
+        indexes = [item["index"] for item in results]
+    except (ValueError, KeyError, TypeError):
+        raise _BatchResponseError(f"JSON 파싱 실패: {(response.output_text or '')[:200]}") from None
 
-        if result_text.startswith("```"):
-            parts = result_text.split("```")
-            if len(parts) >= 2:
-                result_text = parts[1]
-            result_text = result_text.replace("json", "").strip()
+    # 스키마는 항목 수를 보장하지 않으므로 입력 번호마다 정확히 하나씩 왔는지 확인
+    if len(indexes) != len(date_list) or set(indexes) != set(range(len(date_list))):
+        raise _BatchResponseError(f"결과 번호 불일치 (요청 {len(date_list)}개, 응답 {len(indexes)}개)")
+    return {date_list[item["index"]]: item["normalized"] for item in results}
 
-        json_match = re.search(r"\{.*\}", result_text, re.DOTALL)
-        if json_match:
-            result_text = json_match.group(0).strip()
-        else:
-            return {date: "오류: JSON 출력 아님" for date in date_list}
 
-        try:
-            return json.loads(result_text)
-        except Exception:
-            return {date: f"오류: JSON 파싱 실패: {result_text}" for date in date_list}
+def normalize_dates_batch_with_ai(api_key: str, date_list: list, client=None) -> dict:
+    """Use OpenAI Responses API to normalize a batch of date strings.
 
+    Responses are constrained to DATE_NORMALIZATION_SCHEMA (index-keyed results).
+    A batch whose response is still truncated or refused is split in half and retried,
+    so only the dates that still fail on their own come back as "오류: ..." values.
+    """
+    try:
+        if client is None:
+            client = create_openai_client(api_key)
     except Exception as e:
         return {date: f"오류: {str(e)}" for date in date_list}
 
+    mapping = {}
+    pending = [date_list]
+    while pending:
+        batch = pending.pop()
+        try:
+            mapping.update(_request_date_batch(client, batch))
+        except _BatchResponseError as e:
+            if len(batch) > 1:
+                half = len(batch) // 2
+                pending.extend([batch[half:], batch[:half]])
+            else:
+                mapping.update({date: f"오류: {e}" for date in batch})
+        except Exception as e:
+            mapping.update({date: f"오류: {str(e)}" for date in batch})
+    return mapping
+
 
 def create_naver_intermediate_table(df: pd.DataFrame, api_key: str | None = None) -> pd.DataFrame:
     """Build intermediate table from raw Naver export."""
-    parsed_options = df["옵션정보"].apply(parse_naver_option)
-    parsed_df = pd.DataFrame(parsed_options.tolist())
+    missing = [c for c in NAVER_INTERMEDIATE_COLUMNS if c not in df.columns]
+    if missing:
+        raise ValueError(f"누락된 필수 컬럼: {', '.join(missing)}")
+
+    parsed_df = parse_naver_options(df["옵션정보"])
 
     intermediate = pd.DataFrame(
         {
@@ -150,8 +386,22 @@ def normalize_dates_batch(
     api_key: str,
     progress_callback: Callable[[int, int], Any] | None = None,
     debug_callback: Callable[[str, Any], Any] | None = None,
+    cache: DateNormalizationCache | None = None,
+    max_workers: int | None = None,
+    client=None,
+    batch_size: int = DATE_NORMALIZATION_BATCH_SIZE,
 ) -> pd.DataFrame:
-    """Normalize arrival date values in batches using AI."""
+    """Normalize arrival date values in batches using AI.
+
+    Easy formats are resolved locally (normalize_date_locally) and strings already stored in the
+    on-disk cache are reused; only the rest are sent to the API.
+    Batches are packed by estimated tokens (pack_date_batches, at most batch_size dates each)
+    and requested concurrently (up to max_workers, default DATE_NORMALIZATION_CONCURRENCY; lower it
+    when the API rate-limits) through one shared client.
+    client can be any object with responses.create(**kwargs) returning .output_text
+    (e.g. utils.ai_replay.ReplayClient or an OpenAI client pointed at a local stub);
+    when omitted an OpenAI client is created from api_key.
+    """
     result_df = intermediate_df.copy()
 
     unique_dates = result_df["도착희망날짜_원본"].dropna().unique().tolist()
@@ -163,67 +413,109 @@ def normalize_dates_batch(
         debug_callback("info", f"📊 추출된 유니크 날짜: {len(unique_dates)}개")
         debug_callback("unique_dates", unique_dates[:10])
 
+    # 1) 규칙으로 바로 변환 가능한 값은 로컬에서 처리
     date_mapping = {}
-    batch_size = 50
-    total_batches = (len(unique_dates) + batch_size - 1) // batch_size
+    for date in unique_dates:
+        local = normalize_date_locally(date)
+        if local is not None:
+            date_mapping[date] = local
+    local_count = len(date_mapping)
+    unresolved = [d for d in unique_dates if d not in date_mapping]
 
-    for batch_idx in range(total_batches):
-        start_idx = batch_idx * batch_size
-        end_idx = min((batch_idx + 1) * batch_size, len(unique_dates))
-        batch = unique_dates[start_idx:end_idx]
-
-        if debug_callback:
-            debug_callback("batch_start", f"배치 {batch_idx + 1}/{total_batches} - {len(batch)}개 날짜 처리 중...")
-
-        batch_mapping = normalize_dates_batch_with_ai(api_key, batch)
+    if debug_callback:
+        debug_callback(
+            "local_result",
+            {"resolved": local_count, "total": len(unique_dates), "hit_rate": local_count / len(unique_dates)},
+        )
 
-        if debug_callback:
-            debug_callback("batch_result", {"batch_idx": batch_idx + 1, "mapping": batch_mapping})
+    # 2) 남은 값은 디스크 캐시에서 조회
+    if cache is None:
+        cache = DateNormalizationCache(DATE_NORMALIZATION_VERSION)
 
-        date_mapping.update(batch_mapping)
+    cached = cache.get_many(unresolved) if unresolved else {}
+    date_mapping.update(cached)
+    pending = [d for d in unresolved if d not in cached]
 
-        if progress_callback:
-            progress_callback(batch_idx + 1, total_batches)
+    if debug_callback:
+        debug_callback("info", f"💾 캐시 적중: {len(cached)}개 / AI 요청 필요: {len(pending)}개")
+
+    batches = pack_date_batches(pending, max_items=batch_size)
+    total_batches = len(batches)
+
+    if batches:
+        if client is None:
+            try:
+                client = create_openai_client(api_key)
+            except Exception:
+                # 클라이언트를 만들 수 없으면 배치별 호출에서 오류 결과를 돌려줌
+                client = None
+
+        # 배치는 동시에 요청하고, 콜백은 배치 순서대로 호출 스레드에서 실행
+        if max_workers is None:
+            max_workers = DATE_NORMALIZATION_CONCURRENCY
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, total_batches))) as executor:
+            futures = []
+            for batch_idx, batch in enumerate(batches):
+                if debug_callback:
+                    debug_callback("batch_start", f"배치 {batch_idx + 1}/{total_batches} - {len(batch)}개 날짜 처리 중...")
+                futures.append(executor.submit(normalize_dates_batch_with_ai, api_key, batch, client))
+
+            for batch_idx, (batch, future) in enumerate(zip(batches, futures)):
+                batch_mapping = future.result()
+
+                if debug_callback:
+                    debug_callback("batch_result", {"batch_idx": batch_idx + 1, "mapping": batch_mapping})
+
+                date_mapping.update(batch_mapping)
+                # 오류가 아닌 결과만 캐시에 기록 (요청하지 않은 키는 제외)
+                requested = set(batch)
+                cache.put_many(
+                    {
+                        k: v
+                        for k, v in batch_mapping.items()
+                        if k in requested and isinstance(v, str) and not v.startswith("오류")
+                    }
+                )
+
+                if progress_callback:
+                    progress_callback(batch_idx + 1, total_batches)
 
     result_df["도착희망날짜_정규화"] = result_df["도착희망날짜_원본"].map(date_mapping).fillna("")
 
     return result_df
 
 
-def _is_valid_date(date_str: str) -> bool:
-    """Check if a string is a valid MM/DD format date."""
-    if pd.isna(date_str) or not date_str:
-        return False
-    date_str = str(date_str).strip()
-    # MM/DD 또는 M/D 또는 MM/D 또는 M/DD 형식인지 확인
-    pattern = r'^\d{1,2}/\d{1,2}$'
-    return bool(re.match(pattern, date_str))
+# 정규화된 날짜(MM/DD, M/D 등) 형식
+VALID_DATE_PATTERN = re.compile(r"^(\d{1,2})/(\d{1,2})$")
 
 
-def _create_sort_key(row):
-    """Create a sort key for ordering: invalid dates first, then by date, then by option code."""
-    date_str = str(row["도착희망날짜_정규화"]).strip()
-    option_code = str(row["옵션관리코드"]).strip()
+@traced("sort")
+def _cj_sort_order(dates: pd.Series, option_codes: pd.Series) -> np.ndarray:
+    """Row positions ordered by: invalid dates first (by text), then month/day, then option code."""
+    date_str = pd.Series(dates.to_numpy(dtype=object).astype(str)).str.strip()
+    option_code = pd.Series(option_codes.to_numpy(dtype=object).astype(str)).str.strip()
 
-    # 날짜가 유효하지 않으면 (0, date_str, option_code)로 정렬 -> 가장 위로
-    if not _is_valid_date(date_str):
-        return (0, date_str, option_code)
+    month_day = date_str.str.extract(VALID_DATE_PATTERN).astype(object)
+    # pyarrow 문자열 정규식의 \d는 ASCII 숫자만 포함하므로, 못 찾은 값 중 ASCII가 아닌 값(전각 숫자 등)만 파이썬 re로 다시 확인
+    retry = month_day[0].isna() & date_str.str.contains(r"[^\x00-\x7f]")
+    if retry.any():
+        month_day.loc[retry] = date_str[retry].astype(object).str.extract(VALID_DATE_PATTERN).to_numpy()
+    valid = month_day[0].notna()
 
-    # 날짜가 유효하면 (1, 월, 일, option_code)로 정렬
-    try:
-        parts = date_str.split('/')
-        month = int(parts[0])
-        day = int(parts[1])
-        return (1, month, day, option_code)
-    except:
-        # 파싱 실패시 날짜 불분명으로 처리
-        return (0, date_str, option_code)
+    sort_df = pd.DataFrame(
+        {
+            "valid": valid,
+            "date": date_str.where(~valid, ""),
+            "month": month_day[0].fillna(0).astype("int64"),
+            "day": month_day[1].fillna(0).astype("int64"),
+            "option_code": option_code,
+        }
+    )
+    return sort_df.sort_values(["valid", "date", "month", "day", "option_code"]).index.to_numpy()
 
 
 def generate_cj_orders_by_date(intermediate_df: pd.DataFrame, defaults: dict[str, str]) -> dict:
     """Create a single CJ order file with all dates, sorted by date validity, then date, then option code."""
-    import datetime as dt
-
     # 품목명에 날짜 추가: 보내시는분 + "드림 " + 옵션관리코드 + " " + 날짜
     qty = pd.to_numeric(intermediate_df["수량"], errors="coerce").fillna(0).astype(int)
 
@@ -256,15 +548,11 @@ def generate_cj_orders_by_date(intermediate_df: pd.DataFrame, defaults: dict[str
     )
 
     # 정렬: 1) 날짜 불분명한 것 위로, 2) 날짜순, 3) 옵션관리코드순
-    cj_df['__sort_key'] = cj_df.apply(_create_sort_key, axis=1)
-    cj_df = cj_df.sort_values('__sort_key').reset_index(drop=True)
+    order = _cj_sort_order(cj_df["도착희망날짜_정규화"], cj_df["옵션관리코드"])
+    cj_df = cj_df.iloc[order].reset_index(drop=True)
 
-    # 정렬에 사용한 임시 컬럼 제거
-    cj_df = cj_df.drop(columns=['__sort_key', '도착희망날짜_정규화', '옵션관리코드'])
-
-    buf = io.BytesIO()
-    cj_df.to_excel(buf, index=False)
-    buf.seek(0)
+    # 정렬에 사용한 컬럼 제거
+    cj_df = cj_df.drop(columns=['도착희망날짜_정규화', '옵션관리코드'])
 
     # 파일명에 오늘 날짜 포함
     today = dt.datetime.now().strftime("%y%m%d")
@@ -273,7 +561,6 @@ def generate_cj_orders_by_date(intermediate_df: pd.DataFrame, defaults: dict[str
     results = {
         "single": {
             "df": cj_df,
-            "data": buf.getvalue(),
             "count": len(cj_df),
             "filename": filename
         }
@@ -288,13 +575,12 @@ def get_naver_bulk_columns() -> list[str]:
 
     example_path = Path("output/example/naver/네이버 대량등록.xlsx")
     fallback = ["상품주문번호", "배송방법", "택배사", "송장번호"]
-    if example_path.exists():
-        try:
-            cols = list(pd.read_excel(example_path, nrows=0).columns)
-            if cols:
-                return cols
-        except Exception:
-            pass
+    try:
+        template = read_template(example_path, nrows=0)
+        if template is not None and len(template.columns):
+            return list(template.columns)
+    except Exception:
+        pass
     return fallback
 
 
@@ -304,13 +590,18 @@ def build_naver_bulk(raw_df: pd.DataFrame, cj_df: pd.DataFrame) -> tuple[pd.Data
     Returns:
         tuple: (output_df, debug_info)
     """
-    raw_df = clean_columns(raw_df).copy()
-    cj_df = clean_columns(cj_df).copy()
+    raw_df = clean_columns(raw_df)
+    cj_df = clean_columns(cj_df)
+
+    if "상품주문번호" not in raw_df.columns:
+        raise ValueError("로우데이터에 누락된 필수 컬럼: 상품주문번호")
+    if not {"고객주문번호", "주문번호"} & set(cj_df.columns):
+        raise ValueError("파일접수 상세내역에 누락된 필수 컬럼: 고객주문번호")
 
     # Normalize order numbers for matching
-    raw_df["__key"] = raw_df["상품주문번호"].apply(_normalize_order)
+    raw_keys = normalize_order_numbers(raw_df["상품주문번호"])
     key_col = "고객주문번호" if "고객주문번호" in cj_df.columns else "주문번호"
-    cj_df["__key"] = cj_df[key_col].apply(_normalize_order)
+    cj_keys = normalize_order_numbers(cj_df[key_col])
 
     # Collect debug info
     debug_info = {
@@ -322,117 +613,91 @@ def build_naver_bulk(raw_df: pd.DataFrame, cj_df: pd.DataFrame) -> tuple[pd.Data
     }
 
     for i in range(min(5, len(raw_df))):
-        original = raw_df.iloc[i]["상품주문번호"]
-        normalized = raw_df.iloc[i]["__key"]
+        original = raw_df["상품주문번호"].iloc[i]
         debug_info["raw_samples"].append({
             "original": str(original),
             "type": type(original).__name__,
-            "normalized": normalized
+            "normalized": raw_keys.iloc[i]
         })
 
     for i in range(min(5, len(cj_df))):
-        original = cj_df.iloc[i][key_col]
-        normalized = cj_df.iloc[i]["__key"]
-        invoice = cj_df.iloc[i].get("운송장번호", "")
+        original = cj_df[key_col].iloc[i]
+        invoice = cj_df["운송장번호"].iloc[i] if "운송장번호" in cj_df.columns else ""
         debug_info["cj_samples"].append({
             "original": str(original),
             "type": type(original).__name__,
-            "normalized": normalized,
+            "normalized": cj_keys.iloc[i],
             "invoice": str(invoice) if pd.notna(invoice) else ""
         })
 
     # CJ 파일에 운송장번호 컬럼이 있는지 확인
     debug_info["has_invoice_col"] = "운송장번호" in cj_df.columns
 
-    # Merge - 운송장번호 컬럼이 있으면 포함, 없으면 __key만 사용
-    merge_cols = ["__key"]
-    if "운송장번호" in cj_df.columns:
-        merge_cols.append("운송장번호")
-
-    merged = raw_df.merge(
-        cj_df[merge_cols],
-        on="__key",
-        how="left",
-        suffixes=("", "_cj"),
-    )
-
-    # Debug: Check match results
-    matched_count = merged["운송장번호"].notna().sum() if "운송장번호" in merged.columns else 0
-    if "운송장번호_cj" in merged.columns:
-        matched_count = merged["운송장번호_cj"].notna().sum()
+    # CJ 키 해시 인덱스로 한 번에 매칭 (같은 키가 여러 번 있으면 첫 번째 행 사용)
+    match = match_order_keys(raw_keys, cj_keys)
 
-    debug_info["matched_count"] = matched_count
-    debug_info["total_count"] = len(merged)
+    debug_info["matched_count"] = int(match.matched.sum())
+    debug_info["total_count"] = len(raw_df)
+    debug_info["cj_duplicate_count"] = match.duplicate_count
+    debug_info["cj_duplicate_keys"] = match.duplicate_keys
 
     # Show unmatched items
-    if matched_count < len(merged):
-        unmatched_mask = merged["운송장번호_cj"].isna() if "운송장번호_cj" in merged.columns else merged["운송장번호"].isna()
-        unmatched = merged[unmatched_mask]["__key"].unique().tolist()
-        debug_info["unmatched"] = unmatched[:10]
-        debug_info["unmatched_count"] = len(unmatched)
+    if match.unmatched_count:
+        debug_info["unmatched"] = match.unmatched_keys
+        debug_info["unmatched_count"] = match.unmatched_count
+        debug_info["cj_keys_sample"] = pd.unique(cj_keys.to_numpy())[:10].tolist()
 
-        # Check if these keys exist in CJ file
-        cj_keys = set(cj_df["__key"].unique())
-        debug_info["cj_keys_sample"] = list(cj_keys)[:10]
-
-    # 송장번호 처리: CJ 파일에서 가져온 운송장번호 사용
-    if "운송장번호_cj" in merged:
-        merged["__송장"] = merged["운송장번호_cj"]
-    elif "운송장번호" in merged:
-        merged["__송장"] = merged["운송장번호"]
-    elif "송장번호" in merged:
-        merged["__송장"] = merged["송장번호"]
-    else:
-        merged["__송장"] = ""
+    # 상품주문번호 중복 제거 (첫 번째 행만 유지)
+    first = ~raw_keys.duplicated(keep="first").to_numpy()
+    match = match._replace(positions=match.positions[first])
 
-    # 송장번호 정규화 (NaN을 빈 문자열로, 숫자를 문자열로 변환)
-    merged["__송장"] = merged["__송장"].apply(_normalize_order)
+    def take_raw(col):
+        return raw_df[col][first].reset_index(drop=True)
 
     def pick(col, default=""):
         """컬럼이 없거나 값이 비어있으면 default 반환"""
-        if col not in merged.columns:
+        if col not in raw_df.columns:
             return default
         # 컬럼은 있지만 모든 값이 비어있으면 default 반환
-        col_data = merged[col].fillna("")
+        col_data = raw_df[col].fillna("")
         if col_data.astype(str).str.strip().eq("").all():
             return default
-        return merged[col]
+        return take_raw(col)
+
+    # 송장번호 처리: CJ 파일에서 가져온 운송장번호 사용
+    if "운송장번호" in cj_df.columns:
+        invoice = match.take(cj_df["운송장번호"])
+    elif "운송장번호" in raw_df.columns:
+        invoice = take_raw("운송장번호")
+    elif "송장번호" in raw_df.columns:
+        invoice = take_raw("송장번호")
+    else:
+        invoice = ""
 
     output_cols = get_naver_bulk_columns()
     data = {
-        "상품주문번호": merged["__key"],
+        "상품주문번호": raw_keys[first].reset_index(drop=True),
         "배송방법": pick("배송방법", "택배"),
         "택배사": "CJ 대한통운",  # 항상 CJ 대한통운으로 설정
-        "송장번호": merged["__송장"],
+        # 송장번호 정규화 (NaN을 빈 문자열로, 숫자를 문자열로 변환)
+        "송장번호": normalize_order_numbers(invoice) if isinstance(invoice, pd.Series) else invoice,
     }
 
     output = pd.DataFrame(data)
     output = output[output_cols]
 
-    # 상품주문번호 중복 제거 (첫 번째 행만 유지)
-    output = output.drop_duplicates(subset=['상품주문번호'], keep='first')
-
     return output, debug_info
 
 
 def build_naver_cj(df: pd.DataFrame, defaults: dict[str, str]) -> pd.DataFrame:
     """Transform Naver raw data into CJ order format."""
-    required_cols = [
-        "수취인명",
-        "수취인연락처1",
-        "통합배송지",
-        "배송메세지",
-        "수량",
-        "옵션관리코드",
-        "상품주문번호",
-    ]
-    missing = [c for c in required_cols if c not in df.columns]
+    missing = [c for c in NAVER_CJ_COLUMNS if c not in df.columns]
     if missing:
         raise ValueError(f"누락된 필수 컬럼: {', '.join(missing)}")
 
     qty = pd.to_numeric(df["수량"], errors="coerce").fillna(0).astype(int)
     item_name = "OOO드림 " + df["옵션관리코드"].fillna("").astype(str)
-    order_no = df["상품주문번호"].apply(_normalize_order)
+    order_no = normalize_order_numbers(df["상품주문번호"])
 
     output = pd.DataFrame(
         {
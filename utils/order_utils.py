@@ -0,0 +1,131 @@
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from utils.perf_trace import traced
+
+
+# str.split()/str.strip()이 공백으로 보는 문자 전체 (pyarrow 문자열 정규식의 \s는 ASCII 공백만 포함)
+_WHITESPACE = "[\t\n\x0b\x0c\r\x1c-\x1f \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]"
+
+
+@traced("normalize")
+def normalize_order_numbers(values: pd.Series, remove_whitespace: bool = True) -> pd.Series:
+    """
+    주문번호/운송장번호를 매칭용 문자열로 정규화합니다. (컬럼 단위 벡터 연산)
+
+    - 빈 값(NaN/None)은 ""
+    - 실수는 소수점 이하를 버린 정수 문자열 (1234.0 → "1234")
+    - 문자열은 앞뒤 공백 제거, "123.0" 형태는 "123"으로 변환
+
+    Args:
+        values: 주문번호 컬럼
+        remove_whitespace: 문자열 내부의 모든 공백(탭, 줄바꿈 포함)도 제거할지 여부
+
+    Returns:
+        pandas.Series: 정규화된 문자열 컬럼 (인덱스 유지)
+    """
+    values = pd.Series(values)
+    out = np.full(len(values), "", dtype=object)
+    present = values.notna().to_numpy()
+    data = values[present]
+
+    if data.dtype.kind == "f":
+        out[present] = data.to_numpy(dtype="float64").astype("int64").astype(str)
+    elif data.dtype.kind in "iu":
+        out[present] = data.to_numpy(dtype="int64").astype(str)
+    elif len(data):
+        # object 컬럼: 셀 타입별로 나눠서 처리 (엑셀에서 숫자/문자가 섞인 경우)
+        kinds = data.map(type)
+        is_float = kinds.isin([t for t in kinds.unique() if issubclass(t, float)]).to_numpy()
+        positions = np.flatnonzero(present)
+
+        if is_float.any():
+            floats = data[is_float].to_numpy(dtype="float64").astype("int64").astype(str)
+            out[positions[is_float]] = floats
+
+        if not is_float.all():
+            texts = data[~is_float].astype(str)
+            if remove_whitespace:
+                texts = texts.str.replace(f"{_WHITESPACE}+", "", regex=True)
+            else:
+                texts = texts.str.replace(f"^{_WHITESPACE}+|{_WHITESPACE}+$", "", regex=True)
+            float_like = texts.str.fullmatch(r"[0-9]*\.0").to_numpy(dtype=bool)
+            if float_like.any():
+                # "00123.0" → "123" (숫자 변환 없이 문자열로 처리해 큰 번호도 정확하게 유지)
+                digits = texts[float_like].str[:-2].str.lstrip("0")
+                texts[float_like] = digits.mask(digits == "", "0")
+            out[positions[~is_float]] = texts.to_numpy()
+
+    return pd.Series(out, index=values.index, dtype=object)
+
+
+class OrderKeyMatch(NamedTuple):
+    """match_order_keys 결과 (매칭 위치와 진단 정보)"""
+
+    positions: np.ndarray  # 각 키가 매칭된 인덱스 쪽 첫 번째 행의 위치 (매칭 안 되면 -1)
+    unmatched_keys: list  # 매칭 안 된 키 (처음 나온 순서, 최대 sample_size개)
+    unmatched_count: int  # 매칭 안 된 고유 키 개수
+    duplicate_keys: list  # 인덱스 쪽에 두 번 이상 나온 키 (최대 sample_size개)
+    duplicate_count: int  # 인덱스 쪽 중복 고유 키 개수
+
+    @property
+    def matched(self) -> np.ndarray:
+        return self.positions >= 0
+
+    def take(self, values: pd.Series) -> pd.Series:
+        """
+        인덱스 쪽 컬럼에서 매칭된 행의 값을 키 순서대로 가져옵니다. (매칭 안 된 행은 NaN)
+
+        Args:
+            values: 인덱스를 만든 DataFrame의 컬럼
+
+        Returns:
+            pandas.Series: 키와 같은 길이의 값 (0부터 시작하는 RangeIndex)
+        """
+        matched = self.matched
+        if not matched.any():
+            return pd.Series(np.nan, index=pd.RangeIndex(len(matched)), dtype=object)
+        taken = values.iloc[np.where(matched, self.positions, 0)].reset_index(drop=True)
+        return taken.where(matched)
+
+
+@traced("merge")
+def match_order_keys(keys: pd.Series, index_keys: pd.Series, sample_size: int = 10) -> OrderKeyMatch:
+    """
+    정규화된 주문번호를 다른 파일의 주문번호에 매칭합니다.
+
+    인덱스 쪽(CJ 파일접수 상세내역) 키로 해시 인덱스를 한 번 만들고 모든 키를 한 번에 조회합니다.
+    같은 키가 여러 번 나오면 DataFrame.merge 후 첫 행만 남긴 것과 같게 첫 번째 행에 매칭합니다.
+    결과 컬럼을 합치지 않고 위치만 반환하므로 필요한 컬럼만 take()로 가져오면 됩니다.
+
+    Args:
+        keys: 매칭할 키 (예: 로우데이터의 정규화된 주문번호)
+        index_keys: 인덱스를 만들 키 (예: CJ 파일의 정규화된 고객주문번호)
+        sample_size: 진단 정보에 담을 키 개수
+
+    Returns:
+        OrderKeyMatch: 매칭 위치, 매칭 안 된 키, 인덱스 쪽 중복 키
+    """
+    key_values = pd.Series(keys).to_numpy()
+    index_values = pd.Series(index_keys).to_numpy()
+
+    # 두 키 목록을 한 번에 해시해 같은 키에 같은 코드를 부여
+    codes, uniques = pd.factorize(np.concatenate([index_values, key_values]))
+    index_codes, key_codes = codes[: len(index_values)], codes[len(index_values) :]
+
+    first = ~pd.Series(index_codes).duplicated(keep="first").to_numpy()
+    first_position = np.full(len(uniques), -1, dtype=np.intp)
+    first_position[index_codes[first]] = np.flatnonzero(first)
+    positions = first_position[key_codes]
+
+    unmatched = pd.unique(key_values[positions < 0])
+    duplicates = pd.unique(index_values[~first])
+    return OrderKeyMatch(
+        positions=positions,
+        unmatched_keys=unmatched[:sample_size].tolist(),
+        unmatched_count=len(unmatched),
+        duplicate_keys=duplicates[:sample_size].tolist(),
+        duplicate_count=len(duplicates),
+    )
@@ -0,0 +1,225 @@
+import contextvars
+import datetime as dt
+import functools
+import json
+import logging
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from logging.handlers import RotatingFileHandler
+
+from utils.config import CONFIG_FILE
+
+
+PERF_LOG_FILE = CONFIG_FILE.with_name("logs") / "perf.jsonl"
+
+# 로그 파일 하나의 최대 크기와 보관할 이전 파일 수 (perf.jsonl.1, .2, ...)
+PERF_LOG_MAX_BYTES = 5 * 1024 * 1024
+PERF_LOG_BACKUP_COUNT = 3
+
+# 현재 실행 중인 작업의 Trace (없으면 trace_stage는 기록하지 않음)
+_current_trace: contextvars.ContextVar["Trace | None"] = contextvars.ContextVar("perf_trace", default=None)
+
+# tracemalloc은 프로세스 전체 설정이므로 사용 중인 작업 수를 세어 마지막 작업이 끝날 때만 끔
+_tracemalloc_lock = threading.Lock()
+_tracemalloc_users = 0
+
+
+class StageRecord:
+    """단계 하나의 측정 결과 (실행 시간, 행 수, 메모리 최대 증가량)"""
+
+    __slots__ = ("name", "seconds", "rows", "peak_bytes", "detail", "depth", "_start_bytes", "_max_peak")
+
+    def __init__(self, name: str, rows: int | None = None, detail: str = ""):
+        self.name = name
+        self.seconds = 0.0
+        self.rows = rows
+        self.peak_bytes: int | None = None
+        self.detail = detail
+        self.depth = 0  # 다른 단계 안에서 실행된 단계면 1 이상
+        self._start_bytes = 0
+        self._max_peak = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "stage": self.name,
+            "seconds": round(self.seconds, 4),
+            "rows": self.rows,
+            "peak_mb": round(self.peak_bytes / 1024 / 1024, 2) if self.peak_bytes is not None else None,
+            "detail": self.detail,
+            "depth": self.depth,
+        }
+
+
+class Trace:
+    """
+    작업 하나(예: 네이버 대량등록 실행)에서 trace_stage로 기록된 단계 목록.
+
+    collect_trace() 안에서 호출된 utils/ 함수들의 읽기/복호화/파싱/정규화/매칭/정렬/쓰기 단계가
+    순서대로 쌓입니다. 메모리 측정은 tracemalloc 기준이며 같은 시간에 실행 중인 다른 작업의 할당도 포함됩니다.
+    """
+
+    def __init__(self, job: str, memory: bool = False):
+        self.job = job
+        self.memory = memory
+        self.stages: list[StageRecord] = []
+        self._open: list[StageRecord] = []
+
+    @property
+    def total_seconds(self) -> float:
+        # 중첩된 단계는 바깥 단계 시간에 이미 포함되므로 가장 바깥 단계만 합산
+        return sum(stage.seconds for stage in self.stages if stage.depth == 0)
+
+    def to_records(self) -> list[dict]:
+        return [stage.to_dict() for stage in self.stages]
+
+
+def _start_tracemalloc() -> None:
+    global _tracemalloc_users
+    with _tracemalloc_lock:
+        if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        _tracemalloc_users += 1
+
+
+def _stop_tracemalloc() -> None:
+    global _tracemalloc_users
+    with _tracemalloc_lock:
+        _tracemalloc_users -= 1
+        if _tracemalloc_users == 0 and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+
+@contextmanager
+def collect_trace(job: str, memory: bool = False):
+    """
+    이 블록 안에서 실행되는 trace_stage 단계들을 모읍니다.
+
+    Args:
+        job: 작업 이름 (로그에 기록)
+        memory: tracemalloc으로 단계별 메모리 최대 증가량 측정 여부.
+            측정 중에는 파싱이 몇 배 느려지고 tracemalloc은 프로세스 전체 설정이라 다른 세션도 느려지므로,
+            벤치마크나 명시적인 옵션(main.py --trace-memory)에서만 켭니다.
+
+    Yields:
+        Trace: 기록된 단계 목록
+    """
+    trace = Trace(job, memory=memory)
+    token = _current_trace.set(trace)
+    if memory:
+        _start_tracemalloc()
+    try:
+        yield trace
+    finally:
+        if memory:
+            _stop_tracemalloc()
+        _current_trace.reset(token)
+
+
+@contextmanager
+def trace_stage(name: str, rows: int | None = None, detail: str = ""):
+    """
+    collect_trace() 안이면 블록의 실행 시간, 행 수, 메모리 최대 증가량을 기록합니다. (밖에서는 아무것도 하지 않음)
+    행 수는 블록 안에서 yield된 StageRecord의 rows에 넣을 수 있습니다.
+
+    Args:
+        name: 단계 이름 (read, decrypt, parse, normalize, merge, sort, write 등)
+        rows: 처리한 행 수
+        detail: 참고 문구 (예: "cache")
+    """
+    trace = _current_trace.get()
+    record = StageRecord(name, rows, detail)
+    if trace is None:
+        yield record
+        return
+
+    record.depth = len(trace._open)
+    trace.stages.append(record)
+    tracing = trace.memory and tracemalloc.is_tracing()
+    if tracing:
+        current, peak = tracemalloc.get_traced_memory()
+        # 바깥 단계의 최대값을 잃지 않도록 초기화 전에 기록
+        for outer in trace._open:
+            outer._max_peak = max(outer._max_peak, peak)
+        tracemalloc.reset_peak()
+        record._start_bytes = current
+    trace._open.append(record)
+    start = time.perf_counter()
+    try:
+        yield record
+    finally:
+        record.seconds = time.perf_counter() - start
+        trace._open.pop()
+        if tracing and tracemalloc.is_tracing():
+            _, peak = tracemalloc.get_traced_memory()
+            peak = max(peak, record._max_peak)
+            record.peak_bytes = max(peak - record._start_bytes, 0)
+            for outer in trace._open:
+                outer._max_peak = max(outer._max_peak, peak)
+
+
+def _result_rows(result) -> int | None:
+    if isinstance(result, tuple) and result:
+        result = result[0]
+    try:
+        return len(result)
+    except TypeError:
+        return None
+
+
+def traced(name: str):
+    """함수 실행을 trace_stage(name)로 기록하는 데코레이터 (행 수는 반환값 길이)"""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current_trace.get() is None:
+                return func(*args, **kwargs)
+            with trace_stage(name) as stage:
+                result = func(*args, **kwargs)
+                stage.rows = _result_rows(result)
+                return result
+
+        return wrapper
+
+    return decorator
+
+
+_perf_logger: logging.Logger | None = None
+_perf_logger_lock = threading.Lock()
+
+
+def _get_perf_logger() -> logging.Logger | None:
+    """처음 호출될 때 순환 로그 파일 핸들러를 붙인 로거를 만듭니다. (파일을 만들 수 없으면 None)"""
+    global _perf_logger
+    with _perf_logger_lock:
+        if _perf_logger is None:
+            try:
+                PERF_LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+                handler = RotatingFileHandler(
+                    PERF_LOG_FILE, maxBytes=PERF_LOG_MAX_BYTES, backupCount=PERF_LOG_BACKUP_COUNT, encoding="utf-8"
+                )
+            except OSError:
+                return None
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger = logging.getLogger("storeauto.perf")
+            logger.propagate = False
+            logger.setLevel(logging.INFO)
+            logger.addHandler(handler)
+            _perf_logger = logger
+        return _perf_logger
+
+
+def write_trace_log(trace: Trace) -> None:
+    """Trace를 JSONL 한 줄로 로그 파일(logs/perf.jsonl, 크기 초과 시 순환)에 기록합니다."""
+    logger = _get_perf_logger()
+    if logger is None:
+        return
+    entry = {
+        "time": dt.datetime.now().isoformat(timespec="seconds"),
+        "job": trace.job,
+        "total_seconds": round(trace.total_seconds, 4),
+        "stages": trace.to_records(),
+    }
+    logger.info(json.dumps(entry, ensure_ascii=False))
@@ -0,0 +1,93 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+
+# 고유값 비율이 이 값 이하인 문자열 컬럼은 사전(categorical) 인코딩 (보내는분, 운임구분, 택배사 등)
+DICTIONARY_MAX_RATIO = 0.5
+
+# 화면 미리보기용으로 DataFrame 그대로 보관하는 행 수
+RESULT_PREVIEW_ROWS = 20
+
+# Arrow IPC 압축 코덱 (pyarrow 빌드에 따라 없을 수 있음)
+_IPC_COMPRESSION = "zstd" if pa.Codec.is_available("zstd") else None
+
+
+class CompactFrame:
+    """
+    작업 결과 DataFrame을 세션에 작게 보관하기 위한 컨테이너.
+
+    결과는 반복 값이 많은 문자열 컬럼을 사전 인코딩한 뒤 압축된 Arrow IPC 바이트로 한 번만 보관하고,
+    화면 미리보기에 쓰는 앞부분만 DataFrame으로 유지합니다.
+    전체 DataFrame은 다운로드 파일을 만들 때만 to_pandas()로 복원합니다.
+    Arrow로 변환할 수 없는 컬럼(숫자/문자 혼합 등)이 있으면 원본 DataFrame을 그대로 보관합니다.
+    """
+
+    def __init__(self, df: pd.DataFrame, preview_rows: int = RESULT_PREVIEW_ROWS):
+        self.columns = list(df.columns)
+        self.num_rows = len(df)
+        self.preview = df.head(preview_rows).copy()
+        self._blob: pa.Buffer | None = None
+        self._schema: pa.Schema | None = None
+        self._frame: pd.DataFrame | None = None
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            self._frame = df
+            return
+        self._schema = table.schema
+        self._blob = _write_ipc(_dictionary_encode(table))
+
+    @property
+    def nbytes(self) -> int:
+        """보관 중인 결과의 대략적인 메모리 사용량 (미리보기 포함)"""
+        preview = int(self.preview.memory_usage(deep=True).sum())
+        if self._frame is not None:
+            return preview + int(self._frame.memory_usage(deep=True).sum())
+        return preview + self._blob.size
+
+    def to_pandas(self) -> pd.DataFrame:
+        """보관된 결과를 원래 컬럼 타입의 DataFrame으로 복원합니다."""
+        if self._frame is not None:
+            return self._frame.copy()
+        with pa.ipc.open_stream(self._blob) as reader:
+            table = reader.read_all()
+        return table.cast(self._schema).to_pandas()
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+
+def _dictionary_encode(table: pa.Table) -> pa.Table:
+    """반복 값이 많은 문자열 컬럼을 사전 인코딩합니다."""
+    if table.num_rows == 0:
+        return table
+    for i, field in enumerate(table.schema):
+        if not (pa.types.is_string(field.type) or pa.types.is_large_string(field.type)):
+            continue
+        column = table.column(i)
+        if pc.count_distinct(column).as_py() <= table.num_rows * DICTIONARY_MAX_RATIO:
+            table = table.set_column(i, field.name, pc.dictionary_encode(column))
+    return table
+
+
+def _write_ipc(table: pa.Table) -> pa.Buffer:
+    sink = pa.BufferOutputStream()
+    options = pa.ipc.IpcWriteOptions(compression=_IPC_COMPRESSION)
+    with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+def compact_result(df: pd.DataFrame, **meta) -> dict:
+    """
+    세션에 보관할 작업 결과를 만듭니다.
+
+    Args:
+        df: 결과 DataFrame
+        **meta: 함께 보관할 값 (파일명, 매칭 건수 등)
+
+    Returns:
+        dict: {"frame": CompactFrame, **meta}
+    """
+    return {"frame": CompactFrame(df), **meta}
@@ -0,0 +1,127 @@
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from utils.config import get_session_memory_budget_mb
+
+
+# 메모리 정리로 삭제된 항목을 기억하는 개수 (닫힌 탭의 표시가 계속 쌓이지 않도록 제한)
+EVICTED_MARKERS_MAX = 1024
+
+EVICTED_MESSAGE = (
+    "⌛ 오랫동안 사용하지 않아 서버 메모리 정리로 이전 작업 데이터가 삭제되었습니다. "
+    "파일을 다시 업로드하고 작업을 실행해 주세요."
+)
+
+
+def estimate_nbytes(value) -> int:
+    """보관할 객체의 대략적인 메모리 사용량(바이트)을 계산합니다."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(estimate_nbytes(v) for v in value.values())
+    nbytes = getattr(value, "nbytes", None)
+    return int(nbytes) if isinstance(nbytes, int) else 0
+
+
+class SessionObjectStore:
+    """
+    세션별 큰 작업 데이터(업로드 원본, 중간 테이블, 작업 결과)를 프로세스 전체에서 관리하는 저장소.
+
+    서버는 LAN/ngrok으로 여러 사람이 함께 쓰고, 닫힌 브라우저 탭의 세션 데이터는 스스로 정리되지 않습니다.
+    모든 세션의 항목 크기 합이 한도를 넘으면 가장 오래 쓰지 않은 항목부터 제거하고,
+    제거된 항목은 표시해 두어 화면에서 "다시 업로드" 안내를 할 수 있게 합니다.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._entries: OrderedDict[tuple[str, str], tuple[object, int]] = OrderedDict()
+        self._evicted: OrderedDict[tuple[str, str], None] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def put(self, session_id: str, key: str, value) -> None:
+        size = estimate_nbytes(value)
+        item = (session_id, key)
+        with self._lock:
+            old = self._entries.pop(item, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._evicted.pop(item, None)
+            self._entries[item] = (value, size)
+            self._bytes += size
+            # 방금 넣은 항목은 남겨 두고 오래 쓰지 않은 항목부터 제거
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                evicted_item, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+                self._evicted[evicted_item] = None
+                if len(self._evicted) > EVICTED_MARKERS_MAX:
+                    self._evicted.popitem(last=False)
+
+    def get(self, session_id: str, key: str):
+        item = (session_id, key)
+        with self._lock:
+            entry = self._entries.get(item)
+            if entry is None:
+                return None
+            self._entries.move_to_end(item)
+            return entry[0]
+
+    def was_evicted(self, session_id: str, key: str) -> bool:
+        with self._lock:
+            return (session_id, key) in self._evicted
+
+    def discard(self, session_id: str, key: str) -> None:
+        item = (session_id, key)
+        with self._lock:
+            old = self._entries.pop(item, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._evicted.pop(item, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "sessions": len({session_id for session_id, _ in self._entries}),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+            }
+
+
+_session_store = SessionObjectStore(get_session_memory_budget_mb() * 1024 * 1024)
+
+
+def _session_id() -> str:
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return ctx.session_id if ctx is not None else "default"
+
+
+def get_session_object(key: str):
+    """현재 세션에 보관된 작업 데이터를 반환합니다. (없거나 정리되었으면 None)"""
+    return _session_store.get(_session_id(), key)
+
+
+def set_session_object(key: str, value) -> None:
+    """현재 세션의 작업 데이터를 보관합니다. None이면 삭제합니다."""
+    if value is None:
+        _session_store.discard(_session_id(), key)
+    else:
+        _session_store.put(_session_id(), key, value)
+
+
+def session_object_evicted(key: str) -> bool:
+    """현재 세션의 작업 데이터가 메모리 한도 때문에 정리되었는지 확인합니다."""
+    return _session_store.was_evicted(_session_id(), key)
+
+
+def get_session_store_stats() -> dict:
+    """전체 세션 데이터의 항목 수, 사용량, 정리 횟수를 반환합니다."""
+    return _session_store.stats()